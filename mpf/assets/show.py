@@ -1,5 +1,4 @@
 """Contains show related classes."""
-from functools import partial
 
 from mpf.core.assets import Asset, AssetPool
 from mpf.core.file_manager import FileManager
@@ -76,6 +75,17 @@ class Show(Asset):
         """Load a show from disk."""
         self._do_load_show(None)
 
+    def read_file(self):
+        """Read and parse the show file in a loader thread."""
+        if self.file:
+            return self.load_show_from_disk()
+
+        return None
+
+    def load_in_steps(self, data):
+        """Validate the show and yield after every step."""
+        return self._load_show_steps(data)
+
     def _get_duration(self, data, step_num, total_step_time):
         total_steps_num = len(data)
         step = data[step_num]
@@ -103,6 +113,10 @@ class Show(Asset):
             return Util.string_to_secs(step['duration'])
 
     def _do_load_show(self, data):
+        for _ in self._load_show_steps(data):
+            pass
+
+    def _load_show_steps(self, data):
         # do not use machine or the logger here because it will block
         self.show_steps = list()
 
@@ -161,6 +175,7 @@ class Show(Asset):
             self._process_step_actions(step, actions)
 
             self.show_steps.append(actions)
+            yield
 
         # Count how many total steps are in the show. We need this later
         # so we can know when we're at the end of a show
@@ -435,7 +450,6 @@ class RunningShow(object):
                            update=events_when_updated,
                            complete=events_when_completed)
 
-        self._delay_handler = None
         self.next_step_index = None
         self.current_step_index = None
 
@@ -498,8 +512,7 @@ class RunningShow(object):
         if self.sync_ms:
             delay_secs = (self.sync_ms / 1000.0) - (self.next_step_time % (self.sync_ms / 1000.0))
             self.next_step_time += delay_secs
-            self._delay_handler = self.machine.clock.schedule_once(
-                partial(self._run_next_step, post_events='play'), delay_secs)
+            self.machine.show_controller.schedule_show_step(self, self.next_step_time, post_events='play')
         else:  # run now
             self._run_next_step(post_events='play')
 
@@ -574,9 +587,7 @@ class RunningShow(object):
         self._post_events('stop')
 
     def _remove_delay_handler(self):
-        if self._delay_handler:
-            self.machine.clock.unschedule(self._delay_handler)
-            self._delay_handler = None
+        self.machine.show_controller.unschedule_show_step(self)
 
     def pause(self):
         """Pause show."""
@@ -626,6 +637,10 @@ class RunningShow(object):
         if self._show_loaded:
             self._run_next_step(post_events='step_back')
 
+    def run_scheduled_step(self, post_events=None) -> None:
+        """Run the next step when scheduled by the show controller."""
+        self._run_next_step(post_events=post_events)
+
     def _run_next_step(self, post_events=None) -> None:
         """Run the next show step."""
         if post_events:
@@ -678,5 +693,4 @@ class RunningShow(object):
         time_to_next_step = self.show_steps[self.current_step_index]['duration'] / self.speed
         if not self.manual_advance and time_to_next_step > 0:
             self.next_step_time += time_to_next_step
-            self._delay_handler = self.machine.clock.schedule_once(self._run_next_step,
-                                                                   self.next_step_time - self.machine.clock.get_time())
+            self.machine.show_controller.schedule_show_step(self, self.next_step_time)
@@ -0,0 +1,6 @@
+"""Reproducible performance benchmarks which run without hardware.
+
+Scenarios live in :mod:`mpf.benchmarks.scenarios` and are executed by
+:class:`mpf.benchmarks.benchmark.BenchmarkRunner` on the time travel loop
+which is also used in the unit tests. Use ``mpf benchmark`` to run them.
+"""
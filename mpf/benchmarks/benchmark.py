@@ -0,0 +1,418 @@
+"""Harness which runs benchmark scenarios on the time travel loop."""
+import asyncio
+import gc
+import logging
+import math
+import os
+import platform as python_platform
+import sys
+import tempfile
+import tracemalloc
+from logging.handlers import QueueHandler, QueueListener
+from queue import Queue
+from time import perf_counter
+
+from ruamel import yaml
+
+import mpf.core
+from mpf._version import version
+from mpf.core.file_manager import FileManager
+from mpf.tests.MpfTestCase import TestMachineController
+from mpf.tests.loop import TimeTravelLoop, TestClock
+
+try:
+    import resource
+except ImportError:     # pragma: no cover
+    # not available on Windows
+    resource = None
+
+MYPY = False
+if MYPY:   # pragma: no cover
+    from typing import Any, Dict, List, Optional, Type
+
+
+class Benchmark(object):
+
+    """Base class for a benchmark scenario.
+
+    A scenario generates its own machine config so results only depend on the
+    MPF version under test. ``run_iteration`` is called once per measured
+    iteration and the clock is advanced by ``time_per_iteration`` seconds
+    afterwards.
+    """
+
+    name = None                             # type: str
+    description = ""
+    platforms = ("virtual", "smart_virtual")
+    iterations = 1000
+    time_per_iteration = 0.01
+    use_bcp = False
+
+    def __init__(self, runner: "BenchmarkRunner", machine: TestMachineController) -> None:
+        """Initialise scenario."""
+        self.runner = runner
+        self.machine = machine
+
+    @classmethod
+    def get_config(cls) -> dict:
+        """Return the machine config for this scenario."""
+        return dict()
+
+    @classmethod
+    def get_modes(cls) -> dict:
+        """Return a dict which maps mode names to their mode config."""
+        return dict()
+
+    def setup(self) -> None:
+        """Prepare the machine before the measurement starts."""
+        pass
+
+    def run_iteration(self, iteration: int) -> None:
+        """Run one iteration of the scenario."""
+        raise NotImplementedError()
+
+    def get_metrics(self) -> dict:
+        """Return additional metrics of the timing pass."""
+        return dict()
+
+
+class BenchmarkRunner(object):
+
+    """Runs benchmark scenarios and collects metrics.
+
+    Every run boots a fresh machine with a generated config on a
+    ``TimeTravelLoop``. Timing and allocation metrics are collected in
+    separate passes because tracemalloc slows down the interpreter.
+
+    ``log_level`` sets the file logging of all controllers to none, basic or
+    full. Log records are written through a queue to the null device the
+    same way ``mpf game`` writes its log file.
+    """
+
+    def __init__(self, mpf_path: str = None, allocation_iterations: int = 100, log_level: str = "none") -> None:
+        """Initialise benchmark runner."""
+        if not mpf_path:
+            mpf_path = os.path.abspath(os.path.join(mpf.core.__path__[0], os.pardir))
+        self.mpf_path = mpf_path
+        self.allocation_iterations = allocation_iterations
+        self.log_level = log_level
+        self.loop = None            # type: TimeTravelLoop
+        self.clock = None           # type: TestClock
+        self.machine = None         # type: TestMachineController
+        self._exception = None      # type: Optional[dict]
+        self._dispatch_times = []   # type: List[float]
+
+    def _exception_handler(self, loop, context):
+        try:
+            loop.stop()
+        except RuntimeError:
+            pass
+
+        self._exception = context
+
+    def _raise_exception(self, e):
+        if self._exception and "exception" in self._exception:
+            raise self._exception['exception']
+        elif self._exception:
+            raise Exception(self._exception, e)
+        raise e
+
+    def get_options(self, platform: str, use_bcp: bool) -> dict:
+        """Return machine options for a run."""
+        return {
+            'force_platform': platform,
+            'mpfconfigfile': os.path.join(self.mpf_path, "mpfconfig.yaml"),
+            'configfile': ["config.yaml"],
+            'debug': False,
+            'bcp': use_bcp,
+            'no_load_cache': True,
+            'create_config_cache': False,
+            'text_ui': False,
+        }
+
+    def advance_time_and_run(self, delta: float = 1.0) -> None:
+        """Advance the test clock and run everything scheduled until then."""
+        try:
+            self.loop.run_until_complete(asyncio.sleep(delay=delta, loop=self.loop))
+        except RuntimeError as e:
+            self._raise_exception(e)
+
+    @staticmethod
+    def _write_config(file_name: str, config: dict) -> None:
+        os.makedirs(os.path.dirname(file_name), exist_ok=True)
+        with open(file_name, 'w', encoding='utf8') as output_file:
+            output_file.write("#config_version=5\n")
+            output_file.write(yaml.dump(config, default_flow_style=False))
+
+    def _create_machine_folder(self, scenario: "Type[Benchmark]", machine_path: str) -> None:
+        config = scenario.get_config()
+        modes = scenario.get_modes()
+        if modes:
+            config['modes'] = sorted(modes)
+
+        self._write_config(os.path.join(machine_path, "config", "config.yaml"), config)
+        for mode_name, mode_config in modes.items():
+            self._write_config(os.path.join(machine_path, "modes", mode_name, "config", mode_name + ".yaml"),
+                               mode_config)
+
+    # pylint: disable-msg=no-self-use
+    def _create_loop(self) -> asyncio.AbstractEventLoop:
+        """Return the loop for the next machine."""
+        return TimeTravelLoop()
+
+    def _start_machine(self, scenario: "Type[Benchmark]", platform: str, machine_path: str) -> None:
+        config_patches = {'mpf': {'plugins': []}, 'bcp': []}    # type: Dict[str, Any]
+        if scenario.use_bcp:
+            config_patches['bcp'] = {"connections": {"local_display": {
+                "type": "mpf.tests.MpfBcpTestCase.MockBcpClient"}}, "servers": []}
+        loggers = FileManager.load(os.path.join(self.mpf_path, "mpfconfig.yaml"))['logging']['file']
+        config_patches['logging'] = {
+            'console': {name: "none" for name in loggers},
+            'file': {name: self.log_level for name in loggers}}
+        config_defaults = {'playfields': {'playfield': {'tags': 'default', 'default_source_device': None}}}
+
+        self._exception = None
+        self.loop = self._create_loop()
+        self.loop.set_exception_handler(self._exception_handler)
+        self.clock = TestClock(self.loop)
+
+        self.machine = TestMachineController(
+            self.mpf_path, machine_path, self.get_options(platform, scenario.use_bcp), config_patches,
+            config_defaults, self.clock, dict(), False)
+
+        try:
+            self.loop.run_until_complete(self.machine.initialise())
+        except RuntimeError as e:
+            try:
+                self.machine.stop()
+            # pylint: disable-msg=broad-except
+            except Exception:
+                pass
+            self._raise_exception(e)
+
+        self.machine.events.process_event_queue()
+        self.advance_time_and_run(1)
+
+    def _start_logging(self) -> "Optional[QueueListener]":
+        """Log to the null device through a queue like mpf game does."""
+        root_logger = logging.getLogger()
+        if self.log_level == "none":
+            root_logger.setLevel(99)
+            return None
+
+        file_log = logging.FileHandler(os.devnull)
+        file_log.setFormatter(logging.Formatter('%(asctime)s : %(levelname)s : %(name)s : %(message)s'))
+        log_queue = Queue()     # type: Queue
+        listener = QueueListener(log_queue, file_log)
+        listener.start()
+        root_logger.addHandler(QueueHandler(log_queue))
+        root_logger.setLevel(logging.DEBUG if self.log_level == "full" else 11)
+        return listener
+
+    @staticmethod
+    def _stop_logging(listener: "Optional[QueueListener]") -> None:
+        if not listener:
+            return
+        root_logger = logging.getLogger()
+        for handler in root_logger.handlers[:]:
+            if isinstance(handler, QueueHandler):
+                root_logger.removeHandler(handler)
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
+
+    def _stop_machine(self) -> None:
+        if self.machine:
+            self.machine._do_stop()
+        self.machine = None
+
+    def _instrument_events(self) -> None:
+        """Time every event dispatch by wrapping _run_handlers of this machine."""
+        run_handlers = self.machine.events._run_handlers
+        dispatch_times = self._dispatch_times
+
+        def _timed_run_handlers(event, ev_type, kwargs):
+            start = perf_counter()
+            result = run_handlers(event, ev_type, kwargs)
+            dispatch_times.append(perf_counter() - start)
+            return result
+
+        self.machine.events._run_handlers = _timed_run_handlers
+
+    @staticmethod
+    def summarize(samples: "List[float]", scale: float = 1000) -> dict:
+        """Return mean, p50, p99 and max of samples (in seconds) in ms.
+
+        Use scale=1 for samples which are not durations.
+        """
+        if not samples:
+            return {"mean": 0.0, "p50": 0.0, "p99": 0.0, "max": 0.0}
+
+        samples = sorted(samples)
+        count = len(samples)
+        return {
+            "mean": round(sum(samples) / count * scale, 6),
+            "p50": round(samples[int(math.ceil(count * 0.5)) - 1] * scale, 6),
+            "p99": round(samples[int(math.ceil(count * 0.99)) - 1] * scale, 6),
+            "max": round(samples[-1] * scale, 6),
+        }
+
+    @staticmethod
+    def get_peak_rss_kb() -> "Optional[int]":
+        """Return peak resident set size of this process in kB."""
+        if not resource:
+            return None
+
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        if sys.platform == "darwin":
+            # macOS reports bytes
+            peak //= 1024
+        return peak
+
+    def _measure(self, scenario: Benchmark, iterations: int) -> dict:
+        del self._dispatch_times[:]
+        latencies = []
+        gc.collect()
+
+        start = perf_counter()
+        for iteration in range(iterations):
+            iteration_start = perf_counter()
+            scenario.run_iteration(iteration)
+            self.advance_time_and_run(scenario.time_per_iteration)
+            latencies.append(perf_counter() - iteration_start)
+        duration = perf_counter() - start
+
+        events = len(self._dispatch_times)
+        return {
+            "iterations": iterations,
+            "duration_s": round(duration, 6),
+            "events": events,
+            "events_per_sec": round(events / duration, 2) if duration else 0.0,
+            "handler_latency_ms": self.summarize(self._dispatch_times),
+            "iteration_latency_ms": self.summarize(latencies),
+        }
+
+    def _measure_allocations(self, scenario: Benchmark, first_iteration: int, iterations: int) -> dict:
+        # remove the timing wrapper so it does not show up in the allocations
+        del self.machine.events._run_handlers
+        gc.collect()
+        blocks_before = sys.getallocatedblocks()
+        tracemalloc.start()
+        try:
+            for iteration in range(first_iteration, first_iteration + iterations):
+                scenario.run_iteration(iteration)
+                self.advance_time_and_run(scenario.time_per_iteration)
+            current, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        gc.collect()
+
+        return {
+            "iterations": iterations,
+            "net_blocks": sys.getallocatedblocks() - blocks_before,
+            "net_kb": round(current / 1024, 3),
+            "peak_kb": round(peak / 1024, 3),
+        }
+
+    def run(self, scenario: "Type[Benchmark]", platform: str, iterations: int = None) -> dict:
+        """Run one scenario on one platform and return its metrics."""
+        if not iterations:
+            iterations = scenario.iterations
+
+        log_listener = self._start_logging()
+        with tempfile.TemporaryDirectory(prefix="mpf-benchmark-") as machine_path:
+            self._create_machine_folder(scenario, machine_path)
+
+            boot_start = perf_counter()
+            self._start_machine(scenario, platform, machine_path)
+            boot_time = perf_counter() - boot_start
+
+            try:
+                instance = scenario(self, self.machine)
+                instance.setup()
+                self.advance_time_and_run(1)
+                self._instrument_events()
+
+                result = self._measure(instance, iterations)
+                result.update(instance.get_metrics())
+                if self.allocation_iterations:
+                    result["allocations"] = self._measure_allocations(
+                        instance, iterations, min(iterations, self.allocation_iterations))
+            finally:
+                self._stop_machine()
+                self._stop_logging(log_listener)
+
+        result["log_level"] = self.log_level
+        result["boot_time_ms"] = round(boot_time * 1000, 3)
+        result["peak_rss_kb"] = self.get_peak_rss_kb()
+        return result
+
+
+def get_environment() -> dict:
+    """Return information about the environment which produced the results."""
+    return {
+        "mpf_version": version,
+        "python": python_platform.python_version(),
+        "implementation": python_platform.python_implementation(),
+        "platform": python_platform.platform(),
+    }
+
+
+def run_benchmark(scenario_name: str, platform: str, iterations: int = None,
+                  allocation_iterations: int = 100, log_level: str = "none") -> dict:
+    """Run a single scenario by name.
+
+    This is a module level function so it can be executed in a fresh worker
+    process. That way peak RSS is measured per run.
+    """
+    # imported here to prevent a circular import
+    from mpf.benchmarks.scenarios import SCENARIOS
+
+    runner = BenchmarkRunner(allocation_iterations=allocation_iterations, log_level=log_level)
+    return runner.run(SCENARIOS[scenario_name], platform, iterations)
+
+
+def compare_results(old: dict, new: dict) -> "List[dict]":
+    """Compare two benchmark reports.
+
+    Returns a list of rows with the relative change for every metric which is
+    present in both reports. Positive ``change`` always means slower or
+    bigger, i.e. worse.
+    """
+    metrics = (
+        ("events_per_sec", lambda r: r.get("events_per_sec"), True),
+        ("handler_latency_mean_ms", lambda r: r.get("handler_latency_ms", {}).get("mean"), False),
+        ("handler_latency_p99_ms", lambda r: r.get("handler_latency_ms", {}).get("p99"), False),
+        ("iteration_latency_p99_ms", lambda r: r.get("iteration_latency_ms", {}).get("p99"), False),
+        ("switch_latency_p99_ms", lambda r: r.get("switch_latency_ms", {}).get("p99"), False),
+        ("show_step_p99_ms", lambda r: r.get("show_step_ms", {}).get("p99"), False),
+        ("mode_start_p99_ms", lambda r: r.get("mode_start_ms", {}).get("p99"), False),
+        ("mode_stop_p99_ms", lambda r: r.get("mode_stop_ms", {}).get("p99"), False),
+        ("alloc_peak_kb", lambda r: r.get("allocations", {}).get("peak_kb"), False),
+        ("peak_rss_kb", lambda r: r.get("peak_rss_kb"), False),
+    )
+
+    rows = []
+    for scenario, platforms in sorted(new.get("results", {}).items()):
+        for platform, new_result in sorted(platforms.items()):
+            old_result = old.get("results", {}).get(scenario, {}).get(platform)
+            if not old_result:
+                continue
+            for metric, getter, higher_is_better in metrics:
+                old_value = getter(old_result)
+                new_value = getter(new_result)
+                if not old_value or new_value is None:
+                    continue
+                change = (new_value - old_value) / old_value
+                if higher_is_better:
+                    change = -change
+                rows.append({
+                    "scenario": scenario,
+                    "platform": platform,
+                    "metric": metric,
+                    "old": old_value,
+                    "new": new_value,
+                    "change": round(change, 4),
+                })
+
+    return rows
@@ -0,0 +1,232 @@
+"""Microbenchmarks of hot data structures.
+
+Unlike the scenarios these do not boot a machine. Every microbenchmark
+compares the current implementation with a reference (usually the previous
+implementation) on realistic inputs and reports nanoseconds per operation.
+"""
+import timeit
+from copy import deepcopy
+
+from mpf.core.case_insensitive_dict import CaseInsensitiveDict
+from mpf.core.device_monitor import DeviceMonitor
+from mpf.core.utility_functions import Util
+
+MYPY = False
+if MYPY:   # pragma: no cover
+    from typing import Callable, Dict, List
+
+
+class LegacyCaseInsensitiveDict(dict):
+
+    """The CaseInsensitiveDict of MPF 0.50 which lowercases keys on every access."""
+
+    @staticmethod
+    def lower(key):
+        """Lowercase the key."""
+        return key.lower() if isinstance(key, str) else key
+
+    def __getitem__(self, key):
+        """Return item for key."""
+        return super().__getitem__(self.__class__.lower(key))
+
+    def __setitem__(self, key, value):
+        """Set item for key to value."""
+        super().__setitem__(self.__class__.lower(key), value)
+
+    def __contains__(self, key):
+        """Check if dict contains a key."""
+        return super().__contains__(self.__class__.lower(key))
+
+    def get(self, key, *args, **kwargs):
+        """Return item for key."""
+        return super().get(self.__class__.lower(key), *args, **kwargs)
+
+
+def legacy_dict_merge(a, b, combine_lists=True):
+    """Util.dict_merge of MPF 0.50 which deep copies a on every level."""
+    if not isinstance(b, dict):
+        return b
+    result = deepcopy(a)
+    for k, v in b.items():
+        if isinstance(v, dict) and '_overwrite' in v:
+            result[k] = v
+            del result[k]['_overwrite']
+        elif isinstance(v, dict) and '_delete' in v:
+            if k in result:
+                del result[k]
+        elif k in result and isinstance(result[k], dict):
+            result[k] = legacy_dict_merge(result[k], v)
+        elif k in result and isinstance(result[k], list):
+            if v[0] == dict(_overwrite=True):
+                result[k] = v[1:]
+            elif combine_lists:
+                result[k].extend(v)
+            else:
+                result[k] = deepcopy(v)
+        else:
+            result[k] = deepcopy(v)
+    return result
+
+
+def _get_case_insensitive_keys() -> "List[str]":
+    """Return keys like the ones MPF looks up in its CaseInsensitiveDicts."""
+    keys = []
+    for number in range(64):
+        # switch names and switch handler keys
+        keys.append("s_Switch_{}".format(number))
+        keys.append("s_switch_{}-1".format(number))
+        keys.append("s_switch_{}-0".format(number))
+    for number in range(200):
+        # light and device names
+        keys.append("l_Insert_{}".format(number))
+    # player vars
+    keys.extend(["score", "Ball", "number", "extra_balls", "bonus_multiplier", "ramps_made", "Loops"])
+    return keys
+
+
+def _time(function: "Callable[[], None]", operations: int, repeat: int) -> float:
+    """Return the best time per operation in ns."""
+    best = min(timeit.repeat(function, number=1, repeat=repeat))
+    return round(best / operations * 1e9, 2)
+
+
+def benchmark_case_insensitive_dict(repeat: int = 5) -> dict:
+    """Compare lookups in CaseInsensitiveDict with the legacy implementation."""
+    keys = _get_case_insensitive_keys()
+    missing = [key + "_missing" for key in keys[:100]]
+    results = {}
+    for name, cls in (("legacy", LegacyCaseInsensitiveDict), ("current", CaseInsensitiveDict)):
+        mapping = cls()
+        for key in keys:
+            mapping[key] = key
+
+        def _lookups(mapping=mapping):
+            for _ in range(20):
+                for key in keys:
+                    mapping[key]                # pylint: disable-msg=pointless-statement
+                    key in mapping              # pylint: disable-msg=pointless-statement
+                    mapping.get(key)
+                for key in missing:
+                    key in mapping              # pylint: disable-msg=pointless-statement
+
+        results[name] = _time(_lookups, 20 * (3 * len(keys) + len(missing)), repeat)
+
+    return {
+        "ns_per_op": results,
+        "speedup": round(results["legacy"] / results["current"], 2) if results["current"] else 0.0,
+    }
+
+
+def _get_merge_configs(entries: int = 10000, files: int = 20) -> "List[dict]":
+    """Return a base config with entries leaf values and files small configs merged on top.
+
+    This resembles mpfconfig.yaml followed by the machine config includes.
+    """
+    sections = 100
+    base = {}
+    for section in range(sections):
+        base["section_{}".format(section)] = {
+            "device_{}".format(device): {"number": device, "tags": ["a", "b"], "debug": False}
+            for device in range(entries // sections // 3)}
+
+    configs = [base]
+    for number in range(files):
+        section = "section_{}".format(number * 5 % sections)
+        configs.append({
+            section: {
+                "device_1": {"debug": True, "tags": ["c"]},
+                "device_new_{}".format(number): {"number": number},
+                "device_2": {"_delete": True},
+            },
+            "file_{}".format(number): {"value": number},
+        })
+    return configs
+
+
+def benchmark_dict_merge(repeat: int = 5) -> dict:
+    """Compare merging configs like MachineController._load_config_from_files does."""
+    configs = _get_merge_configs()
+    results = {}
+    for name, merge in (("legacy", legacy_dict_merge), ("current", Util.dict_merge)):
+        def _merge(merge=merge):
+            config = {}
+            for file_config in configs:
+                config = merge(config, file_config)
+
+        results[name] = _time(_merge, len(configs), repeat)
+
+    return {
+        "ns_per_op": results,
+        "speedup": round(results["legacy"] / results["current"], 2) if results["current"] else 0.0,
+    }
+
+
+class _PlainDevice:
+
+    """A device without monitored attributes like MPF 0.50 read them."""
+
+    def __init__(self, machine):
+        """Initialise device."""
+        self.machine = machine
+        self.state = 0
+
+
+@DeviceMonitor("state")
+class _MonitoredDevice(_PlainDevice):
+
+    """A device with a monitored attribute."""
+
+
+class _DeviceManagerStub:
+
+    """Accepts the registration of monitored devices."""
+
+    def register_monitorable_device(self, device):
+        """Ignore device."""
+
+
+class _MachineStub:
+
+    """Provides the device manager to monitored devices."""
+
+    def __init__(self):
+        """Initialise stub."""
+        self.device_manager = _DeviceManagerStub()
+
+
+def benchmark_monitored_attribute_read(repeat: int = 5) -> dict:
+    """Compare reads of a monitored attribute with reads of a plain attribute.
+
+    Both should cost the same because reads do not call into the descriptor.
+    """
+    operations = 100000
+    results = {}
+    for name, cls in (("legacy", _PlainDevice), ("current", _MonitoredDevice)):
+        device = cls(_MachineStub())
+
+        def _reads(device=device):
+            for _ in range(operations // 10):
+                device.state        # pylint: disable-msg=pointless-statement
+                device.state        # pylint: disable-msg=pointless-statement
+                device.state        # pylint: disable-msg=pointless-statement
+                device.state        # pylint: disable-msg=pointless-statement
+                device.state        # pylint: disable-msg=pointless-statement
+                device.state        # pylint: disable-msg=pointless-statement
+                device.state        # pylint: disable-msg=pointless-statement
+                device.state        # pylint: disable-msg=pointless-statement
+                device.state        # pylint: disable-msg=pointless-statement
+                device.state        # pylint: disable-msg=pointless-statement
+
+        results[name] = _time(_reads, operations, repeat)
+
+    return {
+        "ns_per_op": results,
+        "speedup": round(results["legacy"] / results["current"], 2) if results["current"] else 0.0,
+    }
+
+
+MICRO_BENCHMARKS = {
+    "case_insensitive_dict": benchmark_case_insensitive_dict,
+    "dict_merge": benchmark_dict_merge,
+    "monitored_attribute_read": benchmark_monitored_attribute_read,
+}   # type: Dict[str, Callable[..., dict]]
@@ -0,0 +1,139 @@
+"""Replays switch journals recorded by the switch_journal plugin."""
+import asyncio
+import heapq
+from time import perf_counter
+
+from mpf.benchmarks.benchmark import Benchmark, BenchmarkRunner
+from mpf.plugins.switch_journal import read_switch_journal
+
+MYPY = False
+if MYPY:   # pragma: no cover
+    from typing import List
+
+
+class SwitchJournalReplayer(BenchmarkRunner):
+
+    """Feeds switch journals into a machine and reports how it keeps up.
+
+    The machine boots from its own config. By default the time travel loop
+    jumps to the time of every record, so a long game replays in seconds and
+    every run is deterministic. With ``real_time`` records are fed at their
+    recorded time divided by ``speed``, and records which are applied more
+    than ``divergence_ms`` late are reported as timing divergences.
+
+    A record which does not change its switch means the machine diverged from
+    the recorded game, for instance because a coil fired differently. These
+    records are skipped and counted as state divergences.
+    """
+
+    # number of the worst timing divergences in the report
+    MAX_DIVERGENCES = 20
+
+    def __init__(self, config_files: "List[str]", real_time: bool = False, speed: float = 1.0,
+                 divergence_ms: float = 10.0, log_level: str = "none") -> None:
+        """Initialise replayer."""
+        super().__init__(allocation_iterations=0, log_level=log_level)
+        self.config_files = config_files
+        self.real_time = real_time
+        self.speed = speed
+        self.divergence_ms = divergence_ms
+
+    def _create_loop(self) -> asyncio.AbstractEventLoop:
+        if self.real_time:
+            return asyncio.new_event_loop()
+
+        return super()._create_loop()
+
+    def get_options(self, platform: str, use_bcp: bool) -> dict:
+        """Return machine options with the config files of the machine."""
+        options = super().get_options(platform, use_bcp)
+        options['configfile'] = self.config_files
+        return options
+
+    def replay(self, machine_path: str, journal_files: "List[str]", platform: str = "virtual") -> dict:
+        """Boot the machine, replay all journal files in order and return the report."""
+        log_listener = self._start_logging()
+        try:
+            self._start_machine(Benchmark, platform, machine_path)
+            try:
+                return self._replay(journal_files)
+            finally:
+                self._stop_machine()
+        finally:
+            self._stop_logging(log_listener)
+
+    def _sync_states(self, switches, states) -> None:
+        """Set all switches to the states at the start of a journal file."""
+        for switch, state in zip(switches, states):
+            if switch is not None and switch.state != state:
+                self.machine.switch_controller.process_switch_obj(switch, state, True)
+
+    # pylint: disable-msg=too-many-locals
+    def _replay(self, journal_files: "List[str]") -> dict:
+        lags = []               # type: List[float]
+        switch_times = []       # type: List[float]
+        divergences = []
+        records = unknown = state_divergences = 0
+        first_clock = None
+        journal_time = 0.0
+
+        wall_start = perf_counter()
+        start = self.loop.time()
+        for filename in journal_files:
+            header, file_records = read_switch_journal(filename)
+            switches = [self.machine.switches[name] if name in self.machine.switches else None
+                        for name in header["switches"]]
+
+            if first_clock is None:
+                first_clock = header["clock"]
+            elif header["clock"] - first_clock < journal_time:
+                # file of a later boot. append it to the previous file
+                first_clock = header["clock"] - journal_time
+            file_start = header["clock"] - first_clock
+
+            self._sync_states(switches, header["states"])
+
+            for offset, index, state in file_records:
+                records += 1
+                switch = switches[index]
+                if switch is None:
+                    unknown += 1
+                    continue
+
+                journal_time = file_start + offset
+                target = start + journal_time / self.speed
+                delay = target - self.loop.time()
+                if delay > 0:
+                    self.advance_time_and_run(delay)
+
+                lag = self.loop.time() - target
+                lags.append(lag)
+                if lag * 1000 > self.divergence_ms:
+                    divergences.append((lag, journal_time, switch.name, state))
+
+                if switch.state == state:
+                    state_divergences += 1
+                    continue
+
+                switch_start = perf_counter()
+                self.machine.switch_controller.process_switch_obj(switch, state, True)
+                switch_times.append(perf_counter() - switch_start)
+
+        # the replay ends with the last record. then run everything it triggered
+        wall_time = perf_counter() - wall_start
+        self.advance_time_and_run(1)
+
+        return {
+            "records": records,
+            "unknown_switches": unknown,
+            "state_divergences": state_divergences,
+            "timing_divergences": len(divergences),
+            "worst_divergences": [
+                {"lag_ms": round(lag * 1000, 3), "time_s": round(time_s, 6), "switch": name, "state": state}
+                for lag, time_s, name, state in heapq.nlargest(self.MAX_DIVERGENCES, divergences)],
+            "journal_s": round(journal_time, 6),
+            "wall_s": round(wall_time, 6),
+            "speedup": round(journal_time / wall_time, 2) if wall_time else 0.0,
+            "lag_ms": self.summarize(lags),
+            "switch_latency_ms": self.summarize(switch_times),
+        }
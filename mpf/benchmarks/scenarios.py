@@ -0,0 +1,326 @@
+"""Benchmark scenarios."""
+from time import perf_counter
+
+from mpf.benchmarks.benchmark import Benchmark
+
+MYPY = False
+if MYPY:   # pragma: no cover
+    from typing import Dict, Type
+
+
+class SwitchStorm(Benchmark):
+
+    """Hit and release many switches which all have handlers attached."""
+
+    name = "switch_storm"
+    description = "64 switches with handlers and event_player entries toggled every iteration"
+    switch_count = 64
+
+    @classmethod
+    def get_config(cls):
+        """Return config with many switches."""
+        switches = {}
+        event_player = {}
+        for number in range(cls.switch_count):
+            name = "s_storm_{}".format(number)
+            switches[name] = {"number": None, "tags": "storm"}
+            event_player["{}_active".format(name)] = "storm_hit"
+        return {
+            "switches": switches,
+            "event_player": event_player,
+        }
+
+    def setup(self):
+        """Add switch handlers."""
+        self.hits = 0
+        self.switch_times = []
+        self._switch_start = 0.0
+        self.switches = [self.machine.switches["s_storm_{}".format(number)]
+                         for number in range(self.switch_count)]
+        for switch in self.switches:
+            self.machine.switch_controller.add_switch_handler(switch.name, self._switch_hit)
+            self.machine.switch_controller.add_switch_handler(switch.name, self._switch_hit, state=0)
+        self.machine.events.add_handler("storm_hit", self._hit)
+
+    def _hit(self, **kwargs):
+        del kwargs
+        self.hits += 1
+
+    def _switch_hit(self):
+        # time from the switch change until its first handler runs
+        self.switch_times.append(perf_counter() - self._switch_start)
+        self.hits += 1
+
+    def run_iteration(self, iteration):
+        """Toggle all switches."""
+        del iteration
+        for switch in self.switches:
+            self._switch_start = perf_counter()
+            self.machine.switch_controller.process_switch_obj(switch, 1, True)
+            self._switch_start = perf_counter()
+            self.machine.switch_controller.process_switch_obj(switch, 0, True)
+
+    def get_metrics(self):
+        """Return switch to handler latency."""
+        return {"switch_latency_ms": self.runner.summarize(self.switch_times)}
+
+
+class Multiball(Benchmark):
+
+    """Play games with a six ball multiball on the smart_virtual platform."""
+
+    name = "multiball"
+    description = "6 ball multiball with ball drains and game restarts (smart_virtual only)"
+    # balls only move on the smart_virtual platform
+    platforms = ("smart_virtual", )
+    iterations = 500
+    time_per_iteration = 0.5
+
+    @classmethod
+    def get_config(cls):
+        """Return config with a trough, a launcher and a multiball."""
+        trough_switches = ["s_trough{}".format(number) for number in range(6)]
+        switches = {name: {"number": None} for name in trough_switches}
+        switches["s_start"] = {"number": None, "tags": "start"}
+        switches["s_launcher"] = {"number": None}
+        for number in range(8):
+            switches["s_target{}".format(number)] = {"number": None, "tags": "playfield_active"}
+        return {
+            "game": {"balls_per_game": 1},
+            "switches": switches,
+            "coils": {
+                "c_trough_eject": {"number": None},
+                "c_launcher": {"number": None},
+            },
+            "virtual_platform_start_active_switches": ", ".join(trough_switches),
+            "playfields": {"playfield": {"default_source_device": "bd_launcher", "tags": "default"}},
+            "ball_devices": {
+                "bd_trough": {
+                    "eject_coil": "c_trough_eject",
+                    "ball_switches": ", ".join(trough_switches),
+                    "eject_targets": "bd_launcher",
+                    "tags": "trough, drain, home",
+                },
+                "bd_launcher": {
+                    "eject_coil": "c_launcher",
+                    "ball_switches": "s_launcher",
+                    "eject_timeouts": "2s",
+                },
+            },
+            "multiballs": {
+                "mb_bench": {
+                    "ball_count": 6,
+                    "ball_count_type": "total",
+                    "shoot_again": 0,
+                    "start_events": "bench_mb_start",
+                },
+            },
+        }
+
+    def setup(self):
+        """Remember devices."""
+        self.trough = self.machine.ball_devices["bd_trough"]
+        self.targets = [self.machine.switches["s_target{}".format(number)] for number in range(8)]
+
+    def run_iteration(self, iteration):
+        """Start a game or multiball, hit a target or drain a ball."""
+        if not self.machine.game:
+            self.machine.switch_controller.process_switch("s_start", 1, True)
+            self.machine.switch_controller.process_switch("s_start", 0, True)
+            return
+
+        target = self.targets[iteration % len(self.targets)]
+        self.machine.switch_controller.process_switch_obj(target, 1, True)
+        self.machine.switch_controller.process_switch_obj(target, 0, True)
+
+        if iteration % 10 == 0:
+            self.machine.events.post("bench_mb_start")
+        elif iteration % 4 == 0 and self.machine.playfield.balls > 0 and self.trough.balls < 6:
+            self.machine.default_platform.add_ball_to_device(self.trough)
+
+
+class AttractShow(Benchmark):
+
+    """Run a looping show on 500 RGB LEDs."""
+
+    name = "attract_show"
+    description = "looping attract show on 500 LEDs which steps every 100ms"
+    led_count = 500
+    iterations = 500
+    time_per_iteration = 0.05
+
+    @classmethod
+    def get_config(cls):
+        """Return config with many LEDs and an attract show."""
+        lights = {}
+        for number in range(cls.led_count):
+            lights["l_attract_{}".format(number)] = {
+                "subtype": "led",
+                "tags": "attract, attract_{}".format(number % 2),
+            }
+
+        return {
+            "lights": lights,
+            "shows": {
+                "bench_attract": [
+                    {"duration": "100ms", "lights": {"attract_0": "red", "attract_1": "blue"}},
+                    {"duration": "100ms", "lights": {"attract_0": "blue", "attract_1": "red"}},
+                    {"duration": "100ms", "lights": {"attract": "off"}},
+                    {"duration": "100ms", "lights": {"attract": "white"}},
+                ],
+            },
+            "show_player": {
+                "init_done": {"bench_attract": {"loops": -1}},
+            },
+        }
+
+    def setup(self):
+        """Time every step of the attract show."""
+        self.step_times = []
+        for show in self.machine.show_controller.get_running_shows("bench_attract"):
+            show._run_next_step = self._timed_step(show._run_next_step)
+
+    def _timed_step(self, run_next_step):
+        step_times = self.step_times
+
+        def _run_next_step(post_events=None):
+            start = perf_counter()
+            run_next_step(post_events)
+            step_times.append(perf_counter() - start)
+
+        return _run_next_step
+
+    def run_iteration(self, iteration):
+        """Let the show run."""
+        if not iteration:
+            # the show already ran while the machine settled
+            del self.step_times[:]
+
+    def get_metrics(self):
+        """Return the number and duration of show steps.
+
+        Shows do not post events so their steps are timed instead.
+        """
+        return {
+            "show_steps": len(self.step_times),
+            "show_step_ms": self.runner.summarize(self.step_times),
+        }
+
+
+class ModeChurn(Benchmark):
+
+    """Start and stop modes which use show, light and event players."""
+
+    name = "mode_churn"
+    description = "20 modes with show_player, light_player and 50 event_player entries started and stopped"
+    mode_count = 20
+    player_entries = 50
+
+    @classmethod
+    def get_config(cls):
+        """Return config with lights and a show used by the modes."""
+        lights = {}
+        for number in range(cls.mode_count):
+            lights["l_churn_{}".format(number)] = {"subtype": "led", "tags": "churn"}
+        return {
+            "lights": lights,
+            "shows": {
+                "bench_churn": [
+                    {"duration": "50ms", "lights": {"(lights)": "red"}},
+                    {"duration": "50ms", "lights": {"(lights)": "off"}},
+                ],
+            },
+        }
+
+    @classmethod
+    def get_modes(cls):
+        """Return modes which use config players."""
+        modes = {}
+        for number in range(cls.mode_count):
+            name = "bench_mode_{}".format(number)
+            event_player = {"mode_{}_started".format(name): "churn_started", "churn_started": "churn_ack"}
+            for entry in range(cls.player_entries):
+                event_player["churn_{}_{}".format(number, entry)] = "churn_ack"
+            modes[name] = {
+                "mode": {
+                    "priority": 100 + number,
+                    "start_events": "start_{}".format(name),
+                    "stop_events": "stop_{}".format(name),
+                    "game_mode": False,
+                },
+                "show_player": {
+                    "mode_{}_started".format(name): {
+                        "bench_churn": {"loops": -1, "show_tokens": {"lights": "churn"}}},
+                },
+                "light_player": {
+                    "mode_{}_started".format(name): {"l_churn_{}".format(number): "green"},
+                },
+                "event_player": event_player,
+            }
+        return modes
+
+    def setup(self):
+        """Reset mode start and stop times."""
+        self.start_times = []
+        self.stop_times = []
+
+    def run_iteration(self, iteration):
+        """Start or stop one mode and time it until its queue events are processed."""
+        mode = self.machine.modes["bench_mode_{}".format(iteration % self.mode_count)]
+        start = perf_counter()
+        if mode.active:
+            mode.stop()
+            self.machine.events.process_event_queue()
+            self.stop_times.append(perf_counter() - start)
+        else:
+            mode.start()
+            self.machine.events.process_event_queue()
+            self.start_times.append(perf_counter() - start)
+
+    def get_metrics(self):
+        """Return mode start and stop times."""
+        return {
+            "mode_start_ms": self.runner.summarize(self.start_times),
+            "mode_stop_ms": self.runner.summarize(self.stop_times),
+        }
+
+
+class BcpFlood(Benchmark):
+
+    """Flood MPF with BCP trigger messages which are echoed back."""
+
+    name = "bcp_flood"
+    description = "50 BCP triggers per iteration with a registered trigger echoing back"
+    use_bcp = True
+    messages_per_iteration = 50
+
+    @classmethod
+    def get_config(cls):
+        """Return config which turns incoming triggers into outgoing ones."""
+        return {
+            "event_player": {
+                "bench_bcp": "bench_bcp_echo",
+            },
+        }
+
+    def setup(self):
+        """Register the echo trigger."""
+        self.client = self.machine.bcp.transport.get_named_client("local_display")
+        self.client.receive_queue.put_nowait(("register_trigger", {"event": "bench_bcp_echo"}))
+
+    def run_iteration(self, iteration):
+        """Push messages into the client."""
+        for number in range(self.messages_per_iteration):
+            self.client.receive_queue.put_nowait(("trigger", {"name": "bench_bcp", "number": number,
+                                                              "iteration": iteration}))
+        # drop outgoing messages so the mock does not grow
+        del self.client.send_queue[:]
+
+
+SCENARIOS = {scenario.name: scenario for scenario in (
+    SwitchStorm,
+    Multiball,
+    AttractShow,
+    ModeChurn,
+    BcpFlood,
+)}    # type: Dict[str, Type[Benchmark]]
@@ -0,0 +1,286 @@
+"""Simulates complete games against a machine config without hardware."""
+import bisect
+import random
+from time import perf_counter
+
+from mpf.benchmarks.benchmark import Benchmark, BenchmarkRunner
+
+MYPY = False
+if MYPY:   # pragma: no cover
+    from typing import Dict, List, Optional, Tuple
+    from mpf.devices.ball_device.ball_device import BallDevice
+    from mpf.devices.playfield import Playfield
+    from mpf.devices.switch import Switch
+
+
+class SwitchModel(object):
+
+    """Stochastic model of the balls on the playfield.
+
+    Every ``tick`` seconds each ball drains with a probability of
+    ``drain_rate * tick`` or hits a shot with a probability of
+    ``shot_rate * tick``. The shot is chosen by the weights in ``shots``
+    which maps switch names to relative probabilities.
+    """
+
+    def __init__(self, shots: "Optional[Dict[str, float]]" = None, shot_rate: float = 1.0,
+                 drain_rate: float = 0.05, tick: float = 0.1) -> None:
+        """Initialise switch model."""
+        self.shots = shots
+        self.shot_rate = shot_rate
+        self.drain_rate = drain_rate
+        self.tick = tick
+
+    def get_shots(self, machine) -> "Dict[str, float]":
+        """Return shot weights. Default is one for every switch tagged playfield_active."""
+        if self.shots:
+            return self.shots
+
+        return {switch.name: 1.0 for switch in machine.switches.items_tagged("playfield_active")}
+
+
+class GameSimulator(BenchmarkRunner):
+
+    """Plays complete games on a machine and measures them.
+
+    The machine boots from its own config on the time travel loop, so games
+    run much faster than real time. Balls only move on the ``smart_virtual``
+    platform. Games start via switches tagged ``start`` and balls drain into
+    the ball device tagged ``drain`` of the playfield. Games which do not end
+    within ``max_game_time`` seconds are ended and counted as timeouts.
+    """
+
+    def __init__(self, config_files: "List[str]", model: SwitchModel, seed: int = 0,
+                 max_game_time: float = 600.0, log_level: str = "none") -> None:
+        """Initialise simulator."""
+        super().__init__(allocation_iterations=0, log_level=log_level)
+        self.config_files = config_files
+        self.model = model
+        self.random = random.Random(seed)
+        self.max_game_time = max_game_time
+        self._shot_switches = []        # type: List[Switch]
+        self._shot_weights = []         # type: List[float]
+        self._switch_times = []         # type: List[float]
+        self._drain_devices = {}        # type: Dict[Playfield, Optional[BallDevice]]
+        self._pending_drains = {}       # type: Dict[Playfield, int]
+        self._game_running = False
+
+    def get_options(self, platform: str, use_bcp: bool) -> dict:
+        """Return machine options with the config files of the machine."""
+        options = super().get_options(platform, use_bcp)
+        options['configfile'] = self.config_files
+        return options
+
+    def simulate(self, machine_path: str, games: int, platform: str = "smart_virtual") -> dict:
+        """Boot the machine, play games and return the raw samples.
+
+        Use ``merge_simulations`` to turn the samples of one or more
+        simulators into a report.
+        """
+        log_listener = self._start_logging()
+        try:
+            self._start_machine(Benchmark, platform, machine_path)
+            try:
+                return self._simulate(games)
+            finally:
+                self._stop_machine()
+        finally:
+            self._stop_logging(log_listener)
+
+    def _setup(self):
+        shots = self.model.get_shots(self.machine)
+        if not shots:
+            raise AssertionError("No shots to simulate. Tag playfield switches with playfield_active or "
+                                 "pass shots explicitly.")
+        self._shot_switches = [self.machine.switches[name] for name in sorted(shots)]
+        total = 0.0
+        for name in sorted(shots):
+            total += shots[name]
+            self._shot_weights.append(total)
+
+        for playfield in self.machine.playfields:
+            self._pending_drains[playfield] = 0
+            self.machine.events.add_handler('balldevice_captured_from_' + playfield.name, self._ball_captured,
+                                            playfield=playfield)
+            self._drain_devices[playfield] = self._get_drain_device(playfield)
+
+        self.machine.events.add_handler('game_started', self._game_started)
+        self.machine.events.add_handler('game_ended', self._game_ended)
+
+        self._add_balls()
+        self._instrument_events()
+
+    def _get_drain_device(self, playfield) -> "Optional[BallDevice]":
+        devices = [device for device in self.machine.ball_devices
+                   if not device.is_playfield() and device.config['captures_from'] == playfield]
+        for tag in ("drain", "trough"):
+            for device in devices:
+                if tag in device.tags:
+                    return device
+
+        return None
+
+    def _add_balls(self):
+        """Fill all troughs like tools/afl_fuzz.py does."""
+        for device in self.machine.ball_devices.items_tagged("trough"):
+            for switch in device.config['ball_switches']:
+                if not switch.state:
+                    self.machine.switch_controller.process_switch_obj(switch, 1, True)
+
+        # let balls settle
+        self.advance_time_and_run(10)
+
+    def _ball_captured(self, playfield, balls, **kwargs):
+        del kwargs
+        self._pending_drains[playfield] = max(0, self._pending_drains[playfield] - balls)
+
+    def _game_started(self, **kwargs):
+        del kwargs
+        self._game_running = True
+
+    def _game_ended(self, **kwargs):
+        del kwargs
+        self._game_running = False
+
+    def _hit_shot(self):
+        index = bisect.bisect_right(self._shot_weights, self.random.random() * self._shot_weights[-1])
+        switch = self._shot_switches[min(index, len(self._shot_switches) - 1)]
+        start = perf_counter()
+        self.machine.switch_controller.process_switch_obj(switch, 1, True)
+        self.machine.switch_controller.process_switch_obj(switch, 0, True)
+        self._switch_times.append(perf_counter() - start)
+
+    def _drain(self, playfield) -> bool:
+        """Drain one ball of playfield if its drain device has room for it."""
+        device = self._drain_devices[playfield]
+        if not device or all(switch.state for switch in device.config['ball_switches']):
+            return False
+
+        self._pending_drains[playfield] += 1
+        self.machine.default_platform.add_ball_to_device(device)
+        return True
+
+    def _start_game(self) -> bool:
+        for switch in self.machine.switches.items_tagged("start"):
+            self.machine.switch_controller.process_switch_obj(switch, 1, True)
+            self.machine.switch_controller.process_switch_obj(switch, 0, True)
+
+        for _ in range(100):
+            if self._game_running:
+                return True
+            self.advance_time_and_run(self.model.tick)
+
+        return False
+
+    def _play(self) -> "Tuple[int, int]":
+        """Play until the game ended or timed out and return shots and drains."""
+        shots = drains = 0
+        drain_probability = self.model.drain_rate * self.model.tick
+        shot_probability = self.model.shot_rate * self.model.tick
+        start = self.loop.time()
+        while self._game_running and self.loop.time() - start < self.max_game_time:
+            self.advance_time_and_run(self.model.tick)
+            for playfield, pending in list(self._pending_drains.items()):
+                for _ in range(playfield.balls - pending):
+                    value = self.random.random()
+                    if value < drain_probability:
+                        drains += self._drain(playfield)
+                    elif value < drain_probability + shot_probability:
+                        self._hit_shot()
+                        shots += 1
+
+        return shots, drains
+
+    def _end_game(self):
+        """End a game which timed out and drain all its balls."""
+        if self.machine.game:
+            self.machine.game.end_game()
+
+        for _ in range(60):
+            if not self._game_running and not any(playfield.balls for playfield in self.machine.playfields):
+                break
+            for playfield, pending in list(self._pending_drains.items()):
+                if playfield.balls > pending:
+                    self._drain(playfield)
+            self.advance_time_and_run(1)
+
+    def _simulate(self, games: int) -> dict:
+        self._setup()
+
+        result = {
+            "games": 0,
+            "timeouts": 0,
+            "game_time_s": [],
+            "game_wall_s": [],
+            "events": [],
+            "shots": [],
+            "drains": [],
+        }   # type: Dict
+
+        for _ in range(games):
+            events_before = len(self._dispatch_times)
+            wall_start = perf_counter()
+            game_start = self.loop.time()
+            if not self._start_game():
+                raise AssertionError("Game did not start. The machine needs balls in a trough and a switch "
+                                     "tagged start.")
+
+            shots, drains = self._play()
+            if self._game_running:
+                result["timeouts"] += 1
+                self._end_game()
+
+            result["games"] += 1
+            result["game_time_s"].append(self.loop.time() - game_start)
+            result["game_wall_s"].append(perf_counter() - wall_start)
+            result["events"].append(len(self._dispatch_times) - events_before)
+            result["shots"].append(shots)
+            result["drains"].append(drains)
+
+        result["handler_latency_s"] = list(self._dispatch_times)
+        result["switch_latency_s"] = list(self._switch_times)
+        return result
+
+
+def run_simulation(machine_path: str, config_files: "List[str]", games: int, seed: int, model_args: dict,
+                   platform: str = "smart_virtual", max_game_time: float = 600.0, log_level: str = "none") -> dict:
+    """Simulate games in a fresh simulator.
+
+    This is a module level function so it can be executed in a worker
+    process.
+    """
+    simulator = GameSimulator(config_files, SwitchModel(**model_args), seed, max_game_time, log_level)
+    return simulator.simulate(machine_path, games, platform)
+
+
+def merge_simulations(results: "List[dict]") -> dict:
+    """Merge the raw samples of one or more simulators into a report."""
+    samples = {}     # type: Dict[str, List[float]]
+    games = timeouts = 0
+    for result in results:
+        games += result["games"]
+        timeouts += result["timeouts"]
+        for key, values in result.items():
+            if isinstance(values, list):
+                samples.setdefault(key, []).extend(values)
+
+    game_time = sum(samples.get("game_time_s", []))
+    wall_time = sum(samples.get("game_wall_s", []))
+    events = sum(samples.get("events", []))
+    summarize = BenchmarkRunner.summarize
+    return {
+        "games": games,
+        "timeouts": timeouts,
+        "workers": len(results),
+        "game_length_s": summarize(samples.get("game_time_s", []), 1),
+        "game_wall_ms": summarize(samples.get("game_wall_s", [])),
+        "events_per_game": summarize(samples.get("events", []), 1),
+        "shots_per_game": summarize(samples.get("shots", []), 1),
+        "drains_per_game": summarize(samples.get("drains", []), 1),
+        # events per second of game time and per second of wall time
+        "game_events_per_sec": round(events / game_time, 2) if game_time else 0.0,
+        "events_per_sec": round(events / wall_time, 2) if wall_time else 0.0,
+        "speedup": round(game_time / wall_time, 2) if wall_time else 0.0,
+        "handler_latency_ms": summarize(samples.get("handler_latency_s", [])),
+        "switch_latency_ms": summarize(samples.get("switch_latency_s", [])),
+    }
@@ -67,11 +67,12 @@ class CommandLineUtility(object):
 
         _module = import_module('mpf.commands.%s' % command)
 
-        machine_path, remaining_args = self.parse_args()
+        machine_path, remaining_args = self.parse_args(
+            getattr(_module.Command, "requires_machine_path", True))
 
         _module.Command(self.mpf_path, machine_path, remaining_args)
 
-    def parse_args(self):
+    def parse_args(self, requires_machine_path=True):
         """Parse command line arguments."""
         parser = argparse.ArgumentParser(description='MPF Command')
 
@@ -100,6 +101,9 @@ class CommandLineUtility(object):
             self.argv.insert(1, None)
 
         args, remaining_args = parser.parse_known_args(self.argv[1:])
+        if not requires_machine_path and not args.machine_path:
+            return None, remaining_args
+
         machine_path = self.get_machine_path(args.machine_path)
 
         return machine_path, remaining_args
@@ -0,0 +1,150 @@
+"""Command to run the MPF performance benchmarks."""
+import argparse
+import json
+import multiprocessing
+import sys
+
+from mpf.benchmarks.benchmark import run_benchmark, get_environment, compare_results
+from mpf.benchmarks.micro import MICRO_BENCHMARKS
+from mpf.benchmarks.scenarios import SCENARIOS
+
+
+class Command(object):
+
+    """Runs benchmark scenarios and prints or stores the results as JSON."""
+
+    # benchmarks generate their own machine configs
+    requires_machine_path = False
+
+    def __init__(self, mpf_path, machine_path, args):
+        """Run mpf benchmark."""
+        del mpf_path
+        del machine_path
+
+        parser = argparse.ArgumentParser(
+            description='Runs MPF performance benchmarks without hardware')
+
+        parser.add_argument("-s", "--scenario",
+                            action="append", dest="scenarios",
+                            choices=sorted(SCENARIOS),
+                            help="Scenario to run. Can be used multiple times. "
+                                 "Default is all scenarios")
+
+        parser.add_argument("-m", "--micro",
+                            action="append", dest="micro",
+                            choices=sorted(MICRO_BENCHMARKS),
+                            help="Microbenchmark to run. Can be used multiple "
+                                 "times. Scenarios are only run in addition "
+                                 "when selected with --scenario")
+
+        parser.add_argument("-p", "--platform",
+                            action="append", dest="platforms",
+                            choices=["virtual", "smart_virtual"],
+                            help="Platform to run on. Can be used multiple "
+                                 "times. Default is all platforms supported "
+                                 "by a scenario")
+
+        parser.add_argument("-i", "--iterations",
+                            action="store", dest="iterations", type=int,
+                            default=None,
+                            help="Overwrite the number of iterations of "
+                                 "every scenario")
+
+        parser.add_argument("--allocation-iterations",
+                            action="store", dest="allocation_iterations",
+                            type=int, default=100,
+                            help="Iterations measured with tracemalloc. "
+                                 "0 disables the allocation pass")
+
+        parser.add_argument("-l", "--logging",
+                            action="append", dest="log_levels",
+                            choices=["none", "basic", "full"],
+                            help="File logging level of all controllers. Can "
+                                 "be used multiple times to compare levels. "
+                                 "Default is none")
+
+        parser.add_argument("-o", "--output",
+                            action="store", dest="output", metavar="file",
+                            default=None,
+                            help="Write the JSON results to this file")
+
+        parser.add_argument("-c", "--compare",
+                            action="store", dest="compare", metavar="file",
+                            default=None,
+                            help="Compare against a previous JSON result and "
+                                 "exit with 1 when a metric got worse than "
+                                 "the threshold")
+
+        parser.add_argument("-t", "--threshold",
+                            action="store", dest="threshold", type=float,
+                            default=10.0,
+                            help="Regression threshold in percent used with "
+                                 "--compare. Default is 10")
+
+        parser.add_argument("--no-isolate",
+                            action="store_false", dest="isolate",
+                            default=True,
+                            help="Run all scenarios in this process instead "
+                                 "of one fresh process per run. Peak RSS "
+                                 "will not be per run")
+
+        args = parser.parse_args(args)
+
+        report = get_environment()
+        if args.micro:
+            report["micro"] = {name: MICRO_BENCHMARKS[name]() for name in args.micro}
+        if args.scenarios or not args.micro:
+            report["results"] = self.run(args)
+
+        output = json.dumps(report, indent=2, sort_keys=True)
+        if args.output:
+            with open(args.output, "w") as f:
+                f.write(output)
+        else:
+            print(output)
+
+        if args.compare:
+            with open(args.compare) as f:
+                old_report = json.load(f)
+            sys.exit(self.print_comparison(compare_results(old_report, report), args.threshold))
+
+    @staticmethod
+    def run(args):
+        """Run all selected scenarios and return the results."""
+        results = {}
+        for scenario_name in args.scenarios or sorted(SCENARIOS):
+            scenario = SCENARIOS[scenario_name]
+            platforms = [platform for platform in scenario.platforms
+                         if not args.platforms or platform in args.platforms]
+            for platform in platforms:
+                for log_level in args.log_levels or ["none"]:
+                    # results with logging get their own key to keep reports comparable
+                    key = platform if log_level == "none" else "{}+log_{}".format(platform, log_level)
+                    print("Running {} on {}...".format(scenario_name, key), file=sys.stderr)
+                    run_args = (scenario_name, platform, args.iterations, args.allocation_iterations, log_level)
+                    if args.isolate:
+                        # spawn a clean interpreter to make runs independent
+                        with multiprocessing.get_context("spawn").Pool(1) as pool:
+                            result = pool.apply(run_benchmark, run_args)
+                    else:
+                        result = run_benchmark(*run_args)
+
+                    results.setdefault(scenario_name, {})[key] = result
+
+        return results
+
+    @staticmethod
+    def print_comparison(rows, threshold):
+        """Print comparison and return 1 if there is any regression."""
+        regression = False
+        for row in rows:
+            change = row["change"] * 100
+            marker = ""
+            if change > threshold:
+                marker = "  REGRESSION"
+                regression = True
+            print("{:15} {:14} {:26} {:>14} -> {:>14} {:+8.1f}%{}".format(
+                row["scenario"], row["platform"], row["metric"], row["old"], row["new"], change, marker),
+                file=sys.stderr)
+
+        return 1 if regression else 0
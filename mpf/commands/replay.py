@@ -0,0 +1,93 @@
+"""Command to replay a switch journal against a machine config."""
+import argparse
+import json
+import os
+import sys
+
+from mpf.benchmarks.benchmark import get_environment
+from mpf.benchmarks.replay import SwitchJournalReplayer
+from mpf.core.utility_functions import Util
+from mpf.plugins.switch_journal import get_journal_files
+
+
+class Command(object):
+
+    """Replays switch journals recorded by the switch_journal plugin and prints the report as JSON."""
+
+    def __init__(self, mpf_path, machine_path, args):
+        """Run mpf replay."""
+        parser = argparse.ArgumentParser(
+            description='Replays a switch journal against a machine without hardware')
+
+        parser.add_argument("-j", "--journal",
+                            action="append", dest="journals", metavar="file",
+                            help="Journal file to replay. Can be used multiple "
+                                 "times. Default is data/switch_journal.bin "
+                                 "of the machine and all its rotated files")
+
+        parser.add_argument("-c",
+                            action="store", dest="configfile",
+                            default="config.yaml", metavar='config_file',
+                            help="The name of a config file to load. Default "
+                                 "is config.yaml. Multiple files can be used "
+                                 "via a comma-separated list (no spaces "
+                                 "between)")
+
+        parser.add_argument("-r", "--real-time",
+                            action="store_true", dest="real_time",
+                            help="Replay in real time instead of on the time "
+                                 "travel loop and report timing divergences")
+
+        parser.add_argument("-s", "--speed",
+                            action="store", dest="speed", type=float,
+                            default=1.0,
+                            help="Replay faster by this factor. Default is 1")
+
+        parser.add_argument("-d", "--divergence-ms",
+                            action="store", dest="divergence_ms", type=float,
+                            default=10.0,
+                            help="Records which are applied more than this "
+                                 "late are timing divergences. Default is 10")
+
+        parser.add_argument("-p", "--platform",
+                            action="store", dest="platform",
+                            choices=["virtual", "smart_virtual"],
+                            default="virtual",
+                            help="Platform to replay on. Default is virtual")
+
+        parser.add_argument("-l", "--logging",
+                            action="store", dest="log_level",
+                            choices=["none", "basic", "full"],
+                            default="none",
+                            help="File logging level of all controllers. "
+                                 "Default is none")
+
+        parser.add_argument("-o", "--output",
+                            action="store", dest="output", metavar="file",
+                            default=None,
+                            help="Write the JSON report to this file")
+
+        args = parser.parse_args(args)
+
+        journals = args.journals
+        if not journals:
+            journals = get_journal_files(os.path.join(machine_path, "data", "switch_journal.bin"))
+        if not journals:
+            print("No switch journal found. Record one with the switch_journal plugin or use -j.",
+                  file=sys.stderr)
+            sys.exit(1)
+
+        replayer = SwitchJournalReplayer(Util.string_to_list(args.configfile), args.real_time, args.speed,
+                                         args.divergence_ms, args.log_level)
+        replayer.mpf_path = mpf_path
+
+        report = get_environment()
+        report["journals"] = journals
+        report["replay"] = replayer.replay(machine_path, journals, args.platform)
+
+        output = json.dumps(report, indent=2, sort_keys=True)
+        if args.output:
+            with open(args.output, "w") as f:
+                f.write(output)
+        else:
+            print(output)
@@ -0,0 +1,141 @@
+"""Command to simulate games against a machine config."""
+import argparse
+import json
+import multiprocessing
+import sys
+
+from mpf.benchmarks.benchmark import get_environment
+from mpf.benchmarks.simulate import run_simulation, merge_simulations
+from mpf.core.utility_functions import Util
+
+
+class Command(object):
+
+    """Plays many simulated games in worker processes and prints the statistics as JSON."""
+
+    def __init__(self, mpf_path, machine_path, args):
+        """Run mpf simulate."""
+        del mpf_path
+
+        parser = argparse.ArgumentParser(
+            description='Simulates games against a machine without hardware')
+
+        parser.add_argument("-n", "--games",
+                            action="store", dest="games", type=int,
+                            default=10,
+                            help="Number of games to simulate. Default is 10")
+
+        parser.add_argument("-w", "--workers",
+                            action="store", dest="workers", type=int,
+                            default=multiprocessing.cpu_count(),
+                            help="Number of worker processes. Default is the "
+                                 "number of CPUs")
+
+        parser.add_argument("-c",
+                            action="store", dest="configfile",
+                            default="config.yaml", metavar='config_file',
+                            help="The name of a config file to load. Default "
+                                 "is config.yaml. Multiple files can be used "
+                                 "via a comma-separated list (no spaces "
+                                 "between)")
+
+        parser.add_argument("--shot",
+                            action="append", dest="shots", metavar="switch=weight",
+                            help="Switch hit by a shot and its relative "
+                                 "probability. Can be used multiple times. "
+                                 "Default is all switches tagged "
+                                 "playfield_active with the same probability")
+
+        parser.add_argument("--shot-rate",
+                            action="store", dest="shot_rate", type=float,
+                            default=1.0,
+                            help="Shots per second of every ball on the "
+                                 "playfield. Default is 1")
+
+        parser.add_argument("--drain-rate",
+                            action="store", dest="drain_rate", type=float,
+                            default=0.05,
+                            help="Drains per second of every ball on the "
+                                 "playfield. Default is 0.05")
+
+        parser.add_argument("--tick-ms",
+                            action="store", dest="tick_ms", type=float,
+                            default=100.0,
+                            help="Simulation step in ms. Default is 100")
+
+        parser.add_argument("--max-game-time",
+                            action="store", dest="max_game_time", type=float,
+                            default=600.0,
+                            help="End games after this many seconds of game "
+                                 "time. Default is 600")
+
+        parser.add_argument("--seed",
+                            action="store", dest="seed", type=int,
+                            default=0,
+                            help="Random seed of the first worker. Default "
+                                 "is 0")
+
+        parser.add_argument("-p", "--platform",
+                            action="store", dest="platform",
+                            choices=["virtual", "smart_virtual"],
+                            default="smart_virtual",
+                            help="Platform to simulate on. Balls only move on "
+                                 "smart_virtual. Default is smart_virtual")
+
+        parser.add_argument("-l", "--logging",
+                            action="store", dest="log_level",
+                            choices=["none", "basic", "full"],
+                            default="none",
+                            help="File logging level of all controllers. "
+                                 "Default is none")
+
+        parser.add_argument("-o", "--output",
+                            action="store", dest="output", metavar="file",
+                            default=None,
+                            help="Write the JSON report to this file")
+
+        args = parser.parse_args(args)
+
+        shots = None
+        if args.shots:
+            shots = {}
+            for shot in args.shots:
+                name, _, weight = shot.partition("=")
+                try:
+                    shots[name] = float(weight) if weight else 1.0
+                except ValueError:
+                    parser.error("Invalid shot {}. Use switch=weight".format(shot))
+
+        model_args = {
+            "shots": shots,
+            "shot_rate": args.shot_rate,
+            "drain_rate": args.drain_rate,
+            "tick": args.tick_ms / 1000,
+        }
+
+        report = get_environment()
+        report["simulation"] = self.run(machine_path, Util.string_to_list(args.configfile), args, model_args)
+
+        output = json.dumps(report, indent=2, sort_keys=True)
+        if args.output:
+            with open(args.output, "w") as f:
+                f.write(output)
+        else:
+            print(output)
+
+    @staticmethod
+    def run(machine_path, config_files, args, model_args):
+        """Split games across worker processes and merge their results."""
+        workers = max(1, min(args.workers, args.games))
+        run_args = []
+        for worker in range(workers):
+            games = args.games // workers + (1 if worker < args.games % workers else 0)
+            run_args.append((machine_path, config_files, games, args.seed + worker, model_args, args.platform,
+                             args.max_game_time, args.log_level))
+
+        print("Simulating {} games in {} workers...".format(args.games, workers), file=sys.stderr)
+        # spawn clean interpreters so workers do not share state
+        with multiprocessing.get_context("spawn").Pool(workers) as pool:
+            results = pool.starmap(run_simulation, run_args)
+
+        return merge_simulations(results)
@@ -31,8 +31,7 @@ class BcpPluginPlayer(DeviceConfigPlayer):
         # since bcp is connecting in init_phase_2 we have to postpone this
         self.machine.events.add_handler('init_phase_3', self._initialise_system_wide)
 
-    # pylint: disable-msg=too-many-arguments
-    def show_play_callback(self, settings, priority, calling_context, show_tokens, context, start_time):
+    def _setup_show_context(self, settings, priority, context):
         """Add bcp context dict."""
         bcp_context = context + "_bcp"
         if bcp_context not in self.instances:
@@ -40,7 +39,7 @@ class BcpPluginPlayer(DeviceConfigPlayer):
 
         if self.config_file_section not in self.instances[bcp_context]:
             self.instances[bcp_context][self.config_file_section] = dict()
-        super().show_play_callback(settings, priority, calling_context, show_tokens, context, start_time)
+        return super()._setup_show_context(settings, priority, context)
 
     def play(self, settings, context, calling_context, priority=0, **kwargs):
         """Trigger remote player via BCP."""
@@ -15,9 +15,16 @@ class LightPlayer(DeviceConfigPlayer):
 
     def play(self, settings, context, calling_context, priority=0, **kwargs):
         """Set light color based on config."""
+        del kwargs
+        self.machine.light_controller.begin_batch()
+        try:
+            self._play(settings, context, priority)
+        finally:
+            self.machine.light_controller.end_batch()
+
+    def _play(self, settings, context, priority):
         instance_dict = self._get_instance_dict(context)
         full_context = self._get_full_context(context)
-        del kwargs
 
         for light, s in settings.items():
             s = deepcopy(s)
@@ -36,6 +43,13 @@ class LightPlayer(DeviceConfigPlayer):
                 self._light_color(light, instance_dict, full_context, **s)
 
     def _remove(self, settings, context, priority):
+        self.machine.light_controller.begin_batch()
+        try:
+            self._remove_lights(settings, context, priority)
+        finally:
+            self.machine.light_controller.end_batch()
+
+    def _remove_lights(self, settings, context, priority):
         instance_dict = self._get_instance_dict(context)
         full_context = self._get_full_context(context)
 
@@ -109,8 +123,12 @@ class LightPlayer(DeviceConfigPlayer):
     def clear_context(self, context):
         """Remove all colors which were set in context."""
         full_context = self._get_full_context(context)
-        for light in self._get_instance_dict(context).values():
-            light.remove_from_stack_by_key(full_context)
+        self.machine.light_controller.begin_batch()
+        try:
+            for light in self._get_instance_dict(context).values():
+                light.remove_from_stack_by_key(full_context)
+        finally:
+            self.machine.light_controller.end_batch()
 
         self._reset_instance_dict(context)
 
@@ -1,19 +1,22 @@
 """Contains AssetManager, AssetLoader, and Asset base classes."""
 import copy
+import heapq
 import os
 import random
 import threading
 from collections import deque, namedtuple
 from pathlib import PurePath
+from time import perf_counter
 
 import asyncio
 
-from typing import Iterable, Optional, Set, Callable, Tuple
+from typing import Iterable, Iterator, Optional, Set, Callable, Tuple
 from typing import List
 
 from mpf.core.mode import Mode
 
 from mpf.core.case_insensitive_dict import CaseInsensitiveDict
+from mpf.core.config_processor import ConfigProcessor
 from mpf.core.machine import MachineController
 from mpf.core.mpf_controller import MpfController
 from mpf.core.utility_functions import Util
@@ -209,6 +212,8 @@ class BaseAssetManager(MpfController, LogMixin):
                 [x for x in getattr(self.machine, ac.attribute).values() if
                  x.config['load'] == 'preload' or force_assets_load])
 
+        self._preload_asset_files(preload_assets)
+
         wait_for_assets = False
         for asset in preload_assets:
             if not asset.load():
@@ -512,6 +517,10 @@ class BaseAssetManager(MpfController, LogMixin):
         """Load an asset."""
         raise NotImplementedError("implement")
 
+    def _preload_asset_files(self, assets: List["Asset"]) -> None:
+        """Prepare the files of assets which will be loaded at boot."""
+        pass
+
     def _bcp_client_asset_load(self, total, remaining, **kwargs):
         # Callback for the BCP assets_to_load command which tracks asset
         # loading from a connected BCP client.
@@ -592,7 +601,41 @@ class BaseAssetManager(MpfController, LogMixin):
 
 class AsyncioSyncAssetManager(BaseAssetManager):
 
-    """AssetManager which uses asyncio to load assets."""
+    """AssetManager which uses asyncio to load assets.
+
+    By default assets load synchronously on the loop. When
+    ``mpf: asset_loader_threads`` is set, files are read and parsed in a thread
+    pool and the rest of the loading runs on the loop in slices of at most
+    ``mpf: asset_load_slice_ms`` so switches and events are still processed
+    while large shows load. Queued assets load in order of their priority.
+    """
+
+    def __init__(self, machine: MachineController) -> None:
+        """Initialise asset manager."""
+        super().__init__(machine)
+        threads = self.machine.config['mpf'].get('asset_loader_threads', 0)
+        self._slice_time = self.machine.config['mpf'].get('asset_load_slice_ms', 5) / 1000
+        self._threads = threads
+        self._executor = self.machine.create_asset_loader_executor(threads) if threads else None
+        self._load_queue = []       # type: List[Tuple[int, int, Asset]]
+        self._loader_tasks = 0
+
+        if self._executor:
+            self.machine.events.add_handler('shutdown', self._shutdown_executor)
+
+    def _shutdown_executor(self, **kwargs):
+        del kwargs
+        self._executor.shutdown(wait=False)
+
+    def _preload_asset_files(self, assets: List["Asset"]) -> None:
+        """Parse yaml based assets (e.g. shows) in parallel."""
+        workers = self.machine.get_config_load_workers()
+        if workers <= 1:
+            return
+
+        # asset pools do not have files
+        ConfigProcessor.preload_config_files([asset.file for asset in assets if getattr(asset, "file", None)],
+                                             workers)
 
     @staticmethod
     def _load_sync(asset):
@@ -614,8 +657,43 @@ class AsyncioSyncAssetManager(BaseAssetManager):
     def load_asset(self, asset):
         """Load an asset."""
         self.num_assets_to_load += 1
-        task = self.machine.clock.loop.create_task(self.wait_for_asset_load(asset))
-        task.add_done_callback(self._done)
+        if not self._executor:
+            task = self.machine.clock.loop.create_task(self.wait_for_asset_load(asset))
+            task.add_done_callback(self._done)
+            return
+
+        # highest priority first. assets with the same priority load in order
+        heapq.heappush(self._load_queue, (-asset.priority, asset.get_id(), asset))
+        if self._loader_tasks < self._threads:
+            self._loader_tasks += 1
+            task = self.machine.clock.loop.create_task(self._load_queued_assets())
+            task.add_done_callback(self._loader_done)
+
+    def _loader_done(self, future):
+        self._loader_tasks -= 1
+        self._done(future)
+
+    @asyncio.coroutine
+    def _load_queued_assets(self):
+        """Load assets from the queue until it is empty."""
+        while self._load_queue:
+            _, _, asset = heapq.heappop(self._load_queue)
+            if not asset.loaded:
+                data = yield from self.machine.clock.loop.run_in_executor(self._executor, asset.read_file)
+                yield from self._load_in_slices(asset, data)
+                asset.is_loaded()
+
+            self.num_assets_loaded += 1
+            self._post_loading_event()
+
+    @asyncio.coroutine
+    def _load_in_slices(self, asset, data):
+        """Run the load steps of an asset but yield to the loop after every slice."""
+        slice_start = perf_counter()
+        for _ in asset.load_in_steps(data):
+            if perf_counter() - slice_start > self._slice_time:
+                yield from asyncio.sleep(0, loop=self.machine.clock.loop)
+                slice_start = perf_counter()
 
     @staticmethod
     def _done(future):
@@ -909,6 +987,23 @@ class Asset(object):
 
         self._callbacks = set()
 
+    def read_file(self):
+        """Read and parse the file of this asset in a loader thread.
+
+        The result is passed to load_in_steps. Do not access the machine here.
+        """
+        return None
+
+    def load_in_steps(self, data) -> Iterator[None]:
+        """Load the asset on the loop and yield between steps.
+
+        The asset manager may run the loop between two steps. The default
+        implementation loads the asset in one step using do_load.
+        """
+        del data
+        self.do_load()
+        yield
+
     def do_load(self):
         """Load the asset blocking."""
         # This is the actual method that loads the asset. It's called by a
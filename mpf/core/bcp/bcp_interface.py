@@ -45,6 +45,8 @@ class BcpInterface(MpfController):
 
         self._client_reset_queue = None
         self._client_reset_complete_status = {}
+        self._profiler_task = None
+        self._profiler_enabled_by_bcp = False
 
         self.bcp_receive_commands = dict(
             reset_complete=self._bcp_receive_reset_complete,
@@ -114,6 +116,10 @@ class BcpInterface(MpfController):
             self._monitor_modes(client)
         elif category == "core_events":
             self._monitor_core_events(client)
+        elif category == "profiler":
+            self._monitor_profiler(client)
+        elif category == "loop_watchdog":
+            self.machine.bcp.transport.add_handler_to_transport("_loop_watchdog", client)
         else:
             self.machine.bcp.transport.send_to_client(client,
                                                       "error",
@@ -140,6 +146,10 @@ class BcpInterface(MpfController):
             self._monitor_modes_stop(client)
         elif category == "core_events":
             self._monitor_core_events_stop(client)
+        elif category == "profiler":
+            self._monitor_profiler_stop(client)
+        elif category == "loop_watchdog":
+            self.machine.bcp.transport.remove_transport_from_handle("_loop_watchdog", client)
         else:
             self.machine.bcp.transport.send_to_client(client,
                                                       "error",
@@ -182,6 +192,7 @@ class BcpInterface(MpfController):
     def _monitor_devices(self, client):
         """Register client to get notified of device changes."""
         self.machine.bcp.transport.add_handler_to_transport("_devices", client)
+        self.machine.device_manager.set_device_monitoring(True)
         # trigger updates of lights
         self.machine.light_controller.monitor_lights()
 
@@ -199,6 +210,8 @@ class BcpInterface(MpfController):
     def _monitor_devices_stop(self, client):
         """Remove client to no longer get notified of device changes."""
         self.machine.bcp.transport.remove_transport_from_handle("_devices", client)
+        self.machine.device_manager.set_device_monitoring(
+            bool(self.machine.bcp.transport.get_transports_for_handler("_devices")))
 
     def notify_device_changes(self, device, attribute_name, old_value, new_value):
         """Notify all listeners about device change."""
@@ -296,6 +309,37 @@ class BcpInterface(MpfController):
             prev_value=prev_value,
             change=change)
 
+    def _monitor_profiler(self, client):
+        """Enable the profiler and send its stats to the client every second."""
+        self.machine.bcp.transport.add_handler_to_transport("_profiler", client)
+
+        if not self._profiler_task:
+            if not self.machine.events.profiler:
+                self.machine.events.enable_profiler()
+                self._profiler_enabled_by_bcp = True
+            self._profiler_task = self.machine.clock.schedule_interval(self._send_profiler_stats, 1)
+
+    def _monitor_profiler_stop(self, client):
+        """Stop sending profiler stats to the client."""
+        self.machine.bcp.transport.remove_transport_from_handle("_profiler", client)
+
+        # If there are no more clients monitoring the profiler, stop it again
+        if not self.machine.bcp.transport.get_transports_for_handler("_profiler") and self._profiler_task:
+            self.machine.clock.unschedule(self._profiler_task)
+            self._profiler_task = None
+            if self._profiler_enabled_by_bcp:
+                self.machine.events.disable_profiler()
+                self._profiler_enabled_by_bcp = False
+
+    def _send_profiler_stats(self):
+        if not self.machine.events.profiler:
+            return
+
+        self.machine.bcp.transport.send_to_clients_with_handler(
+            handler="_profiler",
+            bcp_command="profiler_stats",
+            **self.machine.events.profiler.get_stats())
+
     def _monitor_modes(self, client):
         """Begin monitoring all mode events (start, stop) via the specified client."""
         if not self.machine.bcp.transport.get_transports_for_handler("_modes"):
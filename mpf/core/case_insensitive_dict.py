@@ -1,5 +1,34 @@
 """Case insensitive dict."""
 # Based on this: http://stackoverflow.com/questions/2082152/case-insensitive-dictionary
+import sys
+
+# maps keys to their interned lowercase version. MPF looks up the same few
+# hundred names (switches, devices, player vars) over and over again.
+_LOWERED_KEYS = {}
+# prevent unbounded growth when keys are generated dynamically
+_MAX_LOWERED_KEYS = 10000
+
+
+def lower_key(key):
+    """Return the lowercase version of a key.
+
+    Results for strings are interned and memoized. Other keys are returned
+    unchanged.
+    """
+    try:
+        return _LOWERED_KEYS[key]
+    except KeyError:
+        pass
+
+    if not isinstance(key, str):
+        # only strings are memoized since e.g. True == 1
+        return key
+
+    lowered = sys.intern(key.lower())
+    if len(_LOWERED_KEYS) >= _MAX_LOWERED_KEYS:
+        _LOWERED_KEYS.clear()
+    _LOWERED_KEYS[key] = lowered
+    return lowered
 
 
 class CaseInsensitiveDict(dict):
@@ -9,7 +38,7 @@ class CaseInsensitiveDict(dict):
     @staticmethod
     def lower(key):
         """Lowercase the key."""
-        return key.lower() if isinstance(key, str) else key
+        return lower_key(key)
 
     def __init__(self, *args, **kwargs):
         """Initialise case insensitve dict."""
@@ -18,31 +47,31 @@ class CaseInsensitiveDict(dict):
 
     def __getitem__(self, key):
         """Return item for key."""
-        return super().__getitem__(self.__class__.lower(key))
+        return dict.__getitem__(self, lower_key(key))
 
     def __setitem__(self, key, value):
         """Set item for key to value."""
-        super().__setitem__(self.__class__.lower(key), value)
+        dict.__setitem__(self, lower_key(key), value)
 
     def __delitem__(self, key):
         """Delete item for key."""
-        return super().__delitem__(self.__class__.lower(key))
+        return dict.__delitem__(self, lower_key(key))
 
     def __contains__(self, key):
         """Check if dict contains a key."""
-        return super().__contains__(self.__class__.lower(key))
+        return dict.__contains__(self, lower_key(key))
 
     def pop(self, key, *args, **kwargs):
         """Retrieve and delete a value for a key."""
-        return super().pop(self.__class__.lower(key), *args, **kwargs)
+        return super().pop(lower_key(key), *args, **kwargs)
 
     def get(self, key, *args, **kwargs):
         """Return item for key."""
-        return super().get(self.__class__.lower(key), *args, **kwargs)
+        return dict.get(self, lower_key(key), *args, **kwargs)
 
     def setdefault(self, key, *args, **kwargs):
         """Set defaults."""
-        return super().setdefault(self.__class__.lower(key), *args, **kwargs)
+        return super().setdefault(lower_key(key), *args, **kwargs)
 
     def update(self, e=None, **f):
         """Update a value for a key."""
@@ -1,6 +1,7 @@
 """MPF clock and main loop."""
 import asyncio
 from functools import partial
+from time import perf_counter
 
 from typing import Tuple, Generator
 
@@ -8,6 +9,10 @@ from serial_asyncio import create_serial_connection
 
 from mpf.core.logging import LogMixin
 
+MYPY = False
+if MYPY:   # pragma: no cover
+    from mpf.core.profiler import Profiler
+
 
 class PeriodicTask:
 
@@ -47,10 +52,15 @@ class ClockBase(LogMixin):
 
     """A clock object with event support."""
 
+    # interval of the probe which measures loop lag while profiling
+    LAG_PROBE_INTERVAL = .1
+
     def __init__(self, machine=None, loop=None):
         """Initialise clock."""
         super().__init__()
         self.machine = machine
+        self.profiler = None    # type: Profiler
+        self._lag_probe = None  # type: asyncio.Handle
 
         # needed since the test clock is setup before the machine
         if machine:
@@ -77,6 +87,45 @@ class ClockBase(LogMixin):
             asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
         return asyncio.get_event_loop()
 
+    def enable_profiler(self, profiler: "Profiler"):
+        """Record callback durations and loop lag in profiler."""
+        self.profiler = profiler
+        self._schedule_lag_probe()
+
+    def disable_profiler(self):
+        """Stop recording."""
+        self.profiler = None
+        if self._lag_probe:
+            self._lag_probe.cancel()
+            self._lag_probe = None
+
+    def _schedule_lag_probe(self):
+        scheduled_time = self.loop.time() + self.LAG_PROBE_INTERVAL
+        self._lag_probe = self.loop.call_at(scheduled_time, self._lag_probe_callback, scheduled_time)
+
+    def _lag_probe_callback(self, scheduled_time):
+        if not self.profiler:
+            return
+        self.profiler.record_loop_lag(self.loop.time() - scheduled_time)
+        self._schedule_lag_probe()
+
+    def _profile_callback(self, callback, scheduled_time=None):
+        """Wrap callback to record its duration and lag while the profiler is enabled."""
+        def _profiled_callback():
+            profiler = self.profiler
+            if not profiler:
+                # profiler has been disabled since the callback was scheduled
+                callback()
+                return
+
+            if scheduled_time is not None:
+                profiler.record_loop_lag(self.loop.time() - scheduled_time)
+            start = perf_counter()
+            callback()
+            profiler.record_callback(callback, perf_counter() - start)
+
+        return _profiled_callback
+
     def run(self, stop_future):
         """Run the clock."""
         self.loop.run_until_complete(stop_future)
@@ -163,6 +212,9 @@ class ClockBase(LogMixin):
         if not callable(callback):
             raise AssertionError('callback must be a callable, got %s' % callback)
 
+        if self.profiler:
+            callback = self._profile_callback(callback, self.loop.time() + timeout)
+
         event = self.loop.call_later(delay=timeout, callback=callback)
 
         self.debug_log("Scheduled a one-time clock callback (callback=%s, timeout=%s)",
@@ -183,6 +235,9 @@ class ClockBase(LogMixin):
         if not callable(callback):
             raise AssertionError('callback must be a callable, got {}'.format(callback))
 
+        if self.profiler:
+            callback = self._profile_callback(callback)
+
         periodic_task = PeriodicTask(timeout, self.loop, callback)
 
         self.debug_log("Scheduled a recurring clock callback (callback=%s, timeout=%s)",
@@ -332,7 +332,20 @@ class ConfigPlayer(object, metaclass=abc.ABCMeta):
     # pylint: disable-msg=too-many-arguments
     def show_play_callback(self, settings, priority, calling_context, show_tokens, context, start_time):
         """Handle show callback."""
-        # called from a show step
+        # called from a show step. set up the context only on the first step
+        # so looping shows do not register and remove handlers on every step
+        show_key = context + self.config_file_section
+        if show_key not in self._show_keys:
+            self._show_keys[show_key] = self._setup_show_context(settings, priority, context)
+
+        self.play(settings=settings, priority=priority, calling_context=calling_context,
+                  show_tokens=show_tokens, context=context, start_time=start_time)
+
+    def _setup_show_context(self, settings, priority, context):
+        """Set up the state of this player when a show starts playing in context.
+
+        Returns the event keys which are unloaded when the show stops.
+        """
         if context not in self.instances:
             self.instances[context] = dict()
 
@@ -341,16 +354,13 @@ class ConfigPlayer(object, metaclass=abc.ABCMeta):
 
         # register bcp events
         config = {'bcp_connection': settings['bcp_connection']} if 'bcp_connection' in settings else {}
-        event_keys = self.register_player_events(config, None, priority)
-        self._show_keys[context + self.config_file_section] = event_keys
-
-        self.play(settings=settings, priority=priority, calling_context=calling_context,
-                  show_tokens=show_tokens, context=context, start_time=start_time)
+        return self.register_player_events(config, None, priority)
 
     def show_stop_callback(self, context):
         """Handle show stop."""
-        self.unload_player_events(self._show_keys[context + self.config_file_section])
-        del self._show_keys[context + self.config_file_section]
+        event_keys = self._show_keys.pop(context + self.config_file_section, None)
+        if event_keys:
+            self.unload_player_events(event_keys)
 
         self.clear_context(context)
 
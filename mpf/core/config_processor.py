@@ -1,20 +1,99 @@
 """Contains the Config and CaseInsensitiveDict base classes."""
 
+import logging
 import os
+from concurrent.futures import ProcessPoolExecutor
+
+from typing import Iterable
 
 from mpf.core.file_manager import FileManager
 from mpf.core.utility_functions import Util
 from mpf.core.config_validator import ConfigValidator
+from mpf.file_interfaces.yaml_interface import YamlInterface
+
+
+def _parse_config_file(filename):   # pragma: no cover
+    """Parse a config file in a worker process."""
+    try:
+        return FileManager.load(filename, verify_version=False, halt_on_error=True)
+    except Exception:   # pylint: disable-msg=broad-except
+        # the error will be reported when the main process loads the file
+        return None
 
 
 class ConfigProcessor(object):
 
     """Config processor which loads the config."""
 
+    log = logging.getLogger('ConfigProcessor')
+
     def __init__(self, machine):
         """Initialise config processor."""
         pass
 
+    @staticmethod
+    def get_worker_count(setting: int) -> int:
+        """Return the number of processes used to parse config files.
+
+        A setting of 0 uses one process per CPU core.
+        """
+        if setting > 0:
+            return setting
+
+        return os.cpu_count() or 1
+
+    @staticmethod
+    def preload_config_files(filenames: Iterable[str], workers: int) -> int:
+        """Parse yaml files in a process pool before they are loaded.
+
+        The parsed files (and the files they include via ``config:``) are
+        consumed by the next ``load`` of the same file name, so callers
+        still load and merge the files one by one in their usual order. Files
+        which fail to parse are skipped and report their error when they are
+        loaded. Nothing happens with less than two workers (e.g. on single
+        core boards).
+
+        Returns the number of parsed files.
+        """
+        if workers <= 1:
+            return 0
+
+        pending = [filename for filename in filenames if ConfigProcessor._can_preload(filename)]
+        if len(pending) < 2:
+            return 0
+
+        parsed = 0
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                while pending:
+                    includes = []
+                    for filename, config in zip(pending, pool.map(_parse_config_file, pending)):
+                        if config is None:
+                            continue
+                        YamlInterface.preloaded_files[filename] = config
+                        parsed += 1
+                        if isinstance(config, dict) and 'config' in config:
+                            path = os.path.split(filename)[0]
+                            includes.extend(os.path.join(path, file) for file in Util.string_to_list(config['config']))
+
+                    pending = [filename for filename in includes if ConfigProcessor._can_preload(filename)]
+        except (OSError, RuntimeError, NotImplementedError) as e:   # pragma: no cover
+            ConfigProcessor.log.warning("Could not parse config files in parallel. Loading them serially. "
+                                        "Error: %s", e)
+
+        return parsed
+
+    @staticmethod
+    def _can_preload(filename: str) -> bool:
+        """Return true if the file is a yaml file which has not been parsed yet."""
+        if os.path.splitext(filename)[1] not in YamlInterface.file_types or not os.path.isfile(filename):
+            return False
+
+        if filename in YamlInterface.preloaded_files:
+            return False
+
+        return not (YamlInterface.cache and filename in YamlInterface.file_cache)
+
     @staticmethod
     def load_config_file(filename, config_type: str, verify_version=True, halt_on_error=True,
                          ignore_unknown_sections=False) -> dict:   # pragma: no cover
@@ -88,6 +88,7 @@ auditor:
     events: list|str|None
     player: list|str|None
     num_player_top_records: single|int|1
+    export_interval: single|ms|100ms
 autofire_coils:
     __valid_in__: machine
     coil: single|machine(coils)|
@@ -700,6 +701,7 @@ mode:
     code: single|str|None
     stop_on_ball_end: single|bool|True
     restart_on_next_ball: single|bool|False
+    lazy_load: single|bool|False
     console_log: single|enum(none,basic,full)|basic
     file_log: single|enum(none,basic,full)|basic
 mode_settings:
@@ -740,8 +742,20 @@ mpf:
     switch_tag_event: single|str|sw_%
     allow_invalid_config_sections: single|bool|false
     save_machine_vars_to_disk: single|bool|true
+    data_manager_journal: single|bool|false
+    data_manager_write_window_ms: single|int|100
+    data_manager_snapshot_records: single|int|1000
     default_show_sync_ms: single|int|0
     default_platform_hz: single|float|1000
+    event_trace_size: single|int|0
+    profiler: single|bool|false
+    loop_watchdog_ms: single|int|0
+    loop_watchdog_probe_ms: single|int|10
+    config_load_workers: single|int|0
+    lazy_mode_preload: single|bool|true
+    lazy_mode_unload_games: single|int|0
+    asset_loader_threads: single|int|0
+    asset_load_slice_ms: single|int|5
 mpf-mc:
     __valid_in__: machine                           # todo add to validator
 multiballs:
@@ -841,6 +855,12 @@ playfield_transfers:
     transfer_events: dict|str:ms|None
     eject_target: single|machine(ball_devices)|
     captures_from: single|machine(ball_devices)|
+playfield_statistics:
+    __valid_in__: machine
+    events: list|str|ball_search_started, ball_search_failed
+    minutes_to_keep: single|int|1440
+    hours_to_keep: single|int|720
+    games_to_keep: single|int|100
 plugins:
     __valid_in__: machine                      # todo add to validator
 pololu_maestro:
@@ -1244,6 +1264,11 @@ switch_player:
     __valid_in__: machine
     start_event: single|str|machine_reset_phase_3
     steps: ignore
+switch_journal:
+    __valid_in__: machine
+    max_file_kb: single|int|1024
+    max_files: single|int|5
+    flush_interval: single|ms|1s
 sequence_shots:
     __valid_in__: machine, mode
     switch_sequence: list|machine(switches)|None
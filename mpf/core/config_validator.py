@@ -1,9 +1,9 @@
 """Config specs and validator."""
 import logging
 import re
-from copy import deepcopy
+from functools import partial
 
-from typing import Any, Union, List
+from typing import Any, Callable, Union, List, Tuple, Optional
 from typing import Dict
 
 from mpf.core.config_spec import mpf_config_spec
@@ -14,12 +14,58 @@ from mpf.core.utility_functions import Util
 
 from mpf.core.case_insensitive_dict import CaseInsensitiveDict
 
+# marker for items which are not in the config
+_ITEM_MISSING = 'item not in config!@#'
+# marker for spec entries without default
+_DEFAULT_REQUIRED = 'default required!@#'
+
+
+class SpecItem(object):
+
+    """A compiled spec entry like ``single|int|5``.
+
+    validator is a function which takes the item and validation_failure_info.
+    """
+
+    __slots__ = ["spec", "item_type", "validator", "default"]
+
+    def __init__(self, spec: str, item_type: str, validator: "Callable[[Any, Any], Any]", default: Any) -> None:
+        """Initialise spec item."""
+        self.spec = spec
+        self.item_type = item_type
+        self.validator = validator
+        self.default = default
+
+
+class CompiledSpec(object):
+
+    """A compiled config spec section.
+
+    entries contains the key and SpecItem for every entry which needs
+    validation. The SpecItem is None for entries with a list of sub configs.
+    Entries are compiled on first use.
+    """
+
+    __slots__ = ["spec", "allow_others", "entries"]
+
+    def __init__(self, spec: dict, allow_others: bool) -> None:
+        """Initialise compiled spec."""
+        self.spec = spec
+        self.allow_others = allow_others
+        self.entries = None     # type: Optional[List[Tuple[str, Optional[SpecItem]]]]
+
 
 class ConfigValidator(object):
 
-    """Validates config against config specs."""
+    """Validates config against config specs.
+
+    Specs are compiled into SpecItems on first use and cached per validator.
+    Compiled specs are invalidated whenever config_spec changes.
+    """
 
     config_spec = None      # type: Any
+    # incremented whenever config_spec changes
+    spec_version = 0
 
     def __init__(self, machine):
         """Initialise validator."""
@@ -53,6 +99,11 @@ class ConfigValidator(object):
             "machine": self._validate_type_machine,
         }
 
+        self._compiled_items = {}           # type: Dict[str, SpecItem]
+        self._compiled_validators = {}      # type: Dict[str, Callable[[Any, Any], Any]]
+        self._compiled_specs = {}           # type: Dict[Tuple[str, Any], CompiledSpec]
+        self._compiled_version = -1
+
         if not ConfigValidator.config_spec:
             ConfigValidator.load_config_spec()
 
@@ -60,6 +111,7 @@ class ConfigValidator(object):
     def load_device_config_spec(cls, config_section, config_spec):
         """Load config specs for a device."""
         cls.config_spec[config_section] = YamlInterface.process(config_spec)
+        cls.config_spec_changed()
 
     @classmethod
     def load_mode_config_spec(cls, mode_string, config_spec):
@@ -68,6 +120,7 @@ class ConfigValidator(object):
             cls.config_spec['_mode_settings'] = {}
         if mode_string not in cls.config_spec['_mode_settings']:
             cls.config_spec['_mode_settings'][mode_string] = YamlInterface.process(config_spec)
+            cls.config_spec_changed()
 
     @classmethod
     def load_config_spec(cls, config_spec=None):
@@ -76,6 +129,12 @@ class ConfigValidator(object):
             config_spec = mpf_config_spec
 
         cls.config_spec = YamlInterface.process(config_spec)
+        cls.config_spec_changed()
+
+    @classmethod
+    def config_spec_changed(cls):
+        """Invalidate compiled specs after config_spec has been changed."""
+        ConfigValidator.spec_version += 1
 
     @classmethod
     def unload_config_spec(cls):
@@ -102,18 +161,129 @@ class ConfigValidator(object):
         this_spec = dict()
         for spec_element in spec_list:
             this_base_spec = self.config_spec
-            spec_element = spec_element.split(':')
-            for spec in spec_element:
-                # need to deepcopy so the orig base spec doesn't get polluted
-                # with this widget's spec
-                this_base_spec = deepcopy(this_base_spec[spec])
+            for spec in spec_element.split(':'):
+                this_base_spec = this_base_spec[spec]
 
+            # copy so the orig base spec doesn't get polluted with this
+            # widget's spec. compiled specs are never modified so a shallow
+            # copy is enough
+            this_base_spec = dict(this_base_spec)
             this_base_spec.update(this_spec)
             this_spec = this_base_spec
 
         return this_spec
 
-    # pylint: disable-msg=too-many-arguments,too-many-branches
+    def _get_compiled_spec(self, config_spec, base_spec) -> CompiledSpec:
+        """Return the compiled spec for a config_spec and base_spec.
+
+        Entries are compiled by _compile_entries on first validation.
+        """
+        if self._compiled_version != ConfigValidator.spec_version:
+            self._compiled_specs = {}
+            self._compiled_version = ConfigValidator.spec_version
+
+        key = (config_spec, tuple(base_spec) if isinstance(base_spec, list) else base_spec)
+        try:
+            return self._compiled_specs[key]
+        except KeyError:
+            pass
+
+        this_spec = self._build_spec(config_spec, base_spec)
+        compiled_spec = CompiledSpec(this_spec, '__allow_others__' in this_spec)
+        self._compiled_specs[key] = compiled_spec
+        return compiled_spec
+
+    def _compile_entries(self, spec, validation_failure_info) -> "List[Tuple[str, Optional[SpecItem]]]":
+        """Compile all entries of a spec which need validation."""
+        entries = []
+        for k, spec_item in spec.items():
+            if spec_item == 'ignore' or k[0] == '_':
+                continue
+
+            if isinstance(spec_item, dict):
+                # This means we're looking for a list of dicts
+                entries.append((k, None))
+            else:
+                entries.append((k, self._compile_item(spec_item, (validation_failure_info, k))))
+
+        return entries
+
+    def _compile_item(self, spec, validation_failure_info) -> SpecItem:
+        """Return the compiled version of a spec string like single|int|5."""
+        try:
+            return self._compiled_items[spec]
+        except (KeyError, TypeError):
+            pass
+
+        try:
+            item_type, validation, default = spec.split('|')
+        except (ValueError, AttributeError):
+            raise ValueError('Error in validator spec: {}:{}'.format(
+                validation_failure_info, spec))
+
+        if default.lower() == 'none':
+            default = None
+        elif not default:
+            default = _DEFAULT_REQUIRED
+
+        if item_type not in ('single', 'list', 'set', 'dict'):
+            raise ConfigFileError("Invalid Type '{}' in config spec {}:{}".format(item_type,
+                                  validation_failure_info[0][0],
+                                  validation_failure_info[1]))
+
+        spec_item = SpecItem(spec, item_type, self._compile_validator(validation, validation_failure_info), default)
+        self._compiled_items[spec] = spec_item
+        return spec_item
+
+    def _compile_validator(self, validator, validation_failure_info) -> "Callable[[Any, Any], Any]":
+        """Return a function which validates an item with a validator string like int(0,10) or str:ms."""
+        try:
+            return self._compiled_validators[validator]
+        except KeyError:
+            pass
+
+        if ':' in validator:
+            validator_parts = validator.split(':')
+            key_validator = self._compile_validator(validator_parts[0], validation_failure_info)
+            value_validator = self._compile_validator(validator_parts[1], validation_failure_info)
+
+            def validate(item, validation_failure_info):
+                try:
+                    if item.lower() == 'none':
+                        item = None
+                except AttributeError:
+                    pass
+
+                # item could be str, list, or list of dicts
+                item = Util.event_config_to_dict(item)
+                return {key_validator(k, validation_failure_info): value_validator(v, validation_failure_info)
+                        for k, v in item.items()}
+
+        else:
+            if '(' in validator and validator[-1:] == ')':
+                validator_parts = validator.split('(')
+                function = partial(self.validator_list[validator_parts[0]], param=validator_parts[1][:-1])
+            elif validator in self.validator_list:
+                function = self.validator_list[validator]
+            else:
+                raise ConfigFileError("Invalid Validator '{}' in config spec {}:{}".format(
+                                      validator,
+                                      validation_failure_info[0][0],
+                                      validation_failure_info[1]))
+
+            def validate(item, validation_failure_info):
+                try:
+                    if item.lower() == 'none':
+                        item = None
+                except AttributeError:
+                    pass
+
+                return function(item, validation_failure_info=validation_failure_info)
+
+        self._compiled_validators[validator] = validate
+        return validate
+
+    # pylint: disable-msg=too-many-arguments
     def validate_config(self, config_spec, source, section_name=None,
                         base_spec=None, add_missing_keys=True, prefix=None):
         """Validate a config dict against spec."""
@@ -132,10 +302,10 @@ class ConfigValidator(object):
         else:
             validation_failure_info = (config_spec, section_name)
 
-        this_spec = self._build_spec(config_spec, base_spec)
+        compiled_spec = self._get_compiled_spec(config_spec, base_spec)
 
-        if '__allow_others__' not in this_spec:
-            self.check_for_invalid_sections(this_spec, source,
+        if not compiled_spec.allow_others:
+            self.check_for_invalid_sections(compiled_spec.spec, source,
                                             validation_failure_info)
 
         processed_config = source
@@ -145,104 +315,67 @@ class ConfigValidator(object):
                 source.__class__
             ))
 
-        for k in list(this_spec.keys()):
-            if this_spec[k] == 'ignore' or k[0] == '_':
-                continue
-
-            elif k in source:  # validate the entry that exists
+        entries = compiled_spec.entries
+        if entries is None:
+            entries = compiled_spec.entries = self._compile_entries(compiled_spec.spec, validation_failure_info)
 
-                if isinstance(this_spec[k], dict):
+        for k, spec_item in entries:
+            if k in source:  # validate the entry that exists
+                if spec_item is None:
                     # This means we're looking for a list of dicts
-
-                    final_list = list()
-                    if k in source:
-                        for i in source[k]:  # individual step
-                            final_list.append(self.validate_config(
-                                config_spec + ':' + k, source=i,
-                                section_name=k))
-
-                    processed_config[k] = final_list
-
+                    processed_config[k] = [self.validate_config(config_spec + ':' + k, source=i, section_name=k)
+                                           for i in source[k]]
                 else:
-                    processed_config[k] = self.validate_config_item(
-                        this_spec[k], item=source[k],
-                        validation_failure_info=(validation_failure_info, k))
+                    processed_config[k] = self._validate_spec_item(spec_item, source[k],
+                                                                   (validation_failure_info, k))
 
             elif add_missing_keys:  # create the default entry
-
-                if isinstance(this_spec[k], dict):
+                if spec_item is None:
                     processed_config[k] = list()
-
                 else:
-                    processed_config[k] = self.validate_config_item(
-                        this_spec[k],
-                        validation_failure_info=(
-                            validation_failure_info, k))
+                    processed_config[k] = self._validate_spec_item(spec_item, _ITEM_MISSING,
+                                                                   (validation_failure_info, k))
 
         return processed_config
 
     def validate_config_item(self, spec, validation_failure_info,
-                             item='item not in config!@#', ):
+                             item=_ITEM_MISSING, ):
         """Validate a config item."""
-        try:
-            item_type, validation, default = spec.split('|')
-        except (ValueError, AttributeError):
-            raise ValueError('Error in validator spec: {}:{}'.format(
-                validation_failure_info, spec))
-
-        if default.lower() == 'none':
-            default = None
-        elif not default:
-            default = 'default required!@#'
-
-        if item == 'item not in config!@#':
-            if default == 'default required!@#':
+        return self._validate_spec_item(self._compile_item(spec, validation_failure_info), item,
+                                        validation_failure_info)
+
+    @staticmethod
+    def _validate_spec_item(spec_item: SpecItem, item, validation_failure_info):
+        """Validate an item using a compiled spec."""
+        if item is _ITEM_MISSING:
+            if spec_item.default is _DEFAULT_REQUIRED:
                 raise ValueError('Required setting missing from config file. '
                                  'Run with verbose logging and look for the last '
                                  'ConfigProcessor entry above this line to see where the '
-                                 'problem is. {} {}'.format(spec,
+                                 'problem is. {} {}'.format(spec_item.spec,
                                                             validation_failure_info))
             else:
-                item = default
+                item = spec_item.default
 
+        item_type = spec_item.item_type
+        validator = spec_item.validator
         if item_type == 'single':
-            return self.validate_item(item, validation,
-                                      validation_failure_info)
+            return validator(item, validation_failure_info)
 
         elif item_type == 'list':
-            item_list = Util.string_to_list(item)
-
-            new_list = list()
-
-            for i in item_list:
-                new_list.append(self.validate_item(i, validation, validation_failure_info))
-
-            return new_list
+            return [validator(i, validation_failure_info) for i in Util.string_to_list(item)]
 
         elif item_type == 'set':
-            item_set = set(Util.string_to_list(item))
-
-            new_set = set()
+            return {validator(i, validation_failure_info) for i in set(Util.string_to_list(item))}
 
-            for i in item_set:
-                new_set.add(self.validate_item(i, validation, validation_failure_info))
-
-            return new_set
-
-        elif item_type == 'dict':
-            item_dict = self.validate_item(item, validation,
-                                           validation_failure_info)
+        else:
+            item_dict = validator(item, validation_failure_info)
 
             if not item_dict:
                 return dict()
             else:
                 return item_dict
 
-        else:
-            raise ConfigFileError("Invalid Type '{}' in config spec {}:{}".format(item_type,
-                                  validation_failure_info[0][0],
-                                  validation_failure_info[1]))
-
     def check_for_invalid_sections(self, spec, config,
                                    validation_failure_info):
         """Check if all attributes are defined in spec."""
@@ -550,41 +683,7 @@ class ConfigValidator(object):
 
     def validate_item(self, item, validator, validation_failure_info):
         """Validate an item using a validator."""
-        try:
-            if item.lower() == 'none':
-                item = None
-        except AttributeError:
-            pass
-
-        if ':' in validator:
-            validator = validator.split(':')
-            # item could be str, list, or list of dicts
-            item = Util.event_config_to_dict(item)
-
-            return_dict = dict()
-
-            for k, v in item.items():
-                return_dict[self.validate_item(k, validator[0],
-                                               validation_failure_info)] = (
-                    self.validate_item(v, validator[1],
-                                       validation_failure_info)
-                )
-
-            return return_dict
-
-        elif '(' in validator and ')' in validator[-1:] == ')':
-            validator_parts = validator.split('(')
-            validator = validator_parts[0]
-            param = validator_parts[1][:-1]
-            return self.validator_list[validator](item, validation_failure_info=validation_failure_info, param=param)
-        elif validator in self.validator_list:
-            return self.validator_list[validator](item, validation_failure_info=validation_failure_info)
-
-        else:
-            raise ConfigFileError("Invalid Validator '{}' in config spec {}:{}".format(
-                                  validator,
-                                  validation_failure_info[0][0],
-                                  validation_failure_info[1]))
+        return self._compile_validator(validator, validation_failure_info)(item, validation_failure_info)
 
     @classmethod
     def validation_error(cls, item, validation_failure_info, msg=""):
@@ -1,15 +1,22 @@
 """Contains the DataManager base class."""
 
 import copy
+import heapq
+import json
 import os
 import errno
 import threading
 import time
+import zlib
 import _thread
 
 from mpf.core.file_manager import FileManager
 from mpf.core.mpf_controller import MpfController
 
+MYPY = False
+if MYPY:   # pragma: no cover
+    from typing import Any, Dict, List, Tuple
+
 
 class DataManager(MpfController):
 
@@ -44,6 +51,7 @@ class DataManager(MpfController):
             raise AssertionError("Invalid path {} for {}".format(config_path, name))
 
         self.data = dict()
+        self._expire_index = []     # type: List[Tuple[float, Any]]
         self._dirty = threading.Event()
 
         if self.filename:
@@ -73,6 +81,47 @@ class DataManager(MpfController):
             self.debug_log("Didn't find the %s file. No prob. We'll create "
                            "it when we save.", self.name)
 
+        self._build_expire_index()
+
+    def _build_expire_index(self):
+        """Index all entries with an expire time."""
+        self._expire_index = []
+        if isinstance(self.data, dict):
+            for key, value in self.data.items():
+                self._index_expire(key, value)
+
+    def _index_expire(self, key, value):
+        try:
+            expire = value['expire']
+        except (KeyError, TypeError, IndexError):
+            return
+
+        if expire:
+            heapq.heappush(self._expire_index, (expire, key))
+            # keys which are saved again leave their old entry behind. rebuild
+            # the index when most entries are stale so it does not grow forever
+            if len(self._expire_index) > 2 * len(self.data) + 16:
+                self._build_expire_index()
+
+    def get_expired_keys(self, current_time):
+        """Return the keys of all entries with an expire time before current_time.
+
+        Entries are dicts with an ``expire`` key (like machine vars). Only
+        expired entries are visited. They are removed from the index so every
+        key is returned once.
+        """
+        expired = []
+        while self._expire_index and self._expire_index[0][0] < current_time:
+            expire, key = heapq.heappop(self._expire_index)
+            try:
+                if self.data[key]['expire'] == expire:
+                    expired.append(key)
+            except (KeyError, TypeError, IndexError):
+                # entry changed or was removed since it has been indexed
+                pass
+
+        return expired
+
     def get_data(self, section=None):
         """Return the value of this DataManager's data.
 
@@ -103,6 +152,7 @@ class DataManager(MpfController):
     def save_all(self, data):
         """Update all data."""
         self.data = data
+        self._build_expire_index()
         self._trigger_save()
 
     def save_key(self, key, value):
@@ -120,6 +170,7 @@ class DataManager(MpfController):
             self.data = dict()
             self.data[key] = value
 
+        self._index_expire(key, value)
         self._trigger_save()
 
     def remove_key(self, key):
@@ -148,3 +199,223 @@ class DataManager(MpfController):
         # if dirty write data one last time during shutdown
         if self._dirty.is_set():
             FileManager.save(self.filename, data)
+
+
+class JournaledDataManager(DataManager):
+
+    """DataManager which appends changes to a write-ahead journal.
+
+    Changes are collected for ``mpf: data_manager_write_window_ms``. Only the
+    last change per key is kept. They are then appended to ``<file>.journal``
+    as one checksummed JSON record per key and fsynced. Records are
+    ``[key, value]``, ``[key]`` for removed keys and ``[]`` which clears all
+    data before save_all writes all keys. After
+    ``mpf: data_manager_snapshot_records`` records the data is written to a
+    temp file, fsynced and atomically moved over the data file. Then the
+    journal is truncated.
+
+    On boot the data file is loaded and the journal is replayed up to the
+    first torn or corrupt record. A power cut loses at most the changes of
+    the last write window but never truncates the data file.
+
+    Records are JSON. Therefore, tuples are replayed as lists and dict keys
+    as strings. The yaml data file converts dict keys to strings as well.
+    """
+
+    config_name = 'data_manager'
+
+    # marker for the record which clears all data (written by save_all)
+    _CLEAR = object()
+
+    def __init__(self, machine, name, min_wait_secs=1):
+        """Initialise journaled data manager."""
+        self.journal_filename = None
+        self._lock = threading.Lock()
+        self._pending = {}              # type: Dict[Any, bytes]
+        self._snapshot_pending = False
+        self._journal_records = 0
+        self._write_window = machine.config['mpf']['data_manager_write_window_ms'] / 1000
+        self._snapshot_records = machine.config['mpf']['data_manager_snapshot_records']
+        super().__init__(machine, name, min_wait_secs)
+
+    def _setup_file(self):
+        self.journal_filename = self.filename + ".journal"
+        super()._setup_file()
+
+    def _load(self):
+        super()._load()
+        if not isinstance(self.data, dict):
+            self.data = dict()
+
+        if os.path.isfile(self.journal_filename):
+            self._replay_journal()
+
+    def _replay_journal(self):
+        """Apply all valid records of the journal and cut off a torn record at the end."""
+        valid_length = 0
+        with open(self.journal_filename, "rb") as f:
+            for line in f:
+                record = self._decode_record(line)
+                if record is None:
+                    break
+
+                if not record:
+                    self.data = dict()
+                    self._expire_index = []
+                elif len(record) == 2:
+                    self.data[record[0]] = record[1]
+                    self._index_expire(record[0], record[1])
+                else:
+                    self.data.pop(record[0], None)
+
+                valid_length += len(line)
+                self._journal_records += 1
+
+        self.debug_log("Replayed %s records from %s", self._journal_records, self.journal_filename)
+
+        if valid_length != os.path.getsize(self.journal_filename):
+            self.warning_log("Discarding torn or corrupt records at the end of %s", self.journal_filename)
+            with open(self.journal_filename, "r+b") as f:
+                f.truncate(valid_length)
+                os.fsync(f.fileno())
+
+    @staticmethod
+    def _encode_record(record):
+        payload = json.dumps(record, separators=(",", ":")).encode()
+        return b"%08x %s\n" % (zlib.crc32(payload), payload)
+
+    @staticmethod
+    def _decode_record(line):
+        """Return the record in a journal line or None if it is torn or corrupt."""
+        if not line.endswith(b"\n"):
+            return None
+
+        try:
+            checksum, payload = line[:-1].split(b" ", 1)
+            if int(checksum, 16) != zlib.crc32(payload):
+                return None
+            record = json.loads(payload.decode())
+        except ValueError:
+            return None
+
+        return record if isinstance(record, list) else None
+
+    def _add_record(self, key, record):
+        """Add record for key to the pending records. Call with lock held."""
+        try:
+            self._pending[key] = self._encode_record(record)
+        except TypeError:
+            # value cannot be stored in the journal. write a snapshot instead
+            self._pending.pop(key, None)
+            self._snapshot_pending = True
+
+    def save_all(self, data):
+        """Update all data."""
+        with self._lock:
+            self.data = data
+            self._build_expire_index()
+            self._pending = {}
+            self._add_record(self._CLEAR, [])
+            for key, value in data.items():
+                self._add_record(key, [key, value])
+
+        self._trigger_save()
+
+    def save_key(self, key, value):
+        """Update an individual key and append it to the journal."""
+        with self._lock:
+            if not isinstance(self.data, dict):
+                self.data = dict()
+
+            self.data[key] = value
+            self._index_expire(key, value)
+            self._add_record(key, [key, value])
+
+        self._trigger_save()
+
+    def remove_key(self, key):
+        """Remove key by name."""
+        with self._lock:
+            if key not in self.data:
+                return
+
+            del self.data[key]
+            self._add_record(key, [key])
+
+        self._trigger_save()
+
+    def _writing_thread(self):  # pragma: no cover
+        # prevent early writes at start-up
+        time.sleep(self.min_wait_secs)
+        while not self.machine.thread_stopper.is_set():
+            if not self._dirty.wait(1):
+                continue
+
+            # coalesce all changes within the write window
+            time.sleep(self._write_window)
+            self._dirty.clear()
+            self._write_changes()
+
+        self._write_changes()
+
+    def _write_changes(self):
+        """Append pending records to the journal and write a snapshot if needed.
+
+        Runs in the writing thread.
+        """
+        data = None
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            snapshot, self._snapshot_pending = self._snapshot_pending, False
+            if snapshot or self._journal_records + len(pending) >= self._snapshot_records:
+                # copy under the lock so data equals journal plus pending
+                data = copy.deepcopy(self.data)
+                snapshot = True
+
+        if pending:
+            self.debug_log("Appending %s records to %s", len(pending), self.journal_filename)
+            with open(self.journal_filename, "ab") as f:
+                f.write(b"".join(pending.values()))
+                f.flush()
+                os.fsync(f.fileno())
+            self._journal_records += len(pending)
+
+        if snapshot:
+            self._write_snapshot(data)
+
+    def _write_snapshot(self, data):
+        """Atomically replace the data file and truncate the journal.
+
+        The last record per key in the journal equals the snapshot. Replaying
+        the journal over the snapshot after a crash between both steps is
+        therefore safe.
+        """
+        self.debug_log("Writing snapshot of %s to: %s", self.name, self.filename)
+        if not FileManager.initialized:
+            FileManager.init()
+
+        temp_file = os.path.join(os.path.dirname(self.filename), "_" + os.path.basename(self.filename))
+        FileManager.file_interfaces[os.path.splitext(self.filename)[1]].save(temp_file, data)
+        with open(temp_file, "rb+") as f:
+            os.fsync(f.fileno())
+        os.replace(temp_file, self.filename)
+        self._fsync_dir(os.path.dirname(self.filename))
+
+        with open(self.journal_filename, "wb") as f:
+            os.fsync(f.fileno())
+        self._journal_records = 0
+
+    @staticmethod
+    def _fsync_dir(path):
+        """Persist a rename in path. Not supported on all platforms."""
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            return
+
+        try:
+            os.fsync(fd)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
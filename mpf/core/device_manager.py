@@ -2,13 +2,15 @@
 from collections import OrderedDict
 from typing import Sized, Iterable, Container, Generic, TypeVar
 
+from mpf.core import device_monitor
 from mpf.core.utility_functions import Util
-from mpf.core.case_insensitive_dict import CaseInsensitiveDict
+from mpf.core.case_insensitive_dict import CaseInsensitiveDict, lower_key
 from mpf.core.mpf_controller import MpfController
 
 MYPY = False
 if MYPY:   # pragma: no cover
     from mpf.core.device import Device
+    from typing import Callable, Dict, List, Tuple
 
 
 class DeviceManager(MpfController):
@@ -20,6 +22,12 @@ class DeviceManager(MpfController):
         super().__init__(machine)
 
         self._monitorable_devices = {}
+        self._device_monitoring = False
+
+        # control events which are resolved when they are posted first
+        self._default_control_events = {}       # type: Dict[str, Tuple[Dict[str, Device], List[str]]]
+        self._default_collection_events = {}    # type: Dict[str, List[Callable]]
+        self._collection_control_events = {}    # type: Dict[str, Tuple[str, str]]
 
         self.collections = OrderedDict()
         self.device_classes = OrderedDict()  # collection_name: device_class
@@ -54,6 +62,21 @@ class DeviceManager(MpfController):
             self._monitorable_devices[device.collection] = {}
         self._monitorable_devices[device.collection][device.name] = device
 
+    def set_device_monitoring(self, enabled: bool):
+        """Enable or disable notifications about changes in registered devices.
+
+        Monitored attributes of all devices are only compared while at least
+        one machine in this process has monitoring enabled.
+        """
+        if enabled == self._device_monitoring:
+            return
+
+        self._device_monitoring = enabled
+        if enabled:
+            device_monitor.add_subscriber()
+        else:
+            device_monitor.remove_subscriber()
+
     def notify_device_changes(self, device, notify, old, value):
         """Notify subscribers about changes in a registered device.
 
@@ -64,6 +87,9 @@ class DeviceManager(MpfController):
             value: The new value.
 
         """
+        if not self._device_monitoring:
+            return
+
         self.machine.bcp.interface.notify_device_changes(device, notify, old, value)
 
     def _load_device_config_spec(self, **kwargs):
@@ -107,6 +133,9 @@ class DeviceManager(MpfController):
             except KeyError:
                 pass
 
+        if self._default_control_events:
+            self.machine.events.add_event_resolver(self._resolve_default_control_event)
+
         self.machine.mode_controller.create_mode_devices()
 
         # step 2: load config and validate devices
@@ -118,6 +147,7 @@ class DeviceManager(MpfController):
 
     def stop_devices(self):
         """Stop all devices in the machine."""
+        self.set_device_monitoring(False)
         for device_type in self.machine.config['mpf']['device_modules']:
             device_cls = Util.string_to_class(device_type)
             collection_name, _ = device_cls.get_config_info()
@@ -275,16 +305,30 @@ class DeviceManager(MpfController):
                     priority=int(priority))
 
     def create_collection_control_events(self, **kwargs):
-        """Create control events for collection."""
+        """Create control events for collection.
+
+        Handlers are added by _resolve_collection_control_event when an event
+        is posted for the first time.
+        """
         del kwargs
         for collection, events in iter(self.machine.config['mpf']['device_collection_control_events'].items()):
 
             for event in events:
                 event_name = collection + '_' + event
-                self.machine.events.add_handler(event_name,
-                                                self._collection_control_event_handler,
-                                                collection=collection,
-                                                method=event)
+                self._collection_control_events[event_name.lower()] = (collection, event)
+
+        self.machine.events.add_event_resolver(self._resolve_collection_control_event)
+
+    def _resolve_collection_control_event(self, event):
+        try:
+            collection, method = self._collection_control_events[event]
+        except KeyError:
+            return
+
+        self.machine.events.add_handler(event,
+                                        self._collection_control_event_handler,
+                                        collection=collection,
+                                        method=method)
 
     def _collection_control_event_handler(self, collection, method, **kwargs):
         del kwargs
@@ -298,19 +342,41 @@ class DeviceManager(MpfController):
         delay_mgr.add(ms=ms_delay, callback=callback)
 
     def _create_default_control_events(self, device_list):
+        """Remember devices for <class>_<device>_<method> and <collection>_<method> events.
+
+        Handlers are added by _resolve_default_control_event when an event
+        is posted for the first time.
+        """
         for device in device_list:
 
-            event_prefix = device.class_label + '_' + device.name + '_'
-            event_prefix2 = device.collection + '_'
+            methods = self.machine.config['mpf']['device_events'][device.config_section]
+            event_prefix = (device.class_label + '_').lower()
+            event_prefix2 = (device.collection + '_').lower()
+
+            if event_prefix not in self._default_control_events:
+                self._default_control_events[event_prefix] = ({}, methods)
+            self._default_control_events[event_prefix][0][device.name.lower()] = device
+
+            for method in methods:
+                self._default_collection_events.setdefault(event_prefix2 + method.lower(), []).append(
+                    getattr(device, method))
+
+    def _resolve_default_control_event(self, event):
+        for event_prefix, (devices, methods) in self._default_control_events.items():
+            if not event.startswith(event_prefix):
+                continue
+
+            # device names and methods may contain underscores so try all methods
+            device_and_method = event[len(event_prefix):]
+            for method in methods:
+                if not device_and_method.endswith('_' + method.lower()):
+                    continue
+                device = devices.get(device_and_method[:-len(method) - 1])
+                if device:
+                    self.machine.events.add_handler(event=event, handler=getattr(device, method))
 
-            for method in (self.machine.config['mpf']['device_events']
-                           [device.config_section]):
-                self.machine.events.add_handler(event=event_prefix + method,
-                                                handler=getattr(device,
-                                                                method))
-                self.machine.events.add_handler(event=event_prefix2 + method,
-                                                handler=getattr(device,
-                                                                method))
+        for handler in self._default_collection_events.get(event, []):
+            self.machine.events.add_handler(event=event, handler=handler)
 
 
 KT = TypeVar('KT')      # key type.
@@ -344,6 +410,10 @@ class DeviceCollection(CaseInsensitiveDict):
 
     One instance of this class will be created for each different type of
     hardware device (such as coils, lights, switches, ball devices, etc.).
+
+    Devices accessed as attributes (e.g. ``self.machine.coils.coilname``) are
+    cached as instance attributes so later accesses do not go through the
+    name lookup at all.
     """
 
     def __init__(self, machine, collection, config_section):
@@ -353,17 +423,69 @@ class DeviceCollection(CaseInsensitiveDict):
         self.machine = machine
         self.name = collection
         self.config_section = config_section
+        self._cached_attributes = set()
 
     def __getattr__(self, attr):
         """Return device by lowercase key."""
         # We use this to allow the programmer to access a hardware item like
         # self.coils.coilname
 
+        if attr.startswith('__'):
+            # do not cache or look up special names (e.g. for pickle or copy)
+            raise AttributeError(attr)
+
         try:
-            return self[attr.lower()]
+            device = self[attr]
         except KeyError:
             raise KeyError('Error: No device exists with the name:', attr)
 
+        self.__dict__[attr] = device
+        self._cached_attributes.add(attr)
+        return device
+
+    def _collection_changed(self):
+        """Drop devices which are cached as attributes. Call before every change."""
+        if not self._cached_attributes:
+            return
+        for attr in self._cached_attributes:
+            del self.__dict__[attr]
+        self._cached_attributes = set()
+
+    def __setitem__(self, key, value):
+        """Add device and invalidate cached attributes."""
+        self._collection_changed()
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key):
+        """Remove device and invalidate cached attributes."""
+        self._collection_changed()
+        super().__delitem__(key)
+
+    def pop(self, key, *args, **kwargs):
+        """Remove device and invalidate cached attributes."""
+        self._collection_changed()
+        return super().pop(key, *args, **kwargs)
+
+    def popitem(self):
+        """Remove a device and invalidate cached attributes."""
+        self._collection_changed()
+        return super().popitem()
+
+    def setdefault(self, key, *args, **kwargs):
+        """Add device if it does not exist and invalidate cached attributes."""
+        self._collection_changed()
+        return super().setdefault(key, *args, **kwargs)
+
+    def update(self, e=None, **f):
+        """Add devices and invalidate cached attributes."""
+        self._collection_changed()
+        dict.update(self, CaseInsensitiveDict(e or {}, **f))
+
+    def clear(self):
+        """Remove all devices and invalidate cached attributes."""
+        self._collection_changed()
+        super().clear()
+
     def __iter__(self):
         """Iterate collection."""
         for item in self.values():
@@ -371,7 +493,7 @@ class DeviceCollection(CaseInsensitiveDict):
 
     def __getitem__(self, key):
         """Return device by lowercase key."""
-        return super().__getitem__(self.__class__.lower(key))
+        return dict.__getitem__(self, lower_key(key))
 
     def items_tagged(self, tag):
         """Return of list of device objects which have a certain tag.
@@ -1,6 +1,110 @@
 """Decorator to monitor devices."""
 from mpf.core.utility_functions import Util
 
+_SENTINEL = object()
+
+# number of machines in this process with clients which monitor devices.
+# monitored attributes are only compared and reported while this is not zero
+_subscribers = 0
+
+
+def add_subscriber():
+    """Start notifying about changes of monitored attributes."""
+    global _subscribers     # pylint: disable-msg=global-statement
+    _subscribers += 1
+
+
+def remove_subscriber():
+    """Stop notifying about changes of monitored attributes when the last subscriber is gone."""
+    global _subscribers     # pylint: disable-msg=global-statement
+    _subscribers = max(0, _subscribers - 1)
+
+
+class MonitoredAttribute:
+
+    """Data descriptor for a monitored attribute which is stored in the instance dict.
+
+    It only implements ``__set__``. Reads are served from the instance dict by
+    Python without calling into the descriptor. Therefore, the decorated
+    ``__init__`` sets attributes which were not set to None.
+    """
+
+    __slots__ = ["name", "notify_name"]
+
+    def __init__(self, name, notify_name):
+        """Initialise descriptor."""
+        self.name = name
+        self.notify_name = notify_name
+
+    def get_value(self, instance):
+        """Return value of instance or None if it has not been set."""
+        return instance.__dict__.get(self.name)
+
+    def __set__(self, instance, value):
+        """Set value and notify subscribers if it changed."""
+        if not _subscribers:
+            instance.__dict__[self.name] = value
+            return
+
+        old = instance.__dict__.get(self.name, _SENTINEL)
+        instance.__dict__[self.name] = value
+        if old is not _SENTINEL and old != value:
+            instance.machine.device_manager.notify_device_changes(instance, self.notify_name, old, value)
+
+
+class MonitoredProperty(MonitoredAttribute):
+
+    """Data descriptor for a monitored attribute which is defined on the class.
+
+    Reads and writes are passed to the property (or any other data
+    descriptor) it replaces. A plain class attribute is used as default.
+    """
+
+    __slots__ = ["inner", "default"]
+
+    def __init__(self, name, notify_name, inner, default):
+        """Initialise descriptor."""
+        super().__init__(name, notify_name)
+        self.inner = inner
+        self.default = default
+
+    def __get__(self, instance, owner):
+        """Return value of instance."""
+        if instance is None:
+            return self
+        if self.inner is not None:
+            return self.inner.__get__(instance, owner)
+        try:
+            return instance.__dict__[self.name]
+        except KeyError:
+            if self.default is _SENTINEL:
+                raise AttributeError(self.name)
+            return self.default
+
+    def get_value(self, instance):
+        """Return value of instance."""
+        return self.__get__(instance, type(instance))
+
+    def _set(self, instance, value):
+        if self.inner is not None:
+            self.inner.__set__(instance, value)
+        else:
+            instance.__dict__[self.name] = value
+
+    def __set__(self, instance, value):
+        """Set value and notify subscribers if it changed."""
+        if not _subscribers:
+            self._set(instance, value)
+            return
+
+        try:
+            old = self.__get__(instance, type(instance))
+        except AttributeError:
+            old = _SENTINEL
+        self._set(instance, value)
+        if old is not _SENTINEL and old != value:
+            instance.machine.device_manager.notify_device_changes(instance, self.notify_name, old, value)
+
 
 class DeviceMonitor:
 
@@ -11,54 +115,57 @@ class DeviceMonitor:
         self._attributes_to_monitor = attributes_to_monitor
         self._aliased_attributes_to_monitor = aliased_attributes_to_monitor
 
+    @staticmethod
+    def _create_descriptor(cls, name, notify_name):
+        """Return a descriptor for name which replaces any existing class attribute."""
+        for klass in cls.__mro__:
+            if name not in klass.__dict__:
+                continue
+
+            existing = klass.__dict__[name]
+            if isinstance(existing, MonitoredProperty):
+                # monitored in a base class already
+                return MonitoredProperty(name, notify_name, existing.inner, existing.default)
+            if isinstance(existing, MonitoredAttribute):
+                return MonitoredAttribute(name, notify_name)
+            if hasattr(existing, "__set__"):
+                return MonitoredProperty(name, notify_name, existing, _SENTINEL)
+            return MonitoredProperty(name, notify_name, None, existing)
+
+        return MonitoredAttribute(name, notify_name)
+
     def __call__(self, cls):
         """Decorate class."""
-        _sentinel = object()
-
+        descriptors = []
+        for name in self._attributes_to_monitor:
+            descriptors.append((name, self._create_descriptor(cls, name, name)))
+        for name, notify_name in self._aliased_attributes_to_monitor.items():
+            descriptors.append((notify_name, self._create_descriptor(cls, name, notify_name)))
+
+        for _, descriptor in descriptors:
+            setattr(cls, descriptor.name, descriptor)
+
+        # without a value the descriptor itself would be returned on reads
+        unset_names = [descriptor.name for _, descriptor in descriptors
+                       if not isinstance(descriptor, MonitoredProperty)]
         old_init = getattr(cls, '__init__', None)
 
         def __init__(self_inner, *args, **kwargs):  # noqa
             """Register class."""
             old_init(self_inner, *args, **kwargs)
+            for name in unset_names:
+                self_inner.__dict__.setdefault(name, None)
             self_inner.machine.device_manager.register_monitorable_device(self_inner)
 
-        old_setattr = getattr(cls, '__setattr__', None)
-
-        # pylint: disable-msg=
-        def __setattr__(self_inner, name, value):   # noqa
-            """If the value changed notify subscribers."""
-            attribute_name = False
-            if name in self._attributes_to_monitor:
-                old = getattr(self_inner, name, _sentinel)
-                if old is not _sentinel and old != value:
-                    attribute_name = name
-            elif name in self._aliased_attributes_to_monitor:
-                old = getattr(self_inner, name, _sentinel)
-                if old is not _sentinel and old != value:
-                    attribute_name = self._aliased_attributes_to_monitor[name]
-
-            if old_setattr:
-                old_setattr(self_inner, name, value)
-            else:
-                # Old-style class
-                self_inner.__dict__[name] = value
-
-            if attribute_name:
-                self_inner.machine.device_manager.notify_device_changes(self_inner, attribute_name, old, value)
-
         def get_monitorable_state(self_inner):
             """Return monitorable state of device."""
             state = {}
-            for attribute in self._attributes_to_monitor:
-                state[attribute] = Util.convert_to_simply_type(getattr(self_inner, attribute))
-
-            for attribute, name in self._aliased_attributes_to_monitor.items():
-                state[name] = Util.convert_to_simply_type(getattr(self_inner, attribute))
+            for notify_name, descriptor in descriptors:
+                state[notify_name] = Util.convert_to_simply_type(descriptor.get_value(self_inner))
 
             return state
 
         cls.__init__ = __init__
-        cls.__setattr__ = __setattr__
         cls.get_monitorable_state = get_monitorable_state
 
         return cls
@@ -0,0 +1,77 @@
+"""Binary ring buffer which traces events."""
+import struct
+
+MYPY = False
+if MYPY:   # pragma: no cover
+    from typing import Callable, Dict, List, Optional, Tuple
+
+
+class EventTrace(object):
+
+    """Fixed size ring buffer of event records.
+
+    Records are packed into a preallocated bytearray and event names are
+    interned into a table the first time they are seen. Recording an event
+    does not format any strings or allocate new containers so the trace can
+    stay enabled on a production machine and be dumped after a crash.
+    """
+
+    __slots__ = ["size", "_get_time", "_buffer", "_position", "_count", "_names", "_name_index"]
+
+    POST = 0
+    PROCESS = 1
+    KINDS = ("post", "process")
+
+    EV_TYPES = (None, "boolean", "queue", "relay")
+    _EV_TYPE_INDEX = {ev_type: index for index, ev_type in enumerate(EV_TYPES)}
+
+    # time, event name index, kind, event type
+    _RECORD = struct.Struct("<dIBB")
+
+    def __init__(self, size: int, get_time: "Callable[[], float]") -> None:
+        """Initialise trace with room for size records."""
+        self.size = size
+        self._get_time = get_time
+        self._buffer = bytearray(size * self._RECORD.size)
+        self._position = 0
+        self._count = 0
+        self._names = []                # type: List[str]
+        self._name_index = {}           # type: Dict[str, int]
+
+    def add(self, kind: int, event: str, ev_type: "Optional[str]" = None) -> None:
+        """Record an event."""
+        try:
+            name = self._name_index[event]
+        except KeyError:
+            name = self._name_index[event] = len(self._names)
+            self._names.append(event)
+
+        self._RECORD.pack_into(self._buffer, self._position * self._RECORD.size, self._get_time(), name, kind,
+                               self._EV_TYPE_INDEX.get(ev_type, 0))
+        self._position += 1
+        if self._position == self.size:
+            self._position = 0
+        if self._count < self.size:
+            self._count += 1
+
+    def clear(self) -> None:
+        """Remove all records."""
+        self._position = 0
+        self._count = 0
+
+    def get_records(self) -> "List[Tuple[float, str, str, Optional[str]]]":
+        """Return all records as (time, kind, event, ev_type) with the oldest first."""
+        first = (self._position - self._count) % self.size if self.size else 0
+        records = []
+        for index in range(self._count):
+            timestamp, name, kind, ev_type = self._RECORD.unpack_from(
+                self._buffer, ((first + index) % self.size) * self._RECORD.size)
+            records.append((timestamp, self.KINDS[kind], self._names[name], self.EV_TYPES[ev_type]))
+
+        return records
+
+    def dump(self, file_name: str) -> None:
+        """Write all records as text to a file."""
+        with open(file_name, "w") as f:
+            for timestamp, kind, event, ev_type in self.get_records():
+                f.write("{:.6f} {:7} {} {}\n".format(timestamp, kind, event, ev_type or ""))
@@ -1,6 +1,8 @@
 """Classes for the EventManager and QueuedEvents."""
 import inspect
-from collections import deque, namedtuple
+import os
+from collections import ChainMap, deque, namedtuple
+from time import perf_counter
 import uuid
 
 import asyncio
@@ -10,13 +12,15 @@ from unittest.mock import MagicMock
 
 from typing import Dict, Any, Tuple, Optional, Generator, Callable, List
 
+from mpf.core.event_trace import EventTrace
 from mpf.core.mpf_controller import MpfController
+from mpf.core.profiler import Profiler
 
 MYPY = False
 if MYPY:   # pragma: no cover
     from mpf.core.machine import MachineController
     from mpf.core.placeholder_manager import BaseTemplate
-    from typing import Deque
+    from typing import Deque, Set
 
 EventHandlerKey = namedtuple("EventHandlerKey", ["key", "event"])
 RegisteredHandler = namedtuple("RegisteredHandler", ["callback", "priority", "kwargs", "key", "condition",
@@ -37,6 +41,62 @@ class EventManager(MpfController):
         self.callback_queue = deque([])     # type: Deque[Tuple[Any, dict]]
         self.monitor_events = False
         self._queue_tasks = []              # type: List[asyncio.Task]
+        self._event_resolvers = []          # type: List[Callable[[str], None]]
+        self._resolved_events = set()       # type: Set[str]
+        self._handler_batch_depth = 0
+        self._handler_batch_events = set()  # type: Set[str]
+        self._handler_batch_removals = {}   # type: Dict[str, Set[uuid.UUID]]
+        self._verified_callables = {}       # type: Dict[Any, bool]
+
+        self.event_trace = None             # type: Optional[EventTrace]
+        trace_size = self.machine.config['mpf'].get('event_trace_size', 0)
+        if trace_size:
+            self.event_trace = EventTrace(trace_size, self.machine.clock.get_time)
+            self.add_handler('dump_event_trace', self._dump_event_trace)
+
+        self.profiler = None                # type: Optional[Profiler]
+        if self.machine.config['mpf'].get('profiler', False):
+            self.enable_profiler()
+
+    def enable_profiler(self) -> Profiler:
+        """Start recording handler and clock callback latencies.
+
+        Returns the active profiler. The clock shares the same profiler.
+        """
+        if not self.profiler:
+            self.profiler = Profiler()
+            self.machine.clock.enable_profiler(self.profiler)
+
+        return self.profiler
+
+    def disable_profiler(self) -> None:
+        """Stop recording and drop all profiler data."""
+        if not self.profiler:
+            return
+
+        self.profiler = None
+        self.machine.clock.disable_profiler()
+
+    def _dump_event_trace(self, **kwargs):
+        del kwargs
+        self.dump_event_trace()
+
+    def dump_event_trace(self, file_name: str = None) -> Optional[str]:
+        """Write the event trace to a file and return the file name.
+
+        The trace is only recorded when ``event_trace_size`` in the ``mpf:``
+        section is set. Posting ``dump_event_trace`` will also write it.
+        """
+        if not self.event_trace:
+            return None
+
+        if not file_name:
+            file_name = os.path.join(self.machine.machine_path, self.machine.config['mpf']['paths']['event_trace'])
+            os.makedirs(os.path.dirname(file_name), exist_ok=True)
+
+        self.info_log("Writing event trace to %s", file_name)
+        self.event_trace.dump(file_name)
+        return file_name
 
     def get_event_and_condition_from_string(self, event_string: str) -> Tuple[str, Optional["BaseTemplate"]]:
         """Parse an event string to divide the event name from a possible placeholder / conditional in braces.
@@ -120,14 +180,7 @@ class EventManager(MpfController):
                              'accidentally add parenthesis to the end of the '
                              'handler you passed?'.format(handler, event))
 
-        sig = inspect.signature(handler)
-        if 'kwargs' not in sig.parameters:
-            raise AssertionError("Handler {} for event '{}' is missing **kwargs. Actual signature: {}".format(
-                handler, event, sig))
-
-        if sig.parameters['kwargs'].kind != inspect.Parameter.VAR_KEYWORD:
-            raise AssertionError("Handler {} for event '{}' param kwargs is missing '**'. Actual signature: {}".format(
-                handler, event, sig))
+        self._verify_handler_signature(event, handler)
 
         event, condition = self.get_event_and_condition_from_string(event)
 
@@ -145,13 +198,52 @@ class EventManager(MpfController):
         self.registered_handlers[event].append(RegisteredHandler(handler, priority, kwargs, key, condition,
                                                                  blocking_facility))
 
-        try:
-            self.debug_log("Registered %s as a handler for '%s', priority: %s, "
-                           "kwargs: %s",
-                           (str(handler).split(' '))[2], event, priority, kwargs)
-        except IndexError:
-            pass
+        if self._debug_level:
+            try:
+                self.debug_log("Registered %s as a handler for '%s', priority: %s, "
+                               "kwargs: %s",
+                               (str(handler).split(' '))[2], event, priority, kwargs)
+            except IndexError:
+                pass
+
+        if self._handler_batch_depth:
+            # sort and verify once when the batch finishes
+            self._handler_batch_events.add(event)
+        else:
+            self._sort_and_verify_handlers(event)
+
+        return EventHandlerKey(key, event)
+
+    def _verify_handler_signature(self, event: str, handler: Any) -> None:
+        """Check that handler accepts **kwargs.
 
+        Results are cached during a handler batch because the same callable
+        (e.g. ``config_play_callback``) is usually added many times.
+        """
+        if self._handler_batch_depth:
+            try:
+                if handler in self._verified_callables:
+                    return
+            except TypeError:
+                # unhashable callable
+                pass
+
+        sig = inspect.signature(handler)
+        if 'kwargs' not in sig.parameters:
+            raise AssertionError("Handler {} for event '{}' is missing **kwargs. Actual signature: {}".format(
+                handler, event, sig))
+
+        if sig.parameters['kwargs'].kind != inspect.Parameter.VAR_KEYWORD:
+            raise AssertionError("Handler {} for event '{}' param kwargs is missing '**'. Actual signature: {}".format(
+                handler, event, sig))
+
+        if self._handler_batch_depth:
+            try:
+                self._verified_callables[handler] = True
+            except TypeError:
+                pass
+
+    def _sort_and_verify_handlers(self, event: str) -> None:
         # Sort the handlers for this event based on priority. We do it now
         # so the list is pre-sorted so we don't have to do that with each
         # event post.
@@ -160,7 +252,36 @@ class EventManager(MpfController):
         if self._info_to_console or self._info_to_file or True:
             self._verify_handlers(event, self.registered_handlers[event])
 
-        return EventHandlerKey(key, event)
+    def start_handler_batch(self) -> None:
+        """Start a batch of handler registrations and removals.
+
+        Until the matching ``finish_handler_batch`` call, ``add_handler``
+        appends handlers without sorting and verifying the handler list of
+        the event each time, signatures are only inspected once per callable
+        and ``remove_handlers_by_keys`` only collects the keys. Batches may be
+        nested. Events must not be processed while a batch is open which is
+        the case for any synchronous code path (e.g. mode start and stop).
+        """
+        self._handler_batch_depth += 1
+
+    def finish_handler_batch(self) -> None:
+        """Sort and verify all touched events and remove collected keys in one pass per event."""
+        self._handler_batch_depth -= 1
+        if self._handler_batch_depth:
+            return
+
+        removals = self._handler_batch_removals
+        self._handler_batch_removals = {}
+        for event, keys in removals.items():
+            self._remove_handler_keys(event, keys)
+
+        events = self._handler_batch_events
+        self._handler_batch_events = set()
+        for event in events:
+            if event in self.registered_handlers:
+                self._sort_and_verify_handlers(event)
+
+        self._verified_callables = {}
 
     def _verify_handlers(self, event, sorted_handlers):
         """Verify that no races can happen."""
@@ -248,7 +369,8 @@ class EventManager(MpfController):
             for handler_tup in handler_list[:]:  # copy via slice
                 if handler_tup[0] == method:
                     handler_list.remove(handler_tup)
-                    self.debug_log("Removing method %s from event %s", (str(method).split(' '))[2], event)
+                    if self._debug_level:
+                        self.debug_log("Removing method %s from event %s", (str(method).split(' '))[2], event)
                     events_to_delete_if_empty.append(event)
 
         for event in events_to_delete_if_empty:
@@ -275,7 +397,8 @@ class EventManager(MpfController):
             for handler_tup in self.registered_handlers[event][:]:
                 if handler_tup[0] == handler:
                     self.registered_handlers[event].remove(handler_tup)
-                    self.debug_log("Removing method %s from event %s", (str(handler).split(' '))[2], event)
+                    if self._debug_level:
+                        self.debug_log("Removing method %s from event %s", (str(handler).split(' '))[2], event)
                     events_to_delete_if_empty.append(event)
 
         for this_event in events_to_delete_if_empty:
@@ -293,7 +416,9 @@ class EventManager(MpfController):
         for handler_tup in self.registered_handlers[key.event][:]:  # copy via slice
             if handler_tup.key == key.key:
                 self.registered_handlers[key.event].remove(handler_tup)
-                self.debug_log("Removing method %s from event %s", (str(handler_tup[0]).split(' '))[2], key.event)
+                if self._debug_level:
+                    self.debug_log("Removing method %s from event %s", (str(handler_tup[0]).split(' '))[2],
+                                   key.event)
                 events_to_delete_if_empty.append(key.event)
         for event in events_to_delete_if_empty:
             self._remove_event_if_empty(event)
@@ -304,8 +429,39 @@ class EventManager(MpfController):
         Args:
             key_list: A list of keys of the handlers you want to remove
         """
+        if self._handler_batch_depth:
+            removals = self._handler_batch_removals
+        else:
+            removals = {}
+
         for key in key_list:
-            self.remove_handler_by_key(key)
+            try:
+                removals[key.event].add(key.key)
+            except KeyError:
+                removals[key.event] = {key.key}
+
+        if not self._handler_batch_depth:
+            for event, keys in removals.items():
+                self._remove_handler_keys(event, keys)
+
+    def _remove_handler_keys(self, event: str, keys: "Set[uuid.UUID]") -> None:
+        """Remove all handlers with keys from event in one pass."""
+        handlers = self.registered_handlers.get(event)
+        if not handlers:
+            return
+
+        remaining = [handler for handler in handlers if handler.key not in keys]
+        if len(remaining) == len(handlers):
+            return
+
+        if self._debug_level:
+            for handler in handlers:
+                if handler.key in keys:
+                    self.debug_log("Removing method %s from event %s", (str(handler.callback).split(' '))[2], event)
+
+        # modify in place in case someone iterates over this list
+        handlers[:] = remaining
+        self._remove_event_if_empty(event)
 
     def _remove_event_if_empty(self, event: str) -> None:
         # Checks to see if the event doesn't have any more registered handlers,
@@ -342,6 +498,31 @@ class EventManager(MpfController):
             return
         _future.set_result(kwargs)
 
+    def add_event_resolver(self, resolver: Callable[[str], None]) -> None:
+        """Add a resolver which registers handlers for an event on demand.
+
+        Resolvers are used for large families of events which follow a naming
+        pattern (e.g. ``<class>_<device>_<method>``) and of which only a few
+        are ever posted. Instead of registering a handler for every possible
+        event upfront, every resolver is called once with the name of each
+        distinct event when it is posted the first time. The resolver may then
+        add handlers for that event using ``add_handler``. The result is
+        cached so resolvers never see the same event twice.
+
+        Args:
+            resolver: Callable which accepts the (lowercase) event name.
+        """
+        self._event_resolvers.append(resolver)
+        # the new resolver did not see events which have been posted before
+        for event in self._resolved_events:
+            resolver(event)
+
+    def _resolve_event(self, event: str) -> None:
+        """Run all resolvers for an event which has not been seen before."""
+        self._resolved_events.add(event)
+        for resolver in self._event_resolvers:
+            resolver(event)
+
     def does_event_exist(self, event_name: str) -> bool:
         """Check to see if any handlers are registered for the event name that is passed.
 
@@ -352,7 +533,25 @@ class EventManager(MpfController):
         Returns:
             True or False
         """
-        return event_name.lower() in self.registered_handlers
+        event_name = event_name.lower()
+        if self._event_resolvers and event_name not in self._resolved_events:
+            self._resolve_event(event_name)
+        return event_name in self.registered_handlers
+
+    def is_event_observed(self, event: str) -> bool:
+        """Return true if posting the lowercase event would have any effect.
+
+        This is the case if there are handlers for the event, when events are
+        monitored via BCP or traced, or when event posts are logged. Callers
+        which post the same events very often (e.g. player variables) use
+        this to skip building kwargs for events nobody observes.
+        """
+        if self.monitor_events or self.event_trace or self._info_level:
+            return True
+
+        if self._event_resolvers and event not in self._resolved_events:
+            self._resolve_event(event)
+        return event in self.registered_handlers
 
     @staticmethod
     def _set_result(_future, **kwargs):
@@ -515,10 +714,16 @@ class EventManager(MpfController):
 
         event = event.lower()
 
-        if self._debug_to_console or self._debug_to_file:
+        if self._event_resolvers and event not in self._resolved_events:
+            self._resolve_event(event)
+
+        if self.event_trace:
+            self.event_trace.add(EventTrace.POST, event, ev_type)
+
+        if self._debug_level:
             self.debug_log("Event: ===='%s'==== Type: %s, Callback: %s, "
                            "Args: %s", event, ev_type, callback, kwargs)
-        else:
+        elif self._info_level:
             self.info_log("Event: ======'%s'====== Args=%s", event, kwargs)
 
         # fast path for events without handler
@@ -534,11 +739,12 @@ class EventManager(MpfController):
             self.machine.bcp.interface.monitor_posted_event(posted_event)
 
         self.event_queue.append(posted_event)
-        self.debug_log("+============= EVENTS QUEUE =============")
-        for this_event in list(self.event_queue):    # type: ignore
-            self.debug_log("| %s, %s, %s, %s", this_event[0], this_event[1],
-                           this_event[2], this_event[3])
-        self.debug_log("+========================================")
+        if self._debug_level:
+            self.debug_log("+============= EVENTS QUEUE =============")
+            for this_event in list(self.event_queue):    # type: ignore
+                self.debug_log("| %s, %s, %s, %s", this_event[0], this_event[1],
+                               this_event[2], this_event[3])
+            self.debug_log("+========================================")
 
     @asyncio.coroutine
     def _run_handlers_sequential(self, event: str, callback, kwargs: dict) -> Generator[int, None, None]:
@@ -555,31 +761,34 @@ class EventManager(MpfController):
             # use slice above so we don't process new handlers that came
             # in while we were processing previous handlers
 
-            # merge the post's kwargs with the registered handler's kwargs
-            # in case of conflict, handlers kwargs will win
-            merged_kwargs = dict(list(kwargs.items()) + list(handler.kwargs.items()))
-
             # if condition exists and is not true skip
-            if handler.condition is not None and not handler.condition.evaluate(merged_kwargs):
+            if handler.condition is not None and not self._evaluate_condition(handler, kwargs):
                 continue
 
+            merged_kwargs = self._merge_kwargs(handler, kwargs)
+
             # log if debug is enabled and this event is not the timer tick
-            try:
+            if self._debug_level:
                 self.debug_log("%s (priority: %s) responding to event '%s'"
                                " with args %s",
                                (str(handler.callback).split(' ')), handler.priority,
                                event, merged_kwargs)
-            except IndexError:
-                pass
 
             # call the handler and save the results
 
-            try:
-                queue = merged_kwargs.pop('queue')
-            except KeyError:
+            profiler = self.profiler
+            if profiler:
+                start = perf_counter()
+
+            if 'queue' in merged_kwargs:
+                queue = merged_kwargs['queue']
+                handler.callback(**merged_kwargs)
+            else:
                 queue = QueuedEvent(self.debug_log)
+                handler.callback(queue=queue, **merged_kwargs)
 
-            handler.callback(queue=queue, **merged_kwargs)
+            if profiler:
+                profiler.record_handler(handler.callback, perf_counter() - start)
 
             if queue.waiter:
                 queue.event = asyncio.Event(loop=self.machine.clock.loop)
@@ -594,6 +803,7 @@ class EventManager(MpfController):
     def _run_handlers(self, event: str, ev_type: Optional[str], kwargs: dict) -> Any:
         """Run all handlers for an event."""
         result = None
+        profiler = self.profiler
         for handler in self.registered_handlers[event][:]:
             # use slice above so we don't process new handlers that came
             # in while we were processing previous handlers
@@ -604,24 +814,25 @@ class EventManager(MpfController):
                     kwargs['_min_priority'][handler.blocking_facility] > handler.priority)):
                 continue
 
-            # merge the post's kwargs with the registered handler's kwargs
-            # in case of conflict, handler kwargs will win
-            merged_kwargs = dict(list(kwargs.items()) + list(handler.kwargs.items()))
-
             # if condition exists and is not true skip
-            if handler.condition is not None and not handler.condition.evaluate(merged_kwargs):
+            if handler.condition is not None and not self._evaluate_condition(handler, kwargs):
                 continue
 
-            try:
+            merged_kwargs = self._merge_kwargs(handler, kwargs)
+
+            if self._debug_level:
                 self.debug_log("%s (priority: %s) responding to event '%s'"
                                " with args %s",
                                (str(handler.callback).split(' ')), handler.priority,
                                event, merged_kwargs)
-            except IndexError:
-                pass
 
             # call the handler and save the results
-            result = handler.callback(**merged_kwargs)
+            if profiler:
+                start = perf_counter()
+                result = handler.callback(**merged_kwargs)
+                profiler.record_handler(handler.callback, perf_counter() - start)
+            else:
+                result = handler.callback(**merged_kwargs)
 
             # If whatever handler we called returns False, we stop
             # processing the remaining handlers for boolean or queue events
@@ -639,8 +850,32 @@ class EventManager(MpfController):
 
         return result
 
+    @staticmethod
+    def _merge_kwargs(handler: RegisteredHandler, kwargs: dict) -> dict:
+        """Merge the post's kwargs with the registered handler's kwargs.
+
+        In case of conflict, handler kwargs will win. Most handlers do not
+        bind kwargs so they get the post's kwargs without a copy. Handlers
+        never see this dict itself because they are called with ``**``.
+        """
+        if not handler.kwargs:
+            return kwargs
+
+        return dict(kwargs, **handler.kwargs)
+
+    @staticmethod
+    def _evaluate_condition(handler: RegisteredHandler, kwargs: dict) -> bool:
+        """Evaluate the condition of a handler without merging kwargs."""
+        if not handler.kwargs:
+            return handler.condition.evaluate(kwargs)
+
+        return handler.condition.evaluate(ChainMap(handler.kwargs, kwargs))
+
     def _process_queue_event(self, event: str, callback, **kwargs: dict):
         """Handle queue events."""
+        if self.event_trace:
+            self.event_trace.add(EventTrace.PROCESS, event, "queue")
+
         if event not in self.registered_handlers:
             # fast path if there are not handlers
             self.callback_queue.append((callback, kwargs))
@@ -658,12 +893,20 @@ class EventManager(MpfController):
         # Internal method which actually handles the events. Don't call this.
 
         result = None
+        if self.event_trace:
+            self.event_trace.add(EventTrace.PROCESS, event, ev_type)
+
         self.debug_log("^^^^ Processing event '%s'. Type: %s, Callback: %s,"
                        " Args: %s", event, ev_type, callback, kwargs)
 
         # Now let's call the handlers one-by-one, including any kwargs
         if event in self.registered_handlers:
-            result = self._run_handlers(event, ev_type, kwargs)
+            if self.profiler:
+                start = perf_counter()
+                result = self._run_handlers(event, ev_type, kwargs)
+                self.profiler.record_event(event, perf_counter() - start)
+            else:
+                result = self._run_handlers(event, ev_type, kwargs)
 
         self.debug_log("vvvv Finished event '%s'. Type: %s. Callback: %s. "
                        "Args: %s", event, ev_type, callback, kwargs)
@@ -685,6 +928,8 @@ class EventManager(MpfController):
             # first process all events. if they post more events we will
             # process them in the same loop.
             while self.event_queue:
+                if self.profiler:
+                    self.profiler.record_queue_depth(len(self.event_queue))
                 event = self.event_queue.popleft()
                 if event.type == "queue":
                     self._process_queue_event(event=event[0],
@@ -1,6 +1,6 @@
 """Handles all light updates."""
 import asyncio
-from typing import Dict
+from typing import Dict, Set
 
 from mpf.core.machine import MachineController
 from mpf.core.settings_controller import SettingEntry
@@ -9,6 +9,10 @@ from mpf.core.rgb_color import RGBColorCorrectionProfile, RGBColor
 
 from mpf.core.mpf_controller import MpfController
 
+MYPY = False
+if MYPY:   # pragma: no cover
+    from mpf.core.platform import LightsPlatform
+
 
 class LightController(MpfController):
 
@@ -26,6 +30,11 @@ class LightController(MpfController):
 
         self._monitor_update_task = None                    # type: asyncio.Task
 
+        # light transactions. platforms are synced once when the outermost
+        # batch ends
+        self._batch_depth = 0
+        self._dirty_platforms = set()                       # type: Set[LightsPlatform]
+
         if 'named_colors' in self.machine.config:
             self._load_named_colors()
 
@@ -70,6 +79,31 @@ class LightController(MpfController):
         self.machine.settings.add_setting(SettingEntry("brightness", "Brightness", 100, "brightness", 1.0,
                                                        {0.25: "25%", 0.5: "50%", 0.75: "75%", 1.0: "100% (default)"}))
 
+    def begin_batch(self):
+        """Start a batch of light updates.
+
+        Platforms will not be synced until the matching call to end_batch.
+        Batches may be nested.
+        """
+        self._batch_depth += 1
+
+    def end_batch(self):
+        """End a batch of light updates and sync all platforms with changed lights once."""
+        self._batch_depth -= 1
+        if self._batch_depth > 0:
+            return
+
+        while self._dirty_platforms:
+            self._dirty_platforms.pop().light_sync()
+
+    def light_sync(self, platforms):
+        """Sync platforms after a light changed or defer the sync when a batch is active."""
+        if self._batch_depth:
+            self._dirty_platforms.update(platforms)
+        else:
+            for platform in platforms:
+                platform.light_sync()
+
     def monitor_lights(self):
         """Update the color of lights for the monitor."""
         if not self._monitor_update_task:
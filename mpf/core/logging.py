@@ -4,14 +4,31 @@ import logging
 MYPY = False
 if MYPY:   # pragma: no cover
     from logging import Logger
+    from typing import Optional
 
 
 class LogMixin(object):
 
-    """Mixin class to add smart logging functionality to modules."""
+    """Mixin class to add smart logging functionality to modules.
+
+    configure_logging() resolves the python log level used for debug and info
+    messages once. A disabled level is stored as None so disabled log calls
+    only cost one attribute check. Callers which need expensive arguments
+    should check ``_debug_level`` or ``_info_level`` before building them.
+    """
 
     unit_test = False
 
+    # 0 means that logging has not been configured yet. None means disabled.
+    _debug_level = 0    # type: Optional[int]
+    _info_level = 0     # type: Optional[int]
+
+    # defaults for classes which call configure_logging() without __init__()
+    _info_to_console = False
+    _debug_to_console = False
+    _info_to_file = False
+    _debug_to_file = False
+
     def __init__(self) -> None:
         """Initialise Log Mixin."""
         self.log = None     # type: Logger
@@ -55,19 +72,36 @@ class LogMixin(object):
         if self.unit_test:
             self._info_to_console = True
 
+        if self._debug_to_console:
+            self._debug_level = 20
+        elif self._debug_to_file:
+            self._debug_level = 11
+        else:
+            self._debug_level = None
+
+        if self._info_to_console or self._debug_to_console:
+            self._info_level = 20
+        elif self._info_to_file or self._debug_to_file:
+            self._info_level = 11
+        else:
+            self._info_level = None
+
     def debug_log(self, msg: str, *args, **kwargs) -> None:
         """Log a message at the debug level.
 
         Note that whether this message shows up in the console or log file is
         controlled by the settings used with configure_logging().
         """
-        if not hasattr(self, 'log'):
-            self._logging_not_configured()
+        level = self._debug_level
+        if level is None:
+            return
+        if not level:
+            # configure_logging() was not called
+            if not hasattr(self, 'log'):
+                self._logging_not_configured()
+            return
 
-        if self._debug_to_console:
-            self.log.log(20, msg, *args, **kwargs)
-        elif self._debug_to_file:
-            self.log.log(11, msg, *args, **kwargs)
+        self.log.log(level, msg, *args, **kwargs)
 
     def info_log(self, msg: str, *args, **kwargs) -> None:
         """Log a message at the info level.
@@ -75,13 +109,16 @@ class LogMixin(object):
         Whether this message shows up in the console or log file is controlled
         by the settings used with configure_logging().
         """
-        if not self.log:
-            self._logging_not_configured()
-
-        if self._info_to_console or self._debug_to_console:
-            self.log.log(20, msg, *args, **kwargs)
-        elif self._info_to_file or self._debug_to_file:
-            self.log.log(11, msg, *args, **kwargs)
+        level = self._info_level
+        if level is None:
+            return
+        if not level:
+            # configure_logging() was not called
+            if not self.log:
+                self._logging_not_configured()
+            return
+
+        self.log.log(level, msg, *args, **kwargs)
 
     def warning_log(self, msg: str, *args, **kwargs) -> None:
         """Log a message at the warning level.
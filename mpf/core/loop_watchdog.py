@@ -0,0 +1,126 @@
+"""Watchdog which detects a blocked or lagging event loop."""
+import sys
+import threading
+import traceback
+from collections import deque
+from time import perf_counter
+
+from mpf.core.mpf_controller import MpfController
+
+MYPY = False
+if MYPY:   # pragma: no cover
+    from typing import Optional, Deque
+    from mpf.core.machine import MachineController
+
+
+class LoopWatchdog(MpfController):
+
+    """Measures loop lag and captures the stack of callbacks which block the loop.
+
+    A probe runs on the loop every ``mpf: loop_watchdog_probe_ms`` and counts
+    an overrun whenever it runs more than ``mpf: loop_watchdog_ms`` late. A
+    daemon thread checks the heartbeat of the probe. When the loop has been
+    blocked for longer than the threshold the thread samples the stack of the
+    loop thread, which points at the offending callback, and logs it. The
+    report is sent to BCP clients monitoring ``loop_watchdog`` as soon as the
+    loop recovers.
+
+    The watchdog is disabled when ``mpf: loop_watchdog_ms`` is 0. When enabled
+    it costs one probe per interval on the loop and one thread wakeup, so it
+    can stay on in production.
+    """
+
+    # number of stall reports kept for get_stats
+    MAX_STALLS = 10
+
+    def __init__(self, machine: "MachineController") -> None:
+        """Initialise loop watchdog."""
+        super().__init__(machine)
+        self.threshold = self.machine.config['mpf'].get('loop_watchdog_ms', 0) / 1000
+        self.probe_interval = self.machine.config['mpf'].get('loop_watchdog_probe_ms', 10) / 1000
+
+        self.probes = 0
+        self.overruns = 0
+        self.max_lag = 0.0
+        self.stalls = deque(maxlen=self.MAX_STALLS)     # type: Deque[dict]
+
+        self._heartbeat = perf_counter()
+        self._stall_captured = False
+        self._pending_stalls = deque()                  # type: Deque[dict]
+        self._loop_thread_id = threading.get_ident()
+        self._thread = None                             # type: Optional[threading.Thread]
+
+        if self.threshold > 0:
+            self.start()
+
+    def start(self) -> None:
+        """Start the probe and the watchdog thread."""
+        self._loop_thread_id = threading.get_ident()
+        self._heartbeat = perf_counter()
+        self._schedule_probe()
+
+        self._thread = threading.Thread(target=self._watchdog_thread, name="loop_watchdog")
+        self._thread.daemon = True
+        self._thread.start()
+
+    def _schedule_probe(self) -> None:
+        scheduled_time = self.machine.clock.loop.time() + self.probe_interval
+        self.machine.clock.loop.call_at(scheduled_time, self._probe, scheduled_time)
+
+    def _probe(self, scheduled_time: float) -> None:
+        """Measure lag of this probe and deliver stall reports of the watchdog thread."""
+        lag = self.machine.clock.loop.time() - scheduled_time
+        self.probes += 1
+        if lag > self.max_lag:
+            self.max_lag = lag
+        if lag > self.threshold:
+            self.overruns += 1
+
+        self._heartbeat = perf_counter()
+        self._stall_captured = False
+
+        while self._pending_stalls:
+            self._send_stall(self._pending_stalls.popleft())
+
+        self._schedule_probe()
+
+    def _watchdog_thread(self) -> None:     # pragma: no cover
+        while not self.machine.thread_stopper.wait(self.probe_interval):
+            self._check_stall()
+
+    def _check_stall(self) -> None:
+        """Capture the stack of the loop thread if it is blocked.
+
+        Runs in the watchdog thread. Only one report is captured per stall.
+        """
+        blocked_for = perf_counter() - self._heartbeat
+        if self._stall_captured or blocked_for <= self.threshold:
+            return
+
+        self._stall_captured = True
+        frame = sys._current_frames().get(self._loop_thread_id)    # pylint: disable-msg=protected-access
+        stack = traceback.format_stack(frame) if frame else []
+        location = stack[-1].strip().splitlines()[0] if stack else "unknown"
+
+        report = {"blocked_ms": round(blocked_for * 1000, 3),
+                  "location": location,
+                  "stack": "".join(stack)}
+        self.stalls.append(report)
+        self._pending_stalls.append(report)
+
+        self.warning_log("Event loop blocked for %sms at %s\n%s", report["blocked_ms"], location, report["stack"])
+
+    def _send_stall(self, report: dict) -> None:
+        self.machine.bcp.transport.send_to_clients_with_handler(
+            handler="_loop_watchdog",
+            bcp_command="loop_stall",
+            **report)
+
+    def get_stats(self) -> dict:
+        """Return probe count, overruns, maximum lag and the last stalls."""
+        return {
+            "probes": self.probes,
+            "overruns": self.overruns,
+            "max_lag_ms": round(self.max_lag * 1000, 3),
+            "stalls": list(self.stalls),
+        }
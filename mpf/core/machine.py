@@ -8,6 +8,7 @@ import tempfile
 
 import sys
 import threading
+from concurrent.futures import Executor, ThreadPoolExecutor
 from platform import platform, python_version, system, release, version, system_alias, machine
 
 import copy
@@ -22,7 +23,7 @@ from mpf.core.case_insensitive_dict import CaseInsensitiveDict
 from mpf.core.clock import ClockBase
 from mpf.core.config_processor import ConfigProcessor
 from mpf.core.config_validator import ConfigValidator
-from mpf.core.data_manager import DataManager
+from mpf.core.data_manager import DataManager, JournaledDataManager
 from mpf.core.delays import DelayManager, DelayManagerRegistry
 from mpf.core.device_manager import DeviceCollection, DeviceCollectionType
 from mpf.core.utility_functions import Util
@@ -40,6 +41,7 @@ if MYPY:   # pragma: no cover
     from mpf.core.settings_controller import SettingsController
     from mpf.core.bcp.bcp import Bcp
     from mpf.core.text_ui import TextUi
+    from mpf.core.loop_watchdog import LoopWatchdog
     from mpf.assets.show import Show
     from mpf.core.assets import BaseAssetManager
     from mpf.devices.switch import Switch
@@ -52,6 +54,7 @@ if MYPY:   # pragma: no cover
     from mpf.platforms.smart_virtual import SmartVirtualHardwarePlatform
     from mpf.core.device_manager import DeviceManager
     from mpf.plugins.auditor import Auditor
+    from mpf.plugins.playfield_statistics import PlayfieldStatistics
     from mpf.devices.light import Light
     from mpf.devices.accelerometer import Accelerometer
     from mpf.devices.drop_target import DropTarget
@@ -108,6 +111,8 @@ class MachineController(LogMixin):
         self.machine_var_monitor = False
         self.machine_var_data_manager = None    # type: DataManager
         self.thread_stopper = threading.Event()
+        # set by the playfield_statistics plugin when it is configured
+        self.playfield_statistics = None    # type: PlayfieldStatistics
 
         self.config = None      # type: Any
 
@@ -127,6 +132,7 @@ class MachineController(LogMixin):
             self.device_manager = None                  # type: DeviceManager
             self.auditor = None                         # type: Auditor
             self.tui = None                             # type: TextUi
+            self.loop_watchdog = None                   # type: LoopWatchdog
 
             # devices
             self.shows = None                           # type: DeviceCollectionType[str, Show]
@@ -329,13 +335,24 @@ class MachineController(LogMixin):
         Args:
             config_name: Name of the config
         """
+        if self.config['mpf']['data_manager_journal']:
+            return JournaledDataManager(self, config_name)
+
         return DataManager(self, config_name)
 
+    def create_asset_loader_executor(self, threads: int) -> Executor:     # pragma: no cover
+        """Return the executor which reads and parses asset files.
+
+        Args:
+            threads: Number of threads configured in ``mpf: asset_loader_threads``
+        """
+        return ThreadPoolExecutor(threads)
+
     def _load_machine_vars(self) -> None:
         """Load machine vars from data manager."""
         self.machine_var_data_manager = self.create_data_manager('machine_vars')
 
-        current_time = self.clock.get_time()
+        expired = set(self.machine_var_data_manager.get_expired_keys(self.clock.get_time()))
 
         for name, settings in (
                 iter(self.machine_var_data_manager.get_data().items())):
@@ -343,9 +360,7 @@ class MachineController(LogMixin):
             if not isinstance(settings, dict) or "value" not in settings:
                 continue
 
-            if ('expire' in settings and settings['expire'] and
-                    settings['expire'] < current_time):
-
+            if name in expired:
                 settings['value'] = 0
 
             self.set_machine_var(name=name, value=settings['value'])
@@ -417,13 +432,20 @@ class MachineController(LogMixin):
         self.config = self._get_mpf_config()
         self.config['_mpf_version'] = __version__
 
-        for num, config_file in enumerate(self.options['configfile']):
+        config_files = []
+        for config_file in self.options['configfile']:
 
             if not (config_file.startswith('/') or
                     config_file.startswith('\\')):
 
                 config_file = os.path.join(self.machine_path, self.config['mpf']['paths']['config'], config_file)
 
+            config_files.append(config_file)
+
+        # parse all files in parallel but merge them in order
+        ConfigProcessor.preload_config_files(config_files, self.get_config_load_workers())
+
+        for num, config_file in enumerate(config_files):
             self.log.info("Machine config file #%s: %s", num + 1, config_file)
 
             self.config = Util.dict_merge(self.config,
@@ -434,6 +456,10 @@ class MachineController(LogMixin):
         if self.options['create_config_cache']:
             self._cache_config()
 
+    def get_config_load_workers(self) -> int:
+        """Return the number of processes used to parse config files and shows."""
+        return ConfigProcessor.get_worker_count(self.config['mpf'].get('config_load_workers', 0))
+
     def _get_mpf_config(self) -> dict:
         """Return mpf config dict."""
         return ConfigProcessor.load_config_file(self.options['mpfconfigfile'],
@@ -746,6 +772,7 @@ class MachineController(LogMixin):
         self._do_stop()
 
         if self._exception:
+            self.events.dump_event_trace()
             print("Shutdown because of an exception:")
             raise self._exception['exception']
 
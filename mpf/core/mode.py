@@ -83,6 +83,15 @@ class Mode(LogMixin):
         player in the 'restart_modes_on_next_ball' player variable.
         '''
 
+        self.loaded = not self.config['mode']['lazy_load']
+        '''False while a mode with lazy_load has not processed its config and
+        created its devices. This happens on the first start or when the
+        machine is idle.
+        '''
+
+        self.load_count = 0
+        self.last_started_game = 0
+
     @staticmethod
     def get_config_spec() -> str:
         """Return config spec for mode_settings."""
@@ -165,7 +174,11 @@ class Mode(LogMixin):
             self.debug_log("Mode already starting. Aborting start.")
             return
 
+        if not self.loaded:
+            self.load()
+
         self._starting = True
+        self.last_started_game = self.machine.mode_controller.games_played
 
         self.machine.events.post('mode_' + self.name + '_will_start')
         '''event: mode_(name)_will_start
@@ -190,7 +203,27 @@ class Mode(LogMixin):
             self.priority = self.config['mode']['priority']
 
         self.start_event_kwargs = kwargs
+        self.start_callback = callback
+
+        # register all handlers of this mode in one batch
+        self.machine.events.start_handler_batch()
+        try:
+            self._register_mode_handlers()
+        finally:
+            self.machine.events.finish_handler_batch()
+
+        self.machine.events.post_queue(event='mode_' + self.name + '_starting',
+                                       callback=self._started)
+        '''event: mode_(name)_starting
+
+        desc: The mode called "name" is starting.
 
+        This is a queue event. The mode will not fully start until the queue is
+        cleared.
+        '''
+
+    def _register_mode_handlers(self) -> None:
+        """Add mode devices and register stop events, config players and device control events."""
         self._add_mode_devices()
 
         self.debug_log("Registering mode_stop handlers")
@@ -205,8 +238,6 @@ class Mode(LogMixin):
                 self.add_mode_event_handler(event=event, handler=self.stop,
                                             priority=self.config['mode']['stop_priority'] + 1)
 
-        self.start_callback = callback
-
         self.debug_log("Calling mode_start handlers")
 
         for item in self.machine.mode_controller.start_methods:
@@ -220,16 +251,6 @@ class Mode(LogMixin):
 
         self._setup_device_control_events()
 
-        self.machine.events.post_queue(event='mode_' + self.name + '_starting',
-                                       callback=self._started)
-        '''event: mode_(name)_starting
-
-        desc: The mode called "name" is starting.
-
-        This is a queue event. The mode will not fully start until the queue is
-        cleared.
-        '''
-
     def _started(self) -> None:
         """Handle result of mode_<name>_starting queue event."""
         self.info_log('Started. Priority: %s', self.priority)
@@ -330,9 +351,14 @@ class Mode(LogMixin):
         for callback in self.machine.mode_controller.stop_methods:
             callback[0](self)
 
-        for item in self.stop_methods:
-            if item:
-                item[0](item[1])
+        # remove the handlers of all config players in one batch
+        self.machine.events.start_handler_batch()
+        try:
+            for item in self.stop_methods:
+                if item:
+                    item[0](item[1])
+        finally:
+            self.machine.events.finish_handler_batch()
 
         self.stop_methods = list()
 
@@ -555,8 +581,7 @@ class Mode(LogMixin):
         return key
 
     def _remove_mode_event_handlers(self) -> None:
-        for key in self.event_handlers:
-            self.machine.events.remove_handler_by_key(key)
+        self.machine.events.remove_handlers_by_keys(self.event_handlers)
         self.event_handlers = set()
 
     def _remove_mode_switch_handlers(self) -> None:
@@ -564,9 +589,59 @@ class Mode(LogMixin):
             self.machine.switch_controller.remove_switch_handler_by_key(handler)
         self.switch_handlers = list()
 
+    def load(self) -> None:
+        """Load a mode with lazy_load.
+
+        Creates the mode devices and calls the loader methods (e.g. of config
+        players) which are skipped during boot for lazy modes. Devices are
+        only created on the first load. After an unload the config is read
+        from disk again.
+        """
+        if self.loaded:
+            return
+
+        self.info_log("Loading lazy mode")
+        if not self.load_count:
+            self.create_mode_devices()
+            self.load_mode_devices()
+            self._call_loader_methods()
+            self.mode_init()
+        else:
+            self.config = self.machine.mode_controller.reload_mode_config(self)
+            self._call_loader_methods()
+
+        self.load_count += 1
+        self.last_started_game = self.machine.mode_controller.games_played
+        self.loaded = True
+
+    def unload(self) -> None:
+        """Release the processed config of a lazy mode which is not running.
+
+        Devices stay in their collections. The mode will load again when it
+        starts.
+        """
+        if not self.loaded or not self.config['mode']['lazy_load'] or self._active or self._starting:
+            return
+
+        self.info_log("Unloading lazy mode")
+        for item in self.machine.mode_controller.unloader_methods:
+            if item.config_section and self.config.get(item.config_section):
+                item.method(config=self.config[item.config_section], mode=self, **item.kwargs)
+
+        self.config = {'mode': self.config['mode'], 'mode_settings': self.config['mode_settings']}
+        self.loaded = False
+
     def initialise_mode(self) -> None:
         """Initialise this mode."""
-        # Call registered remote loader methods
+        if not self.loaded:
+            # lazy modes initialise when they are loaded
+            return
+
+        self._call_loader_methods()
+        self.mode_init()
+
+    def _call_loader_methods(self) -> None:
+        """Call registered remote loader methods."""
         for item in self.machine.mode_controller.loader_methods:
             if (item.config_section and
                     item.config_section in self.config and
@@ -579,7 +654,6 @@ class Mode(LogMixin):
             elif not item.config_section:
                 item.method(config=self.config, mode_path=self.path,
                             **item.kwargs)
-        self.mode_init()
 
     def mode_init(self) -> None:
         """User-overrideable method which will be called when this mode initializes as part of the MPF boot process."""
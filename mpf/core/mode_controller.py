@@ -49,9 +49,13 @@ class ModeController(MpfController):
         # that need to be notified when a mode object is created and/or
         # started.
         self.loader_methods = list()                # type: List[RemoteMethod]
+        self.unloader_methods = list()              # type: List[RemoteMethod]
         self.start_methods = list()                 # type: List[RemoteMethod]
         self.stop_methods = list()                  # type: List[Tuple[Callable[[Mode], None], int]]
 
+        # number of finished games. used to unload lazy modes which did not run for a while
+        self.games_played = 0
+
         if 'modes' in self.machine.config:
             # priority needs to be higher than device_manager::_load_device_modules
             self.machine.events.add_handler('init_phase_1', self.load_modes, priority=10)
@@ -74,15 +78,20 @@ class ModeController(MpfController):
                                         self._player_turn_ended,
                                         priority=1000000)
 
+        self.machine.events.add_handler('game_ended', self._game_ended)
+        self.machine.events.add_handler('mode_attract_started', self._preload_lazy_modes)
+
     def create_mode_devices(self):
         """Create mode devices."""
         for mode in self.machine.modes:
-            mode.create_mode_devices()
+            if mode.loaded:
+                mode.create_mode_devices()
 
     def load_mode_devices(self):
         """Load mode devices."""
         for mode in self.machine.modes:
-            mode.load_mode_devices()
+            if mode.loaded:
+                mode.load_mode_devices()
 
     def initialise_modes(self, **kwargs):
         """Initialise modes."""
@@ -96,6 +105,12 @@ class ModeController(MpfController):
 
         self._build_mode_folder_dicts()
 
+        # parse the configs of all modes in parallel
+        ConfigProcessor.preload_config_files(
+            [config_file for mode in self.machine.config['modes']
+             for config_file in self._get_mode_config_files(mode.lower())],
+            self.machine.get_config_load_workers())
+
         for mode in set(self.machine.config['modes']):
 
             if mode in self.machine.modes:
@@ -118,53 +133,86 @@ class ModeController(MpfController):
                              "folder in your machine's 'modes' folder?"
                              .format(mode_string))
 
-    def _load_mode_config(self, mode_string):
-        config = dict()
-        found_config = False
-        # Is there an MPF default config for this mode? If so, load it first
-        try:
-            mpf_mode_config = os.path.join(
-                self.machine.mpf_path,
-                self.machine.config['mpf']['paths']['modes'],
-                self._mpf_mode_folders[mode_string],
-                'config',
-                self._mpf_mode_folders[mode_string] + '.yaml')
+    def reload_mode_config(self, mode: Mode) -> dict:
+        """Read the config of an unloaded lazy mode from disk again."""
+        config = self._load_mode_config(mode.name)
+        config['mode'] = mode.config['mode']
+        config['mode_settings'] = mode.config['mode_settings']
+        return config
 
-            if os.path.isfile(mpf_mode_config):
-                config = ConfigProcessor.load_config_file(mpf_mode_config,
-                                                          config_type='mode')
-                found_config = True
+    def _preload_lazy_modes(self, **kwargs):
+        """Load lazy modes in the background while the machine is idle in attract."""
+        del kwargs
+        if self.machine.config['mpf'].get('lazy_mode_preload', True):
+            self._preload_next_lazy_mode()
+
+    def _preload_next_lazy_mode(self):
+        if self.machine.game:
+            # lazy modes will load when they start
+            return
 
-            self.debug_log("Loading config from %s", mpf_mode_config)
+        for mode in self.machine.modes:
+            # modes which have been unloaded load again when they start
+            if not mode.loaded and not mode.load_count:
+                mode.load()
+                # one mode per loop iteration to keep the loop responsive
+                self.machine.clock.loop.call_soon(self._preload_next_lazy_mode)
+                return
+
+    def _game_ended(self, **kwargs):
+        """Unload lazy modes which did not run in the last games."""
+        del kwargs
+        self.games_played += 1
+        unload_games = self.machine.config['mpf'].get('lazy_mode_unload_games', 0)
+        if not unload_games:
+            return
 
-        except KeyError:
-            pass
+        for mode in self.machine.modes:
+            if mode.loaded and self.games_played - mode.last_started_game > unload_games:
+                mode.unload()
 
-        # Now figure out if there's a machine-specific config for this mode,
-        # and if so, merge it into the config
-        try:
-            mode_config_file = os.path.join(
-                self.machine.machine_path,
+    def _get_mode_config_files(self, mode_string: str) -> List[str]:
+        """Return the existing config files of a mode.
+
+        The MPF default config comes first and the machine-specific config
+        second.
+        """
+        config_files = []
+        for base_path, mode_folders in ((self.machine.mpf_path, self._mpf_mode_folders),
+                                        (self.machine.machine_path, self._machine_mode_folders)):
+            if mode_string not in mode_folders:
+                continue
+
+            config_file = os.path.join(
+                base_path,
                 self.machine.config['mpf']['paths']['modes'],
-                self._machine_mode_folders[mode_string],
+                mode_folders[mode_string],
                 'config',
-                self._machine_mode_folders[mode_string] + '.yaml')
-        except KeyError:
-            mode_config_file = False
+                mode_folders[mode_string] + '.yaml')
+
+            if os.path.isfile(config_file):
+                config_files.append(config_file)
+
+        return config_files
+
+    def _load_mode_config(self, mode_string):
+        config = dict()
+        config_files = self._get_mode_config_files(mode_string)
 
-        if mode_config_file and os.path.isfile(mode_config_file):
+        # Load the MPF default config for this mode first and merge the
+        # machine-specific config into it
+        for config_file in config_files:
             config = Util.dict_merge(config,
                                      ConfigProcessor.load_config_file(
-                                         mode_config_file, 'mode'))
-            found_config = True
+                                         config_file, 'mode'))
 
-            self.debug_log("Loading config from %s", mode_config_file)
+            self.debug_log("Loading config from %s", config_file)
 
         # validate config
         if 'mode' not in config:
             config['mode'] = dict()
 
-        if not found_config:
+        if not config_files:
             raise AssertionError("Did not find any config for mode {}.".format(mode_string))
 
         return config
@@ -393,6 +441,33 @@ class ModeController(MpfController):
                                                 config_section=config_section_name, kwargs=kwargs,
                                                 priority=priority))
 
+    def register_unload_method(self, unload_method, config_section_name, priority=0, **kwargs):
+        """Register a method which is called when a lazy mode is unloaded.
+
+        It should undo what the load method registered for this section did
+        because the load method will be called again when the mode loads
+        again.
+
+        Args:
+            unload_method: The method that will be called with the config
+                section and the mode.
+            config_section_name: The section of the mode config which will be
+                passed to the unload_method.
+            priority: Int of the relative priority. Higher values will be
+                called first.
+            **kwargs: Any additional keyword arguments specified will be passed
+                to the unload_method.
+        """
+        if not callable(unload_method):
+            raise ValueError("Cannot add unload method '{}' as it is not"
+                             "callable".format(unload_method))
+
+        self.unloader_methods.append(RemoteMethod(method=unload_method,
+                                                  config_section=config_section_name, kwargs=kwargs,
+                                                  priority=priority))
+
+        self.unloader_methods.sort(key=lambda x: x.priority, reverse=True)
+
     def register_start_method(self, start_method, config_section_name=None,
                               priority=0, **kwargs):
         """Register a method which is called anytime a mode is started.
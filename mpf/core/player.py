@@ -1,11 +1,18 @@
 """Contains the Player class which represents a player in a pinball game."""
-import copy
 import logging
+import sys
 
 from mpf.core.case_insensitive_dict import CaseInsensitiveDict
 
 from mpf.core.utility_functions import Util
 
+MYPY = False
+if MYPY:   # pragma: no cover
+    from typing import Dict, Tuple
+
+# marker for player vars which do not exist yet
+_MISSING = object()
+
 
 class Player(object):
 
@@ -76,6 +83,9 @@ class Player(object):
     ``player_score`` with Args: ``value=500, change=500, prev_value=0``
     ``player_score`` with Args: ``value=1200, change=700, prev_value=500``
 
+    Events are only built and posted if there are handlers or monitors for
+    them. Use ``set_vars`` to update several variables at once.
+
     """
 
     monitor_enabled = False
@@ -83,6 +93,11 @@ class Player(object):
     to track player variable changes.
     """
 
+    _names = {}     # type: Dict[str, Tuple[str, str]]
+    """Class attribute which maps variable names to their lowercase name and
+    the name of their event so those are only computed once per name.
+    """
+
     def __init__(self, machine, index):
         """Initialise player."""
         # use self.__dict__ below since __setattr__ would make these player vars
@@ -131,7 +146,7 @@ class Player(object):
 
         config = self.machine.config['player_vars']
         for name, element in config.items():
-            element = self.machine.config_validator.validate_config("player_vars", copy.deepcopy(element))
+            element = self.machine.config_validator.validate_config("player_vars", dict(element))
             self[name] = Util.convert_to_type(element['initial_value'], element['value_type'])
 
     def enable_events(self, enable=True, send_all_variables=True):
@@ -158,21 +173,51 @@ class Player(object):
                 else:
                     self._send_variable_event(name, value, value, 0, self.vars['number'])
 
+    @classmethod
+    def _get_names(cls, name: str) -> "Tuple[str, str]":
+        """Return lowercase name and event name of a player variable."""
+        try:
+            return cls._names[name]
+        except KeyError:
+            pass
+
+        lower_name = CaseInsensitiveDict.lower(name)
+        if isinstance(lower_name, str):
+            lower_name = sys.intern(lower_name)
+        names = cls._names[name] = (lower_name, 'player_{}'.format(lower_name))
+        return names
+
+    @staticmethod
+    def _get_change(value, prev_value):
+        """Return the difference of two values or whether they differ."""
+        # fast path for scores and counters
+        if type(value) is int and type(prev_value) is int:     # noqa
+            return value - prev_value
+
+        try:
+            return value - prev_value
+        except TypeError:
+            return prev_value != value
+
     # pylint: disable-msg=too-many-arguments
     def _send_variable_event(self, name: str, value, prev_value, change, player_num: int):
         """Send a player variable event performs any monitor callbacks if configured.
 
+        The event is only posted if someone observes it.
+
         :param name: The player variable name
         :param value: The new variable value
         :param prev_value: The previous variable value
         :param change: The change in value or True/False
         :param player_num: The player number this variable belongs to
         """
-        self.machine.events.post('player_' + name,
-                                 value=value,
-                                 prev_value=value,
-                                 change=change,
-                                 player_num=player_num)
+        event_name = self._get_names(name)[1]
+        if self.machine.events.is_event_observed(event_name):
+            self.machine.events.post(event_name,
+                                     value=value,
+                                     prev_value=prev_value,
+                                     change=change,
+                                     player_num=player_num)
         '''event: player_(var_name)
 
         desc: Posted when simpler types of player variables are added or
@@ -233,11 +278,38 @@ class Player(object):
 
     def __getattr__(self, name):
         """Return value of attribute or initialise it with 0 when it does not exist."""
-        if name in self.vars:
-            return self.vars[name]
-        else:
-            self.vars[name] = 0
+        lower_name = self._get_names(name)[0]
+        # use the dict methods directly since the key is already lowercase
+        value = dict.get(self.vars, lower_name, _MISSING)
+        if value is _MISSING:
+            dict.__setitem__(self.vars, lower_name, 0)
             return 0
+        return value
+
+    def _set_var(self, name, value):
+        """Set a player var and return its previous value and change.
+
+        Change is None if nothing changed which needs to be announced.
+        """
+        lower_name = self._get_names(name)[0]
+        player_vars = self.__dict__['vars']
+        prev_value = dict.get(player_vars, lower_name, _MISSING)
+        dict.__setitem__(player_vars, lower_name, value)
+
+        if prev_value is _MISSING:
+            new_entry = True
+            prev_value = 0
+        else:
+            new_entry = False
+
+        change = self._get_change(value, prev_value)
+
+        if (change or new_entry) and isinstance(value, (int, str, float)):
+            self.log.debug("Setting '%s' to: %s, (prior: %s, change: %s)",
+                           name, value, prev_value, change)
+            return prev_value, change
+
+        return prev_value, None
 
     def __setattr__(self, name, value):
         """Set value and post event to inform about the change."""
@@ -246,26 +318,49 @@ class Player(object):
             self.__dict__[name] = value
             return
 
-        new_entry = False
-        prev_value = 0
-        if name in self.vars:
-            prev_value = self.vars[name]
-        else:
-            new_entry = True
+        prev_value, change = self._set_var(name, value)
 
-        self.vars[name] = value
+        if change is not None and self._events_enabled:
+            self._send_variable_event(name, value, prev_value, change,
+                                      dict.__getitem__(self.vars, 'number'))
 
-        try:
-            change = value - prev_value
-        except TypeError:
-            change = prev_value != value
+    def set_vars(self, **values):
+        """Set multiple player variables at once.
 
-        if (change or new_entry) and isinstance(value, (int, str, float)):
-            self.log.debug("Setting '%s' to: %s, (prior: %s, change: %s)",
-                           name, self.vars[name], prev_value, change)
+        Monitors are informed about every variable and ``player_(var_name)``
+        is posted for variables which have handlers. Additionally, one
+        ``player_vars_changed`` event is posted for all changes together.
+
+        .. code::
 
+            self.machine.game.player.set_vars(score=1000, ramps=3)
+        """
+        changes = {}
+        for name, value in values.items():
+            prev_value, change = self._set_var(name, value)
+            if change is None:
+                continue
+            changes[name] = change
             if self._events_enabled:
-                self._send_variable_event(name, self.vars[name], prev_value, change, self.vars['number'])
+                self._send_variable_event(name, value, prev_value, change,
+                                          dict.__getitem__(self.vars, 'number'))
+
+        if changes and self._events_enabled:
+            self.machine.events.post('player_vars_changed',
+                                     changes=changes,
+                                     player_num=dict.__getitem__(self.vars, 'number'))
+            '''event: player_vars_changed
+
+            desc: Posted once when multiple player variables were changed
+            together via ``set_vars``.
+
+            args:
+
+            changes: Dict which maps the name of every changed player
+            variable to its change (see *player_(var_name)*).
+
+            player_num: The player number the variables changed for.
+            '''
 
     def __getitem__(self, name):
         """Allow array get access."""
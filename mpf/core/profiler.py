@@ -0,0 +1,185 @@
+"""Opt-in profiler for events, event handlers and clock callbacks."""
+from functools import partial
+
+MYPY = False
+if MYPY:   # pragma: no cover
+    from typing import Any, Callable, Dict, List
+
+
+class LatencyHistogram(object):
+
+    """Histogram of durations with power of two buckets in microseconds.
+
+    Memory is constant per histogram. Percentiles are reported as the upper
+    bound of the bucket which contains them (capped by the maximum) so they
+    are accurate within a factor of two.
+    """
+
+    __slots__ = ["count", "total", "max", "buckets"]
+
+    BUCKETS = 32
+
+    def __init__(self) -> None:
+        """Initialise empty histogram."""
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.buckets = [0] * self.BUCKETS
+
+    def add(self, duration: float) -> None:
+        """Add a duration in seconds."""
+        self.count += 1
+        self.total += duration
+        if duration > self.max:
+            self.max = duration
+        bucket = int(duration * 1000000).bit_length()
+        if bucket >= self.BUCKETS:
+            bucket = self.BUCKETS - 1
+        self.buckets[bucket] += 1
+
+    def percentile(self, fraction: float) -> float:
+        """Return the duration in seconds below which fraction of all samples are."""
+        if not self.count:
+            return 0.0
+
+        rank = fraction * self.count
+        seen = 0
+        for bucket, count in enumerate(self.buckets):
+            seen += count
+            if seen >= rank:
+                return min((1 << bucket) / 1000000, self.max)
+
+        return self.max
+
+    def get_stats(self) -> dict:
+        """Return count and latencies in ms."""
+        return {
+            "count": self.count,
+            "total_ms": round(self.total * 1000, 3),
+            "mean_ms": round(self.total / self.count * 1000, 3) if self.count else 0.0,
+            "p50_ms": round(self.percentile(.5) * 1000, 3),
+            "p99_ms": round(self.percentile(.99) * 1000, 3),
+            "max_ms": round(self.max * 1000, 3),
+        }
+
+
+class Profiler(object):
+
+    """Collects call counts and latency histograms.
+
+    The EventManager records the time to process every event and to run every
+    handler. The clock records the duration of scheduled callbacks and how
+    late they ran compared to their scheduled time (loop lag). Nothing is
+    recorded unless the profiler is enabled via ``mpf: profiler: true`` or by
+    a BCP client which monitors the ``profiler`` category.
+    """
+
+    MAX_CACHED_NAMES = 1000
+
+    def __init__(self) -> None:
+        """Initialise profiler."""
+        self.events = {}            # type: Dict[str, LatencyHistogram]
+        self.handlers = {}          # type: Dict[str, LatencyHistogram]
+        self.callbacks = {}         # type: Dict[str, LatencyHistogram]
+        self.loop_lag = LatencyHistogram()
+        self.queue_depth_max = 0
+        self.queue_depth_total = 0
+        self.queue_depth_samples = 0
+        self._names = {}            # type: Dict[Any, str]
+
+    def reset(self) -> None:
+        """Remove all recorded data."""
+        self.events = {}
+        self.handlers = {}
+        self.callbacks = {}
+        self.loop_lag = LatencyHistogram()
+        self.queue_depth_max = 0
+        self.queue_depth_total = 0
+        self.queue_depth_samples = 0
+        self._names = {}
+
+    def get_callback_name(self, callback: "Callable") -> str:
+        """Return a readable name for a handler or callback."""
+        while isinstance(callback, partial):
+            callback = callback.func
+
+        # bound methods and partials are created per call. cache their function
+        func = getattr(callback, "__func__", callback)
+        owner_name = getattr(getattr(callback, "__self__", None), "name", None)
+        if not isinstance(owner_name, str):
+            owner_name = None
+        key = (func, owner_name)
+        try:
+            return self._names[key]
+        except (KeyError, TypeError):
+            pass
+
+        name = getattr(func, "__qualname__", None) or repr(callback)
+        if owner_name:
+            name = "{}[{}]".format(name, owner_name)
+
+        # closures are new functions every time. do not let them grow the cache
+        if len(self._names) >= self.MAX_CACHED_NAMES:
+            self._names = {}
+        try:
+            self._names[key] = name
+        except TypeError:
+            # unhashable callable
+            pass
+        return name
+
+    @staticmethod
+    def _add(histograms: "Dict[str, LatencyHistogram]", name: str, duration: float) -> None:
+        try:
+            histograms[name].add(duration)
+        except KeyError:
+            histogram = histograms[name] = LatencyHistogram()
+            histogram.add(duration)
+
+    def record_event(self, event: str, duration: float) -> None:
+        """Record the time it took to run all handlers of an event."""
+        self._add(self.events, event, duration)
+
+    def record_handler(self, callback: "Callable", duration: float) -> None:
+        """Record the runtime of an event handler."""
+        self._add(self.handlers, self.get_callback_name(callback), duration)
+
+    def record_callback(self, callback: "Callable", duration: float) -> None:
+        """Record the runtime of a clock callback."""
+        self._add(self.callbacks, self.get_callback_name(callback), duration)
+
+    def record_loop_lag(self, lag: float) -> None:
+        """Record how late a scheduled callback ran."""
+        self.loop_lag.add(max(lag, 0.0))
+
+    def record_queue_depth(self, depth: int) -> None:
+        """Record the depth of the event queue."""
+        self.queue_depth_samples += 1
+        self.queue_depth_total += depth
+        if depth > self.queue_depth_max:
+            self.queue_depth_max = depth
+
+    @staticmethod
+    def _top(histograms: "Dict[str, LatencyHistogram]", top: int) -> "List[dict]":
+        """Return stats of the entries with the most cumulative time."""
+        entries = sorted(histograms.items(), key=lambda item: item[1].total, reverse=True)
+        result = []
+        for name, histogram in entries[:top]:
+            stats = histogram.get_stats()
+            stats["name"] = name
+            result.append(stats)
+        return result
+
+    def get_stats(self, top: int = 20) -> dict:
+        """Return a summary of the top entries by cumulative time."""
+        return {
+            "events": self._top(self.events, top),
+            "handlers": self._top(self.handlers, top),
+            "callbacks": self._top(self.callbacks, top),
+            "loop_lag": self.loop_lag.get_stats(),
+            "queue_depth": {
+                "max": self.queue_depth_max,
+                "mean": round(self.queue_depth_total / self.queue_depth_samples, 3)
+                if self.queue_depth_samples else 0.0,
+            },
+        }
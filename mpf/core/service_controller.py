@@ -98,3 +98,17 @@ class ServiceController(MpfController):
         # sort by board + driver number
         light_map.sort(key=lambda x: (self._natural_key_sort(x[0]), self._natural_key_sort(str(x[1].config['number']))))
         return light_map
+
+    def get_playfield_statistics(self, series=None, resolution="minute"):
+        """Return recorded playfield statistics.
+
+        Returns the names of all series if series is None. Otherwise, returns
+        the buckets of the series in the resolution (minute, hour or game).
+        """
+        if not self.is_in_service():
+            raise AssertionError("Not in service mode!")
+        if not self.machine.playfield_statistics:
+            return []
+        if series is None:
+            return self.machine.playfield_statistics.store.get_series_names()
+        return self.machine.playfield_statistics.query(series, resolution)
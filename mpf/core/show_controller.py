@@ -1,9 +1,45 @@
 """Contains the ShowController base class."""
+import heapq
 
 from mpf.assets.show import Show
 from mpf.core.mpf_controller import MpfController
 
 
+class ShowSchedulerStats(object):
+
+    """Statistics of the show step scheduler."""
+
+    def __init__(self):
+        """Initialise stats."""
+        self.ticks = 0
+        self.steps = 0
+        self.last_tick_steps = 0
+        self.last_tick_lateness = 0.0
+        self.max_lateness = 0.0
+        self.total_lateness = 0.0
+
+    def add_tick(self, steps, lateness, total_lateness):
+        """Account one scheduler tick."""
+        self.ticks += 1
+        self.steps += steps
+        self.last_tick_steps = steps
+        self.last_tick_lateness = lateness
+        self.total_lateness += total_lateness
+        if lateness > self.max_lateness:
+            self.max_lateness = lateness
+
+    def get_stats(self):
+        """Return a dict with all stats."""
+        return {
+            "ticks": self.ticks,
+            "steps": self.steps,
+            "last_tick_steps": self.last_tick_steps,
+            "last_tick_lateness": self.last_tick_lateness,
+            "max_lateness": self.max_lateness,
+            "mean_lateness": self.total_lateness / self.steps if self.steps else 0.0,
+        }
+
+
 class ShowController(MpfController):
 
     """Manages all the shows in a pinball machine.
@@ -23,8 +59,19 @@ class ShowController(MpfController):
 
         self.show_players = {}
         self.running_shows = list()
+        self._running_shows_by_name = {}
         self._next_show_id = 0
 
+        # deadline queue of (step_time, sequence, running_show). entries are
+        # invalidated lazily by removing the show from _scheduled_steps
+        self._step_queue = []
+        self._scheduled_steps = {}
+        self._next_step_sequence = 0
+        self._step_timer = None
+        self._step_timer_deadline = None
+        self._running_steps = False
+        self.scheduler_stats = ShowSchedulerStats()
+
         # Registers Show with the asset manager
         Show.initialize(self.machine)
 
@@ -33,6 +80,9 @@ class ShowController(MpfController):
         self.machine.mode_controller.register_load_method(
             self._process_config_shows_section, 'shows')
 
+        self.machine.mode_controller.register_unload_method(
+            self._remove_config_shows_section, 'shows')
+
     def _initialize(self, **kwargs):
         del kwargs
         if 'shows' in self.machine.config:
@@ -50,6 +100,14 @@ class ShowController(MpfController):
         for show, settings in config.items():
             self.register_show(show, settings)
 
+    def _remove_config_shows_section(self, config, **kwargs):
+        # removes the shows of a mode which is unloaded
+        del kwargs
+
+        for show in config:
+            if show in self.machine.shows:
+                del self.machine.shows[show]
+
     def get_running_shows(self, name):
         """Return a list of running shows by show name or instance name.
 
@@ -63,7 +121,7 @@ class ShowController(MpfController):
             A list of RunningShow() objects.
 
         """
-        return [x for x in self.running_shows if x.name == name]
+        return list(self._running_shows_by_name.get(name, []))
 
     def register_show(self, name, settings):
         """Register a named show."""
@@ -82,10 +140,110 @@ class ShowController(MpfController):
         """Register a running show."""
         self.running_shows.append(show)
         self.running_shows.sort(key=lambda x: x.priority)
+        self._running_shows_by_name.setdefault(show.name, []).append(show)
 
     def notify_show_stopping(self, show):
         """Remove a running show."""
         self.running_shows.remove(show)
+        shows_by_name = self._running_shows_by_name[show.name]
+        shows_by_name.remove(show)
+        if not shows_by_name:
+            del self._running_shows_by_name[show.name]
+        self.unschedule_show_step(show)
+
+    def schedule_show_step(self, show, step_time, post_events=None):
+        """Schedule the next step of a running show at step_time.
+
+        All steps which are due at the same time will run in one batch. A show
+        can only have one scheduled step. Scheduling a new one replaces the
+        old one.
+        """
+        self._next_step_sequence += 1
+        self._scheduled_steps[show] = (self._next_step_sequence, post_events)
+        heapq.heappush(self._step_queue, (step_time, self._next_step_sequence, show))
+
+        if not self._running_steps:
+            self._update_step_timer()
+
+    def unschedule_show_step(self, show):
+        """Remove the scheduled step of a show (if any)."""
+        self._scheduled_steps.pop(show, None)
+
+    def is_show_step_scheduled(self, show):
+        """Return true if the show has a pending step."""
+        return show in self._scheduled_steps
+
+    def get_scheduler_stats(self):
+        """Return statistics of the show step scheduler."""
+        stats = self.scheduler_stats.get_stats()
+        stats["scheduled_shows"] = len(self._scheduled_steps)
+        return stats
+
+    def _drop_stale_steps(self):
+        """Remove invalidated entries from the top of the step queue."""
+        while self._step_queue:
+            _, sequence, show = self._step_queue[0]
+            entry = self._scheduled_steps.get(show)
+            if entry and entry[0] == sequence:
+                return
+            heapq.heappop(self._step_queue)
+
+    def _update_step_timer(self):
+        """Make sure the clock timer fires at the earliest deadline."""
+        self._drop_stale_steps()
+        if not self._step_queue:
+            if self._step_timer:
+                self.machine.clock.unschedule(self._step_timer)
+                self._step_timer = None
+                self._step_timer_deadline = None
+            return
+
+        deadline = self._step_queue[0][0]
+        if self._step_timer and self._step_timer_deadline <= deadline:
+            return
+
+        if self._step_timer:
+            self.machine.clock.unschedule(self._step_timer)
+
+        self._step_timer_deadline = deadline
+        self._step_timer = self.machine.clock.schedule_once(self._run_due_steps,
+                                                            deadline - self.machine.clock.get_time())
+
+    def _run_due_steps(self):
+        """Run all show steps which are due in one batch."""
+        now = self.machine.clock.get_time()
+        # the timer may fire slightly early because of the clock resolution
+        due_time = max(now, self._step_timer_deadline)
+        self._step_timer = None
+        self._step_timer_deadline = None
+
+        steps = 0
+        max_lateness = 0.0
+        total_lateness = 0.0
+        self._running_steps = True
+        # sync light platforms once for all steps in this batch
+        self.machine.light_controller.begin_batch()
+        try:
+            while self._step_queue and self._step_queue[0][0] <= due_time:
+                step_time, sequence, show = heapq.heappop(self._step_queue)
+                entry = self._scheduled_steps.get(show)
+                if not entry or entry[0] != sequence:
+                    continue
+                del self._scheduled_steps[show]
+
+                lateness = max(now - step_time, 0.0)
+                total_lateness += lateness
+                if lateness > max_lateness:
+                    max_lateness = lateness
+                steps += 1
+
+                show.run_scheduled_step(entry[1])
+        finally:
+            self.machine.light_controller.end_batch()
+            self._running_steps = False
+            self._update_step_timer()
+
+        self.scheduler_stats.add_tick(steps, max_lateness, total_lateness)
 
     def play_show_with_config(self, config, mode=None, start_time=None):
         """Play and return a show from config.
@@ -17,11 +17,32 @@ from mpf.devices.switch import Switch
 
 MonitoredSwitchChange = namedtuple("MonitoredSwitchChange", ["name", "label", "platform", "num", "state"])
 SwitchHandler = namedtuple("SwitchHandler", ["switch_name", "callback", "state", "ms"])
-RegisteredSwitch = namedtuple("RegisteredSwitch", ["ms", "callback"])
 SwitchState = namedtuple("SwitchState", ["state", "time"])
 TimedSwitchHandler = namedtuple("TimedSwitchHandler", ["callback", 'switch_name', 'state', 'ms'])
 
 
+class RegisteredSwitch(object):
+
+    """A switch handler in the handler slots of a switch.
+
+    Handlers are removed by setting ``removed`` (a tombstone) and replacing
+    the slot with a new tuple. A dispatch which is in progress keeps iterating
+    its tuple and skips the tombstoned entries.
+    """
+
+    __slots__ = ["ms", "callback", "removed"]
+
+    def __init__(self, ms, callback):
+        """Initialise handler entry."""
+        self.ms = ms
+        self.callback = callback
+        self.removed = False
+
+    def __repr__(self):
+        """Return string representation."""
+        return "<RegisteredSwitch ms={} callback={}>".format(self.ms, self.callback)
+
+
 class SwitchController(MpfController):
 
     """Tracks all switches in the machine, receives switch activity, and converts switch changes into events."""
@@ -31,9 +52,8 @@ class SwitchController(MpfController):
     def __init__(self, machine: MachineController) -> None:
         """Initialise switch controller."""
         super().__init__(machine)
-        self.registered_switches = CaseInsensitiveDict()        # type: Dict[str, List[RegisteredSwitch]]
-        # Dictionary of switches and states that have been registered for
-        # callbacks.
+        # Switch handlers are stored in the handler slots of every switch.
+        # See Switch.handlers.
 
         self._timed_switch_handler_delay = None                 # type: Any
 
@@ -62,9 +82,6 @@ class SwitchController(MpfController):
         Args:
             name: String name of the switch to add
         """
-        self.registered_switches[name + '-0'] = list()
-        self.registered_switches[name + '-1'] = list()
-
         self.set_state(name, 0, reset_time=True)
 
     @asyncio.coroutine
@@ -365,14 +382,14 @@ class SwitchController(MpfController):
             return
 
         if state:
-            self.info_log("<<<<<<< '{}' active >>>>>>>".format(obj.name))
+            self.info_log("<<<<<<< '%s' active >>>>>>>", obj.name)
         else:
-            self.info_log("<<<<<<< '{}' inactive >>>>>>>".format(obj.name))
+            self.info_log("<<<<<<< '%s' inactive >>>>>>>", obj.name)
 
         # Update the switch controller's logical state for this switch
         self.set_state(obj.name, state)
 
-        self._call_handlers(obj.name, state)
+        self._call_handlers(obj, state)
 
         self._cancel_timed_handlers(obj.name, state)
 
@@ -461,35 +478,30 @@ class SwitchController(MpfController):
             self._process_active_timed_switches,
             self.get_next_timed_switch_event() - self.machine.clock.get_time())
 
-    def _call_handlers(self, name, state):
-        # Combine name & state so we can look it up
-        switch_key = str(name) + '-' + str(state)
-
-        # Do we have any registered handlers for this switch/state combo?
-        if switch_key in self.registered_switches:
-            for entry in self.registered_switches[switch_key][:]:  # generator?
-                # Found an entry.
-
-                # skip if the handler has been removed in the meantime
-                if entry not in self.registered_switches[switch_key]:
-                    continue
-
-                if entry.ms:
-                    # This entry is for a timed switch, so add it to our
-                    # active timed switch list
-                    key = self.machine.clock.get_time() + (entry.ms / 1000.0)
-                    value = TimedSwitchHandler(callback=entry.callback,
-                                               switch_name=name,
-                                               state=state,
-                                               ms=entry.ms)
-                    self._add_timed_switch_handler(key, value)
-                    self.debug_log(
-                        "Found timed switch handler for k/v %s / %s",
-                        key, value)
-                else:
-                    # This entry doesn't have a timed delay, so do the action
-                    # now
-                    entry.callback()
+    def _call_handlers(self, obj, state):
+        # Handlers added while we dispatch go into a new tuple and will not be
+        # called. Removed handlers are marked so we can skip them.
+        for entry in obj.handlers[state]:
+            # skip if the handler has been removed in the meantime
+            if entry.removed:
+                continue
+
+            if entry.ms:
+                # This entry is for a timed switch, so add it to our
+                # active timed switch list
+                key = self.machine.clock.get_time() + (entry.ms / 1000.0)
+                value = TimedSwitchHandler(callback=entry.callback,
+                                           switch_name=obj.name,
+                                           state=state,
+                                           ms=entry.ms)
+                self._add_timed_switch_handler(key, value)
+                self.debug_log(
+                    "Found timed switch handler for k/v %s / %s",
+                    key, value)
+            else:
+                # This entry doesn't have a timed delay, so do the action
+                # now
+                entry.callback()
 
     def add_monitor(self, monitor: Callable[[MonitoredSwitchChange], None]):
         """Add a monitor callback which is called on switch changes."""
@@ -539,9 +551,9 @@ class SwitchController(MpfController):
                        state, ms, return_info)
 
         entry_val = RegisteredSwitch(ms=ms, callback=callback)
-        entry_key = str(switch_name) + '-' + str(state)
-
-        self.registered_switches[entry_key].append(entry_val)
+        switch = self._get_switch(switch_name)
+        # copy on write so dispatches in progress are not affected
+        switch.handlers[state] += (entry_val, )
 
         # If the switch handler that was just registered has a delay (i.e. ms>0,
         # then let's see if the switch is currently in the state that the
@@ -566,6 +578,12 @@ class SwitchController(MpfController):
         # Return the args we used to setup this handler for easy removal later
         return SwitchHandler(switch_name, callback, state, ms)
 
+    def _get_switch(self, switch_name) -> Switch:
+        """Return switch object for a name or switch."""
+        if isinstance(switch_name, Switch):
+            return switch_name
+        return self.machine.switches[switch_name]
+
     def remove_switch_handler_by_key(self, switch_handler: SwitchHandler):
         """Remove switch handler by key returned from add_switch_handler."""
         self.remove_switch_handler(switch_handler.switch_name, switch_handler.callback, switch_handler.state,
@@ -582,12 +600,20 @@ class SwitchController(MpfController):
             "Removing switch handler. Switch: %s, State: %s, ms: %s",
             switch_name, state, ms)
 
-        entry_key = str(switch_name) + '-' + str(state)
-
-        if entry_key in self.registered_switches.keys():
-            for _, settings in enumerate(list(self.registered_switches[entry_key])):
-                if settings.ms == ms and settings.callback == callback:
-                    self.registered_switches[entry_key].remove(settings)
+        try:
+            switch = self._get_switch(switch_name)
+        except KeyError:
+            # nothing registered for unknown switches
+            switch = None
+
+        if switch:
+            remaining = []
+            for entry in switch.handlers[state]:
+                if entry.ms == ms and entry.callback == callback:
+                    entry.removed = True
+                else:
+                    remaining.append(entry)
+            switch.handlers[state] = tuple(remaining)
 
         for k in list(self.active_timed_switches.keys()):
             timed_entry = self.active_timed_switches[k]
@@ -175,6 +175,17 @@ class TextUi(MpfController):
 
             self.screen.print_at(bcp_string, len(stats_str) - 2, height - 1, colour=5)
 
+        # Profiler stats
+        if self.machine.events.profiler:
+            stats = self.machine.events.profiler.get_stats(top=1)
+            profiler_str = 'LOOP LAG p99: {}ms  QUEUE max: {}'.format(
+                stats["loop_lag"]["p99_ms"], stats["queue_depth"]["max"])
+            if stats["handlers"]:
+                profiler_str += '  SLOWEST: {} {}ms'.format(
+                    stats["handlers"][0]["name"], stats["handlers"][0]["total_ms"])
+            profiler_str = profiler_str[:width].ljust(width)
+            self.screen.print_at(profiler_str, 0, height - 3, colour=3)
+
     def _update_switch_layout(self):
         start_row = 4
         cutoff = int(len(self.machine.switches) / 2) + start_row - 1
@@ -1,5 +1,5 @@
 """Contains the Util class which includes many utility functions."""
-from copy import deepcopy
+from copy import copy, deepcopy
 import re
 from fractions import Fraction
 from functools import reduce
@@ -204,6 +204,12 @@ class Util(object):
         This code was based on this:
         https://www.xormedia.com/recursively-merge-dictionaries-in-python/
 
+        Neither a nor b are modified (except for the `_overwrite` key). Only
+        the dicts on paths which are changed by b are copied. All other values
+        in the result are shared with a, so the cost of a merge depends on the
+        size of b instead of the size of a. Do not modify a after the merge if
+        you want to keep the result unchanged.
+
         Args:
             a (dict): The first dictionary
             b (dict): The second dictionary
@@ -219,7 +225,8 @@ class Util(object):
         # log.info("Dict Merge incoming B %s", b)
         if not isinstance(b, dict):
             return b
-        result = deepcopy(a)
+        # copy only this level. nested dicts are copied when they are merged
+        result = copy(a)
         for k, v in b.items():
             if isinstance(v, dict) and '_overwrite' in v:
                 result[k] = v
@@ -233,7 +240,7 @@ class Util(object):
                 if v[0] == dict(_overwrite=True):
                     result[k] = v[1:]
                 elif combine_lists:
-                    result[k].extend(v)
+                    result[k] = result[k] + list(v)
                 else:
                     result[k] = deepcopy(v)
             else:
@@ -432,8 +432,7 @@ class Light(SystemWideDevice):
         for color, hw_driver in self.hw_drivers.items():
             hw_driver.set_fade(partial(self._get_brightness_and_fade, color=color))
 
-        for platform in self.platforms:
-            platform.light_sync()
+        self.machine.light_controller.light_sync(self.platforms)
 
     def clear_stack(self):
         """Remove all entries from the stack and resets this light to 'off'."""
@@ -74,8 +74,12 @@ class LightGroup(SystemWideDevice):
 
     def color(self, color, fade_ms=None, priority=0, key=None):
         """Call color on all lights in this group."""
-        for light in self.lights:
-            light.color(color, fade_ms, priority, key)
+        self.machine.light_controller.begin_batch()
+        try:
+            for light in self.lights:
+                light.color(color, fade_ms, priority, key)
+        finally:
+            self.machine.light_controller.end_batch()
 
 
 class LightStrip(LightGroup):
@@ -11,6 +11,8 @@ MYPY = False
 if MYPY:   # pragma: no cover
     from mpf.platforms.interfaces.switch_platform_interface import SwitchPlatformInterface
     from mpf.core.platform import SwitchPlatform
+    from mpf.core.switch_controller import RegisteredSwitch
+    from typing import List, Tuple
 
 
 @DeviceMonitor("state", "recycle_jitter_count")
@@ -42,6 +44,10 @@ class Switch(SystemWideDevice):
         self.recycle_clear_time = 0
         self.recycle_jitter_count = 0
 
+        self.handlers = [(), ()]    # type: List[Tuple[RegisteredSwitch, ...]]
+        """Handlers for the inactive (0) and active (1) state. Managed by the
+        switch controller which dispatches switch changes directly from here."""
+
         # register switch so other devices can add handlers to it
         self.machine.switch_controller.register_switch(name)
 
@@ -19,8 +19,8 @@ from ruamel.yaml.parser_ import Parser
 from ruamel.yaml.composer import Composer
 from ruamel.yaml.constructor import Constructor, ConstructorError
 
+from mpf.core.case_insensitive_dict import lower_key
 from mpf.core.file_manager import FileInterface, FileManager
-from mpf.core.utility_functions import Util
 from mpf._version import __version__, __config_version__
 
 log = logging.getLogger('YAML Interface')
@@ -105,7 +105,37 @@ MpfResolver.add_implicit_resolver(
 
 class MpfConstructor(Constructor):
 
-    """Constructor with fix."""
+    """Constructor with fix.
+
+    When lower_keys is set, it also converts keys to lowercase strings while
+    constructing mappings. Like Util.keys_to_lower this applies to the root
+    mapping (or the mappings in a root list) and to all mappings nested
+    directly in those but not to mappings in nested lists.
+    """
+
+    lower_keys = False
+
+    def __init__(self):
+        """Initialise constructor."""
+        Constructor.__init__(self)
+        self._lower_nodes = set()
+
+    def _mark_lower(self, node):
+        """Mark a root node (or the items of a root list) for key conversion."""
+        if isinstance(node, yaml.MappingNode):
+            self._lower_nodes.add(node)
+        elif isinstance(node, yaml.SequenceNode):
+            for item in node.value:
+                self._mark_lower(item)
+
+    def construct_document(self, node):
+        """Construct document and convert keys."""
+        if self.lower_keys:
+            self._mark_lower(node)
+        try:
+            return super().construct_document(node)
+        finally:
+            self._lower_nodes = set()
 
     def construct_mapping(self, node, deep=False):
         """Construct mapping but raise error when a section is defined twice.
@@ -115,6 +145,7 @@ class MpfConstructor(Constructor):
         if not isinstance(node, yaml.MappingNode):  # pragma: no cover
             raise ConstructorError(problem="expected a mapping node, but found %s" % node.id,
                                    problem_mark=node.start_mark)
+        lower = node in self._lower_nodes
         mapping = {}
         for key_node, value_node in node.value:
             # keys can be list -> deep
@@ -128,12 +159,19 @@ class MpfConstructor(Constructor):
                     "while constructing a mapping", node.start_mark,
                     "found unhashable key", key_node.start_mark)
 
+            if lower and isinstance(value_node, yaml.MappingNode):
+                # nested mappings are converted as well
+                self._lower_nodes.add(value_node)
             value = self.construct_object(value_node, deep=deep)
             # next two lines differ from original
             if key in mapping:
                 raise KeyError("Key \"{}\" was defined multiple times in config {}".
                                format(key, key_node.start_mark))
             mapping[key] = value
+
+        if lower:
+            return dict((lower_key(key) if isinstance(key, str) else str(key).lower(), value)
+                        for key, value in mapping.items())
         return mapping
 
 
@@ -151,6 +189,46 @@ class MpfLoader(Reader, Scanner, Parser, Composer, MpfConstructor, MpfResolver):
         MpfResolver.__init__(self)
 
 
+class MpfConfigLoader(MpfLoader):
+
+    """Config loader which converts keys to lowercase strings."""
+
+    lower_keys = True
+
+
+try:
+    from ruamel.yaml.cyaml import CParser
+except ImportError:     # pragma: no cover
+    CParser = None
+
+
+if CParser:
+    class MpfCLoader(CParser, MpfConstructor, MpfResolver):
+
+        """Config loader which uses the libyaml scanner and parser.
+
+        Resolving and constructing still happens in Python so the result is
+        the same as for MpfLoader.
+        """
+
+        def __init__(self, stream):
+            """Initialise loader."""
+            CParser.__init__(self, stream)
+            MpfConstructor.__init__(self)
+            MpfResolver.__init__(self)
+
+    class MpfConfigCLoader(MpfCLoader):
+
+        """Config loader which uses libyaml and converts keys to lowercase strings."""
+
+        lower_keys = True
+
+    # pylint: disable-msg=invalid-name
+    DefaultLoader = MpfConfigCLoader
+else:   # pragma: no cover
+    DefaultLoader = MpfConfigLoader
+
+
 for ch in list(u'yYnNoO'):
     del Resolver.yaml_implicit_resolvers[ch]
 
@@ -162,6 +240,8 @@ class YamlInterface(FileInterface):
     file_types = ['.yaml', '.yml']
     cache = False
     file_cache = dict()     # type: Dict[str, Any]
+    # files parsed ahead of time (see ConfigProcessor.preload_config_files)
+    preloaded_files = dict()    # type: Dict[str, Any]
 
     @staticmethod
     def get_config_file_version(filename: str) -> int:
@@ -252,8 +332,11 @@ class YamlInterface(FileInterface):
         try:
             self.log.debug("Loading file: %s", filename)
 
-            with open(filename, encoding='utf8') as f:
-                config = self.process(f)
+            if filename in self.preloaded_files:
+                config = self.preloaded_files.pop(filename)
+            else:
+                with open(filename, encoding='utf8') as f:
+                    config = self.process(f)
         except Exception as e:   # pylint: disable-msg=broad-except
             if hasattr(e, 'problem_mark'):
                 mark = e.problem_mark
@@ -273,9 +356,33 @@ class YamlInterface(FileInterface):
         return config
 
     @staticmethod
-    def process(data_string: Iterable[str]) -> dict:
-        """Parse yaml from a string."""
-        return Util.keys_to_lower(yaml.load(data_string, Loader=MpfLoader))
+    def process(data_string: Iterable[str], loader=None) -> dict:
+        """Parse yaml from a string and convert keys to lowercase strings.
+
+        Uses the libyaml based loader when it is available. A custom loader
+        has to set lower_keys.
+        """
+        config = yaml.load(data_string, Loader=loader or DefaultLoader)
+        if not config:
+            return dict()
+        elif isinstance(config, list):
+            return YamlInterface._finish_list(config)
+        elif isinstance(config, dict):
+            return config
+        else:
+            raise AssertionError("Source dict has invalid format.")
+
+    @staticmethod
+    def _finish_list(config: list) -> list:
+        """Replace empty items in a root list with empty dicts."""
+        for num, item in enumerate(config):
+            if not item:
+                config[num] = dict()
+            elif isinstance(item, list):
+                YamlInterface._finish_list(item)
+            elif not isinstance(item, dict):
+                raise AssertionError("Source dict has invalid format.")
+        return config
 
     def save(self, filename: str, data: dict) -> None:   # pragma: no cover
         """Save config to yaml file."""
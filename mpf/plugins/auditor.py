@@ -1,6 +1,8 @@
 """MPF plugin for an auditor which records switch events, high scores, shots, etc."""
 
+import copy
 import logging
+from types import MappingProxyType
 
 from mpf.core.switch_controller import MonitoredSwitchChange
 from mpf.devices.shot import Shot
@@ -8,7 +10,68 @@ from mpf.devices.shot import Shot
 MYPY = False
 if MYPY:   # pragma: no cover
     from mpf.core.machine import MachineController
-    from typing import Any, Set
+    from mpf.core.clock import PeriodicTask
+    from typing import Any, Dict, List, Set, Tuple
+
+
+class AuditCounters(object):
+
+    """Preallocated audit counters.
+
+    Every counter lives in a slot of a flat list. Callers resolve the slot of a
+    category/name pair once and increment it afterwards. Changed slots are
+    remembered so they can be exported to machine vars in batches.
+    """
+
+    __slots__ = ["_values", "_slots", "_names", "_dirty"]
+
+    def __init__(self) -> None:
+        """Initialise counters."""
+        self._values = []           # type: List[int]
+        self._slots = {}            # type: Dict[str, Dict[str, int]]
+        self._names = []            # type: List[Tuple[str, str]]
+        self._dirty = set()         # type: Set[int]
+
+    def add_counter(self, category: str, name: str, value: int = 0) -> int:
+        """Allocate a counter (if it does not exist yet) and return its slot."""
+        category_slots = self._slots.setdefault(category, {})
+        try:
+            return category_slots[name]
+        except KeyError:
+            pass
+
+        slot = len(self._values)
+        self._values.append(value)
+        self._names.append((category, name))
+        category_slots[name] = slot
+        return slot
+
+    def get_slot(self, category: str, name: str) -> int:
+        """Return the slot of a counter or None if it does not exist."""
+        try:
+            return self._slots[category][name]
+        except KeyError:
+            return None
+
+    def increment(self, slot: int) -> None:
+        """Increment the counter in slot."""
+        self._values[slot] += 1
+        self._dirty.add(slot)
+
+    def get_value(self, category: str, name: str) -> int:
+        """Return the value of a counter."""
+        return self._values[self._slots[category][name]]
+
+    def get_snapshot(self) -> "Dict[str, Dict[str, int]]":
+        """Return a copy of all counters by category."""
+        return {category: {name: self._values[slot] for name, slot in slots.items()}
+                for category, slots in self._slots.items()}
+
+    def pop_changes(self) -> "List[Tuple[str, str, int]]":
+        """Return category, name and value of all counters changed since the last call."""
+        changes = [self._names[slot] + (self._values[slot],) for slot in sorted(self._dirty)]
+        self._dirty.clear()
+        return changes
 
 
 class Auditor(object):
@@ -33,7 +96,10 @@ class Auditor(object):
         self.machine.auditor = self
         self.switchnames_to_audit = set()       # type: Set[str]
         self.config = None                      # type: Any
-        self.current_audits = None              # type: Any
+        self.counters = AuditCounters()
+        self.player_audits = dict()             # type: Dict[str, Any]
+        self._switch_slots = dict()             # type: Dict[str, int]
+        self._export_task = None                # type: PeriodicTask
 
         self.enabled = False
         """Attribute that's viewed by other core components to let them know
@@ -56,43 +122,39 @@ class Auditor(object):
 
         self.config = self.machine.config_validator.validate_config('auditor', self.machine.config['auditor'])
 
-        self.current_audits = self.data_manager.get_data()
+        current_audits = self.data_manager.get_data()
 
-        if not isinstance(self.current_audits, dict):
-            self.current_audits = dict()
+        # player audits are no counters
+        if isinstance(current_audits.get('player', None), dict):
+            self.player_audits = current_audits['player']
 
-        # Make sure we have all the sections we need in our audit dict
-        if 'switches' not in self.current_audits:
-            self.current_audits['switches'] = dict()
-
-        if 'events' not in self.current_audits:
-            self.current_audits['events'] = dict()
-
-        if 'player' not in self.current_audits:
-            self.current_audits['player'] = dict()
+        for category, audits in current_audits.items():
+            if category == 'player' or not isinstance(audits, dict):
+                continue
+            for name, value in audits.items():
+                self.counters.add_counter(category, name, value)
 
-        # Make sure we have all the switches in our audit dict
+        # Make sure we have all the switches in our audit counters
         for switch in self.machine.switches:
-            if (switch.name not in self.current_audits['switches'] and
-                    'no_audit' not in switch.tags):
-                self.current_audits['switches'][switch.name] = 0
+            if 'no_audit' not in switch.tags:
+                self._switch_slots[switch.name] = self.counters.add_counter('switches', switch.name)
 
         # build the list of switches we should audit
-        self.switchnames_to_audit = {x.name for x in self.machine.switches
-                                     if 'no_audit' not in x.tags}
+        self.switchnames_to_audit = set(self._switch_slots.keys())
 
         # Make sure we have all the player stuff in our audit dict
         if 'player' in self.config['audit']:
             for item in self.config['player']:
-                if item not in self.current_audits['player']:
-                    self.current_audits['player'][item] = dict()
-                    self.current_audits['player'][item]['top'] = list()
-                    self.current_audits['player'][item]['average'] = 0
-                    self.current_audits['player'][item]['total'] = 0
+                if item not in self.player_audits:
+                    self.player_audits[item] = dict()
+                    self.player_audits[item]['top'] = list()
+                    self.player_audits[item]['average'] = 0
+                    self.player_audits[item]['total'] = 0
 
         # Register for the events the auditor needs to do its job
         self.machine.events.add_handler('game_starting', self.enable)
         self.machine.events.add_handler('game_ended', self.disable)
+        self.machine.events.add_handler('shutdown', self._shutdown)
         if 'player' in self.config['audit']:
             self.machine.events.add_handler('game_ending', self.audit_player)
 
@@ -103,12 +165,56 @@ class Auditor(object):
         # Add the switches monitor
         self.machine.switch_controller.add_monitor(self.audit_switch)
 
-        for category, audits in self.current_audits.items():
-            if not isinstance(audits, dict):
-                continue
+        for category, audits in self.counters.get_snapshot().items():
             for name, value in audits.items():
                 self.machine.set_machine_var("audits_{}_{}".format(category, name), value)
 
+        for name, value in self.player_audits.items():
+            self.machine.set_machine_var("audits_player_{}".format(name), value)
+
+    @property
+    def current_audits(self):
+        """Return a read-only snapshot of all audits.
+
+        Audits cannot be changed here anymore. Use audit() instead.
+        """
+        return self._read_only(self.get_snapshot())
+
+    @classmethod
+    def _read_only(cls, data):
+        if isinstance(data, dict):
+            return MappingProxyType({key: cls._read_only(value) for key, value in data.items()})
+        if isinstance(data, list):
+            return tuple(cls._read_only(value) for value in data)
+        return data
+
+    def get_snapshot(self):
+        """Return a copy of all audits.
+
+        The counters in the snapshot are consistent with each other and will
+        not change afterwards. Use this in service mode or monitors.
+        """
+        snapshot = self.counters.get_snapshot()
+        for category in ('switches', 'events'):
+            if category not in snapshot:
+                snapshot[category] = dict()
+        snapshot['player'] = copy.deepcopy(self.player_audits)
+        return snapshot
+
+    def _stop_export(self):
+        if self._export_task:
+            self._export_task.cancel()
+            self._export_task = None
+
+    def _shutdown(self, **kwargs):
+        del kwargs
+        self._stop_export()
+
+    def _export_counters(self):
+        """Export all changed counters to machine vars."""
+        for category, name, value in self.counters.pop_changes():
+            self.machine.set_machine_var("audits_{}_{}".format(category, name), value)
+
     def audit(self, audit_class, event, **kwargs):
         """Log an auditable event.
 
@@ -121,19 +227,18 @@ class Auditor(object):
         """
         del kwargs
 
-        if audit_class not in self.current_audits:
-            self.current_audits[audit_class] = dict()
-
-        if event not in self.current_audits[audit_class]:
-            self.current_audits[audit_class][event] = 0
+        slot = self.counters.get_slot(audit_class, event)
+        if slot is None:
+            slot = self.counters.add_counter(audit_class, event)
 
-        self.current_audits[audit_class][event] += 1
-        self.machine.set_machine_var("audits_{}_{}".format(audit_class, event), self.current_audits[audit_class][event])
+        self.counters.increment(slot)
 
     def audit_switch(self, change: MonitoredSwitchChange):
         """Record switch change."""
-        if self.enabled and change.state and change.name in self.switchnames_to_audit:
-            self.audit('switches', change.name)
+        if self.enabled and change.state:
+            slot = self._switch_slots.get(change.name, None)
+            if slot is not None:
+                self.counters.increment(slot)
 
     def audit_shot(self, name, profile, state):
         """Record shot hit."""
@@ -151,7 +256,7 @@ class Auditor(object):
         """
         del kwargs
 
-        self.current_audits['events'][eventname] += 1
+        self.audit('events', eventname)
 
     def audit_player(self, **kwargs):
         """Write player data to the audit log.
@@ -166,19 +271,19 @@ class Auditor(object):
         for item in self.config['player']:
             for player in self.machine.game.player_list:
 
-                self.current_audits['player'][item]['top'] = (
+                self.player_audits[item]['top'] = (
                     self._merge_into_top_list(
                         player[item],
-                        self.current_audits['player'][item]['top'],
+                        self.player_audits[item]['top'],
                         self.config['num_player_top_records']))
 
-                self.current_audits['player'][item]['average'] = (
-                    ((self.current_audits['player'][item]['total'] *
-                      self.current_audits['player'][item]['average']) +
+                self.player_audits[item]['average'] = (
+                    ((self.player_audits[item]['total'] *
+                      self.player_audits[item]['average']) +
                      self.machine.game.player[item]) /
-                    (self.current_audits['player'][item]['total'] + 1))
+                    (self.player_audits[item]['total'] + 1))
 
-                self.current_audits['player'][item]['total'] += 1
+                self.player_audits[item]['total'] += 1
 
     @classmethod
     def _merge_into_top_list(cls, new_item, current_list, num_items):
@@ -206,6 +311,8 @@ class Auditor(object):
 
         self.log.debug("Enabling the Auditor")
         self.enabled = True
+        self._export_task = self.machine.clock.schedule_interval(self._export_counters,
+                                                                 self.config['export_interval'] / 1000)
 
         # Register for the events we're auditing
         if 'events' in self.config['audit']:
@@ -215,8 +322,7 @@ class Auditor(object):
                                                 eventname=event,
                                                 priority=2)
                 # Make sure we have an entry in our audit file for this event
-                if event not in self.current_audits['events']:
-                    self.current_audits['events'][event] = 0
+                self.counters.add_counter('events', event)
 
         for event in self.config['save_events']:
             self.machine.events.add_handler(event, self._save_audits,
@@ -224,13 +330,16 @@ class Auditor(object):
 
     def _save_audits(self, **kwargs):
         del kwargs
-        self.data_manager.save_all(data=self.current_audits)
+        self._export_counters()
+        self.data_manager.save_all(data=self.get_snapshot())
 
     def disable(self, **kwargs):
         """Disable the auditor."""
         del kwargs
         self.log.debug("Disabling the Auditor")
         self.enabled = False
+        self._stop_export()
+        self._export_counters()
 
         # remove switch and event handlers
         self.machine.events.remove_handler(self.audit_event)
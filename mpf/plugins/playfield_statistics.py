@@ -0,0 +1,391 @@
+"""MPF plugin which records time series of switch hits, shots and events for audits and tuning."""
+import logging
+import os
+import sqlite3
+import time
+from array import array
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from mpf.core.switch_controller import MonitoredSwitchChange
+from mpf.devices.shot import Shot
+
+MYPY = False
+if MYPY:   # pragma: no cover
+    from concurrent.futures import Future
+    from mpf.core.machine import MachineController
+    from typing import Any, Deque, Dict, List, Tuple
+
+
+class TimeSeriesRing(object):
+
+    """Ring buffer of fixed size time buckets.
+
+    Every bucket stores the number of samples, their sum and their maximum.
+    Buckets which are older than the size of the ring are overwritten so memory
+    stays bounded.
+    """
+
+    __slots__ = ["bucket_secs", "size", "counts", "totals", "maxima", "_last_bucket"]
+
+    def __init__(self, bucket_secs: int, size: int) -> None:
+        """Initialise ring."""
+        self.bucket_secs = bucket_secs
+        self.size = size
+        self.counts = array('L', [0] * size)
+        self.totals = array('d', [0.0] * size)
+        self.maxima = array('d', [0.0] * size)
+        self._last_bucket = None
+
+    def _advance(self, bucket: int) -> None:
+        """Clear all buckets between the last used bucket and bucket."""
+        if self._last_bucket is None or bucket - self._last_bucket >= self.size:
+            for index in range(self.size):
+                self.counts[index] = 0
+                self.totals[index] = 0.0
+                self.maxima[index] = 0.0
+        else:
+            for skipped in range(self._last_bucket + 1, bucket + 1):
+                index = skipped % self.size
+                self.counts[index] = 0
+                self.totals[index] = 0.0
+                self.maxima[index] = 0.0
+        self._last_bucket = bucket
+
+    def add(self, timestamp: float, value: float = 1.0, count: int = 1, maximum: float = None) -> None:
+        """Add a sample (or an already aggregated bucket when count > 1)."""
+        bucket = int(timestamp // self.bucket_secs)
+        if self._last_bucket is None or bucket > self._last_bucket:
+            self._advance(bucket)
+        elif bucket <= self._last_bucket - self.size:
+            # too old for this ring
+            return
+
+        index = bucket % self.size
+        self.counts[index] += count
+        self.totals[index] += value
+        if maximum is None:
+            maximum = value
+        if maximum > self.maxima[index]:
+            self.maxima[index] = maximum
+
+    def get_buckets(self, now: float = None) -> "List[Tuple[float, int, float, float]]":
+        """Return (start_time, count, total, max) of all non-empty buckets (oldest first)."""
+        if self._last_bucket is None:
+            return []
+
+        # buckets which are older than the ring relative to now are expired
+        newest_bucket = self._last_bucket
+        if now is not None:
+            newest_bucket = max(newest_bucket, int(now // self.bucket_secs))
+
+        buckets = []
+        for bucket in range(newest_bucket - self.size + 1, self._last_bucket + 1):
+            index = bucket % self.size
+            if self.counts[index]:
+                buckets.append((bucket * self.bucket_secs, self.counts[index], self.totals[index],
+                                self.maxima[index]))
+        return buckets
+
+
+class StatisticsStore(object):
+
+    """Time series store with per-minute, per-hour and per-game resolution.
+
+    Samples are added to a per-minute ring. The same samples are downsampled
+    into a per-hour ring which covers a longer period. Additionally, the store
+    keeps totals for the current game and the last games.
+    """
+
+    RESOLUTIONS = {"minute": 60, "hour": 3600}
+
+    def __init__(self, minutes: int, hours: int, games: int) -> None:
+        """Initialise store."""
+        self._sizes = {"minute": minutes, "hour": hours}
+        self.series = {}                        # type: Dict[str, Dict[str, TimeSeriesRing]]
+        self.current_game = {}                  # type: Dict[str, List[float]]
+        self.games = deque(maxlen=games)        # type: Deque[Dict[str, List[float]]]
+
+    def _get_rings(self, name: str) -> "Dict[str, TimeSeriesRing]":
+        try:
+            return self.series[name]
+        except KeyError:
+            rings = {resolution: TimeSeriesRing(secs, self._sizes[resolution])
+                     for resolution, secs in self.RESOLUTIONS.items()}
+            self.series[name] = rings
+            return rings
+
+    def add(self, name: str, timestamp: float, value: float = 1.0) -> None:
+        """Add a sample to a series."""
+        for ring in self._get_rings(name).values():
+            ring.add(timestamp, value)
+
+        try:
+            game_stats = self.current_game[name]
+        except KeyError:
+            self.current_game[name] = [1, value, value]
+        else:
+            game_stats[0] += 1
+            game_stats[1] += value
+            if value > game_stats[2]:
+                game_stats[2] = value
+
+    def end_game(self) -> None:
+        """Finish the current game and add it to the game history."""
+        self.games.append(self.current_game)
+        self.current_game = {}
+
+    def get_series_names(self) -> "List[str]":
+        """Return the names of all series."""
+        return sorted(self.series.keys())
+
+    def query(self, name: str, resolution: str = "minute", now: float = None) -> "List[Dict[str, Any]]":
+        """Return all buckets of a series in a resolution."""
+        if name not in self.series:
+            return []
+        return [{"time": start, "count": count, "total": total, "max": maximum}
+                for start, count, total, maximum in self.series[name][resolution].get_buckets(now)]
+
+    def query_games(self, name: str) -> "List[Dict[str, Any]]":
+        """Return the stats of a series for the last games (oldest first)."""
+        result = []
+        for game in self.games:
+            count, total, maximum = game.get(name, (0, 0.0, 0.0))
+            result.append({"count": count, "total": total, "max": maximum})
+        return result
+
+    def save(self, filename: str) -> None:
+        """Write the store to a SQLite file."""
+        rows, game_rows = self.get_rows()
+        self.write_rows(filename, rows, game_rows)
+
+    def get_rows(self) -> "Tuple[List[Tuple], List[Tuple]]":
+        """Return all buckets and game stats as rows for persistence."""
+        rows = []
+        for name, rings in self.series.items():
+            for resolution, ring in rings.items():
+                for start, count, total, maximum in ring.get_buckets():
+                    rows.append((name, resolution, start, count, total, maximum))
+
+        game_rows = []
+        for game_num, game in enumerate(self.games):
+            for name, (count, total, maximum) in game.items():
+                game_rows.append((game_num, name, count, total, maximum))
+
+        return rows, game_rows
+
+    @staticmethod
+    def write_rows(filename: str, rows: "List[Tuple]", game_rows: "List[Tuple]") -> None:
+        """Write rows to a SQLite file.
+
+        The file is written to a temporary file first and then replaced
+        atomically. This does not touch the store so it may run in a thread.
+        """
+        os.makedirs(os.path.dirname(filename), exist_ok=True)
+        tmp_filename = filename + ".tmp"
+        if os.path.isfile(tmp_filename):
+            os.remove(tmp_filename)
+        connection = sqlite3.connect(tmp_filename)
+        try:
+            connection.execute("CREATE TABLE buckets (series TEXT, resolution TEXT, start REAL, count INTEGER, "
+                               "total REAL, max REAL)")
+            connection.execute("CREATE TABLE games (game INTEGER, series TEXT, count INTEGER, total REAL, max REAL)")
+            connection.executemany("INSERT INTO buckets VALUES (?, ?, ?, ?, ?, ?)", rows)
+            connection.executemany("INSERT INTO games VALUES (?, ?, ?, ?, ?)", game_rows)
+            connection.commit()
+        finally:
+            connection.close()
+
+        os.replace(tmp_filename, filename)
+
+    def load(self, filename: str) -> None:
+        """Load the store from a SQLite file."""
+        connection = sqlite3.connect(filename)
+        try:
+            for name, resolution, start, count, total, maximum in connection.execute(
+                    "SELECT series, resolution, start, count, total, max FROM buckets ORDER BY start"):
+                if resolution not in self.RESOLUTIONS:
+                    continue
+                self._get_rings(name)[resolution].add(start, total, count, maximum)
+
+            games = {}      # type: Dict[int, Dict[str, List[float]]]
+            for game_num, name, count, total, maximum in connection.execute(
+                    "SELECT game, series, count, total, max FROM games ORDER BY game"):
+                games.setdefault(game_num, {})[name] = [count, total, maximum]
+            for game_num in sorted(games.keys()):
+                self.games.append(games[game_num])
+        finally:
+            connection.close()
+
+
+class PlayfieldStatistics(object):
+
+    """Records switch hits, shot hits, events, ball times and switch active times as time series."""
+
+    def __init__(self, machine: "MachineController") -> None:
+        """Initialise playfield statistics.
+
+        Args:
+            machine: A reference to the machine controller object.
+        """
+        if 'playfield_statistics' not in machine.config:
+            machine.log.debug('"playfield_statistics:" section not found in '
+                              'machine configuration, so the playfield '
+                              'statistics will not be recorded.')
+            return
+
+        self.log = logging.getLogger('PlayfieldStatistics')
+        self.machine = machine
+        self.machine.playfield_statistics = self
+        self.config = None          # type: Any
+        self.store = None           # type: StatisticsStore
+        self.filename = None        # type: str
+        self._switch_active_since = {}          # type: Dict[str, float]
+        self._ball_started = None               # type: float
+        self._wall_clock_offset = 0.0
+        self._executor = None       # type: ThreadPoolExecutor
+        self._save_future = None    # type: Future
+
+        self.machine.events.add_handler('init_phase_4', self._initialize)
+
+    def __repr__(self):
+        """Return string representation."""
+        return '<PlayfieldStatistics>'
+
+    def _initialize(self, **kwargs):
+        del kwargs
+        self.config = self.machine.config_validator.validate_config('playfield_statistics',
+                                                                    self.machine.config['playfield_statistics'])
+        self.store = StatisticsStore(self.config['minutes_to_keep'], self.config['hours_to_keep'],
+                                     self.config['games_to_keep'])
+
+        # buckets are based on wall time so they survive reboots
+        self._wall_clock_offset = time.time() - self.machine.clock.get_time()
+
+        config_path = self.machine.config['mpf']['paths'].get('playfield_statistics', False)
+        if config_path:
+            self.filename = os.path.join(self.machine.machine_path, config_path)
+            self._executor = ThreadPoolExecutor(1)
+            if os.path.isfile(self.filename):
+                try:
+                    self.store.load(self.filename)
+                except sqlite3.Error as e:
+                    self.log.warning("Could not load playfield statistics from %s: %s", self.filename, e)
+
+        self.machine.switch_controller.add_monitor(self._switch_changed)
+
+        Shot.monitor_enabled = True
+        self.machine.register_monitor('shots', self._shot_hit)
+
+        for event in self.config['events']:
+            self.machine.events.add_handler(event, self._event_posted, event_name=event, priority=2)
+
+        self.machine.events.add_handler('ball_started', self._ball_started_handler)
+        self.machine.events.add_handler('ball_will_end', self._ball_will_end)
+        self.machine.events.add_handler('game_ended', self._game_ended)
+        self.machine.events.add_handler('shutdown', self._shutdown)
+
+        if self.machine.bcp.interface.configured:
+            self.machine.bcp.interface.register_command_callback('playfield_statistics', self._bcp_query)
+
+    def _get_time(self):
+        return self.machine.clock.get_time() + self._wall_clock_offset
+
+    def _switch_changed(self, change: MonitoredSwitchChange):
+        now = self._get_time()
+        if change.state:
+            self.store.add("switch:" + change.name, now)
+            self._switch_active_since[change.name] = now
+        else:
+            active_since = self._switch_active_since.pop(change.name, None)
+            if active_since is not None:
+                self.store.add("switch_active_secs:" + change.name, now, now - active_since)
+
+    def _shot_hit(self, name, profile, state):
+        del profile
+        del state
+        self.store.add("shot:" + name, self._get_time())
+
+    def _event_posted(self, event_name, **kwargs):
+        del kwargs
+        self.store.add("event:" + event_name, self._get_time())
+
+    def _ball_started_handler(self, **kwargs):
+        del kwargs
+        self._ball_started = self._get_time()
+
+    def _ball_will_end(self, **kwargs):
+        del kwargs
+        if self._ball_started is None:
+            return
+        now = self._get_time()
+        self.store.add("ball_time_secs", now, now - self._ball_started)
+        self._ball_started = None
+
+    def _game_ended(self, **kwargs):
+        del kwargs
+        self.store.end_game()
+        self.save()
+
+    def _shutdown(self, **kwargs):
+        del kwargs
+        if not self.filename:
+            return
+
+        # a background save would write the same temporary file. drop it if it
+        # did not start yet or wait until it finished
+        if self._save_future:
+            self._save_future.cancel()
+        self._executor.shutdown(wait=True)
+        self.store.save(self.filename)
+
+    def save(self):
+        """Write statistics to disk in a background thread.
+
+        Saves run one after another. A save which did not start yet is
+        replaced by one with the current statistics.
+        """
+        if not self.filename:
+            return
+        if self._save_future:
+            self._save_future.cancel()
+        rows, game_rows = self.store.get_rows()
+        self._save_future = self._executor.submit(StatisticsStore.write_rows, self.filename, rows, game_rows)
+        self._save_future.add_done_callback(self._save_done)
+
+    def _save_done(self, future):
+        # runs in the background thread
+        if not future.cancelled() and future.exception():
+            self.log.warning("Could not save playfield statistics to %s: %s", self.filename, future.exception())
+
+    def query(self, series: str, resolution: str = "minute"):
+        """Return buckets of a series.
+
+        Resolution may be minute, hour or game.
+        """
+        if resolution == "game":
+            return self.store.query_games(series)
+        if resolution not in StatisticsStore.RESOLUTIONS:
+            raise AssertionError("Invalid resolution {}".format(resolution))
+        return self.store.query(series, resolution, self._get_time())
+
+    def _bcp_query(self, client, series=None, resolution="minute", **kwargs):
+        """Answer a playfield_statistics query via BCP."""
+        del kwargs
+        if not series:
+            self.machine.bcp.transport.send_to_client(client, bcp_command='playfield_statistics',
+                                                      series=self.store.get_series_names())
+            return
+
+        if resolution != "game" and resolution not in StatisticsStore.RESOLUTIONS:
+            self.machine.bcp.transport.send_to_client(
+                client, "error", cmd="playfield_statistics?resolution={}".format(resolution),
+                error="Invalid resolution value")
+            return
+
+        self.machine.bcp.transport.send_to_client(client, bcp_command='playfield_statistics',
+                                                  series=series, resolution=resolution,
+                                                  data=self.query(series, resolution))
+
+
+plugin_class = PlayfieldStatistics
@@ -0,0 +1,250 @@
+"""MPF plugin which records all switch changes to a compact binary journal for replay."""
+import json
+import logging
+import os
+import queue
+import struct
+import threading
+import time
+
+from mpf._version import version
+
+MYPY = False
+if MYPY:   # pragma: no cover
+    from mpf.core.machine import MachineController
+    from mpf.core.switch_controller import MonitoredSwitchChange
+    from typing import Any, Dict, List, Tuple
+
+# every journal file starts with MAGIC, the length of the header and a JSON
+# header with the switch names, their states and the clock at the start
+MAGIC = b"MPFSWJ01"
+HEADER_LENGTH = struct.Struct("<I")
+# microseconds since the start of the file, switch index, state
+RECORD = struct.Struct("<QHB")
+
+
+class SwitchJournalWriter(object):
+
+    """Writes switch changes to a journal file and rotates it.
+
+    Records are buffered and written on flush. When the file exceeds
+    max_bytes it is moved to ``<file>.1`` (older files are shifted up to
+    ``<file>.<max_files - 1>``) and a new file is started. Every file starts
+    with its own header so it can be replayed on its own. Disk usage is
+    bounded by about max_bytes * max_files.
+
+    The writer is not thread safe. SwitchJournal only uses it in its writing
+    thread.
+    """
+
+    def __init__(self, filename: str, switch_names: "List[str]", max_bytes: int, max_files: int) -> None:
+        """Initialise journal writer."""
+        self.filename = filename
+        self.switch_names = switch_names
+        self.max_bytes = max_bytes
+        self.max_files = max_files
+        self.states = [0] * len(switch_names)
+        self._file = None
+        self._size = 0
+        self._start = 0.0
+        self._buffer = bytearray()
+
+    def open(self, clock: float, states: "List[int]") -> None:
+        """Rotate existing journals and start a new file at clock."""
+        self.states = list(states)
+        self._rotate(clock)
+
+    def _rotate(self, clock: float) -> None:
+        if self._file:
+            self._file.close()
+            self._file = None
+
+        os.makedirs(os.path.dirname(self.filename), exist_ok=True)
+        for number in range(self.max_files - 1, 0, -1):
+            source = self.filename if number == 1 else "{}.{}".format(self.filename, number - 1)
+            if os.path.isfile(source):
+                os.replace(source, "{}.{}".format(self.filename, number))
+
+        header = json.dumps({
+            "mpf_version": version,
+            "time": time.time(),
+            "clock": clock,
+            "switches": self.switch_names,
+            "states": self.states,
+        }).encode()
+
+        self._file = open(self.filename, "wb")
+        self._file.write(MAGIC + HEADER_LENGTH.pack(len(header)) + header)
+        self._size = self._file.tell()
+        self._start = clock
+
+    def add(self, clock: float, index: int, state: int) -> None:
+        """Add a switch change."""
+        if self._size + len(self._buffer) >= self.max_bytes:
+            self.flush()
+            self._rotate(clock)
+
+        self._buffer += RECORD.pack(round((clock - self._start) * 1000000), index, state)
+        self.states[index] = state
+
+    def flush(self) -> None:
+        """Write all buffered records to the file."""
+        if not self._buffer or not self._file:
+            return
+
+        self._file.write(self._buffer)
+        self._file.flush()
+        self._size += len(self._buffer)
+        self._buffer = bytearray()
+
+    def close(self) -> None:
+        """Flush and close the file."""
+        self.flush()
+        if self._file:
+            self._file.close()
+            self._file = None
+
+
+def read_switch_journal(filename: str) -> "Tuple[Dict[str, Any], List[Tuple[float, int, int]]]":
+    """Return the header and all records of a journal file.
+
+    Records are tuples of the seconds since the start of the file, the switch
+    index in header["switches"] and the state. A record which has been cut
+    off by a crash is ignored.
+    """
+    with open(filename, "rb") as f:
+        data = f.read()
+
+    if not data.startswith(MAGIC):
+        raise ValueError("{} is not a switch journal".format(filename))
+
+    header_start = len(MAGIC) + HEADER_LENGTH.size
+    header_end = header_start + HEADER_LENGTH.unpack_from(data, len(MAGIC))[0]
+    header = json.loads(data[header_start:header_end].decode())
+
+    body = memoryview(data)[header_end:]
+    body = body[:len(body) - len(body) % RECORD.size]
+    records = [(offset / 1000000, index, state) for offset, index, state in RECORD.iter_unpack(body)]
+    return header, records
+
+
+def get_journal_files(filename: str) -> "List[str]":
+    """Return the journal file and all its rotated files, oldest first."""
+    files = []
+    number = 1
+    while os.path.isfile("{}.{}".format(filename, number)):
+        files.insert(0, "{}.{}".format(filename, number))
+        number += 1
+
+    if os.path.isfile(filename):
+        files.append(filename)
+
+    return files
+
+
+class SwitchJournal(object):
+
+    """Records every switch change with its time and state to a rotating binary journal.
+
+    The journal is written to ``mpf: paths: switch_journal``. Use
+    ``mpf replay`` to feed it back into a machine.
+
+    Switch changes are collected on the loop. Every ``flush_interval`` they
+    are passed to a writing thread which appends them to the file and rotates
+    it. The loop never waits for the disk.
+    """
+
+    def __init__(self, machine: "MachineController") -> None:
+        """Initialise switch journal.
+
+        Args:
+            machine: A reference to the machine controller object.
+        """
+        if 'switch_journal' not in machine.config:
+            machine.log.debug('"switch_journal:" section not found in '
+                              'machine configuration, so switch changes '
+                              'will not be recorded.')
+            return
+
+        self.log = logging.getLogger('SwitchJournal')
+        self.machine = machine
+        self.config = None          # type: Any
+        self.writer = None          # type: SwitchJournalWriter
+        self._indexes = {}          # type: Dict[str, int]
+        self._records = []          # type: List[Tuple[float, int, int]]
+        self._queue = queue.Queue()     # type: queue.Queue
+        self._thread = None         # type: threading.Thread
+
+        self.machine.events.add_handler('init_phase_4', self._initialize)
+
+    def __repr__(self):
+        """Return string representation."""
+        return '<SwitchJournal>'
+
+    def _initialize(self, **kwargs):
+        del kwargs
+        self.config = self.machine.config_validator.validate_config('switch_journal',
+                                                                    self.machine.config['switch_journal'])
+
+        config_path = self.machine.config['mpf']['paths'].get('switch_journal', False)
+        if not config_path:
+            return
+
+        names = sorted(switch.name for switch in self.machine.switches)
+        self._indexes = {name: index for index, name in enumerate(names)}
+        self.writer = SwitchJournalWriter(os.path.join(self.machine.machine_path, config_path), names,
+                                          self.config['max_file_kb'] * 1024, self.config['max_files'])
+        self.writer.open(self.machine.clock.get_time(), [self.machine.switches[name].state for name in names])
+
+        self._thread = threading.Thread(target=self._writing_thread, name="switch_journal")
+        self._thread.daemon = True
+        self._thread.start()
+
+        self.machine.switch_controller.add_monitor(self._switch_changed)
+        self.machine.clock.schedule_interval(self._flush, self.config['flush_interval'] / 1000)
+        self.machine.events.add_handler('shutdown', self._shutdown)
+
+    def _switch_changed(self, change: "MonitoredSwitchChange"):
+        try:
+            index = self._indexes[change.name]
+        except KeyError:
+            # switch is not configured
+            return
+
+        self._records.append((self.machine.clock.get_time(), index, change.state))
+
+    def _flush(self):
+        """Pass all collected switch changes to the writing thread."""
+        if not self._records:
+            return
+
+        self._queue.put(self._records)
+        self._records = []
+
+    def wait_for_writes(self):
+        """Block until all switch changes are written to the journal."""
+        self._flush()
+        self._queue.join()
+
+    def _writing_thread(self):
+        """Write switch changes until None is received. Then close the journal."""
+        while True:
+            records = self._queue.get()
+            try:
+                if records is None:
+                    self.writer.close()
+                    return
+
+                for clock, index, state in records:
+                    self.writer.add(clock, index, state)
+                self.writer.flush()
+            except OSError:     # pragma: no cover
+                self.log.exception("Failed to write switch journal")
+            finally:
+                self._queue.task_done()
+
+    def _shutdown(self, **kwargs):
+        del kwargs
+        self._flush()
+        self._queue.put(None)
+        self._thread.join()
@@ -18,7 +18,7 @@ from mpf.core.logging import LogMixin
 from mpf.core.rgb_color import RGBColor
 
 from mpf.tests.TestDataManager import TestDataManager
-from mpf.tests.loop import TimeTravelLoop, TestClock
+from mpf.tests.loop import TimeTravelLoop, TestClock, SynchronousExecutor
 
 import mpf.core
 import mpf.core.config_validator
@@ -39,6 +39,7 @@ class TestMachineController(MachineController):
     * Use the TestDataManager instead of the real one.
     * Use a test clock which we can manually advance instead of the regular
       clock tied to real-world time.
+    * Read asset files synchronously instead of in a thread pool.
     * Only load plugins if ``self._enable_plugins`` is *True*.
     * Merge any ``test_config_patches`` into the machine config.
     * Disabled the config file caching to always load the config from disk.
@@ -61,6 +62,10 @@ class TestMachineController(MachineController):
     def _load_clock(self):
         return self._test_clock
 
+    def create_asset_loader_executor(self, threads):
+        # load asset files on the loop to not depend on the timing of threads
+        return SynchronousExecutor()
+
     def __del__(self):
         if self._test_clock:
             self._test_clock.loop.close()
@@ -70,6 +75,10 @@ class TestMachineController(MachineController):
             if socket.ready():
                 callback()
 
+    def get_config_load_workers(self):
+        # parse config files serially in tests unless a test patches config_load_workers
+        return self.test_config_patches.get('mpf', {}).get('config_load_workers', 1)
+
     def _register_plugin_config_players(self):
         if self._enable_plugins:
             super()._register_plugin_config_players()
@@ -903,6 +912,7 @@ class MpfTestCase(unittest.TestCase):
         if mpf.core.config_validator.ConfigValidator.config_spec:
             mpf.core.config_validator.ConfigValidator.config_spec[key] = (
                 new_dict)
+            mpf.core.config_validator.ConfigValidator.config_spec_changed()
         else:
             mpf.core.config_validator.mpf_config_spec += '\n' + yaml.dump(
                 {key: new_dict}, default_flow_style=False)
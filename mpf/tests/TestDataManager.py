@@ -14,6 +14,7 @@ class TestDataManager(DataManager):
 
     def __init__(self, data):
         self.data = data
+        self._build_expire_index()
 
     def _trigger_save(self):
         pass
@@ -3,6 +3,7 @@ import socket
 from asyncio import base_events, coroutine, events      # type: ignore
 import collections
 import heapq
+from concurrent.futures import Executor, Future
 
 # A class to manage set of next events:
 from asyncio.selector_events import _SelectorSocketTransport
@@ -212,6 +213,24 @@ class TestSelector(selectors.BaseSelector):
         return self.keys
 
 
+class SynchronousExecutor(Executor):
+
+    """Executor which runs jobs right away in the calling thread.
+
+    Jobs do not take any time in the TimeTravelLoop so tests do not depend on
+    when a thread finishes. Their results are still passed to the loop using
+    call_soon_threadsafe.
+    """
+
+    def submit(self, fn, *args, **kwargs):
+        future = Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except BaseException as e:
+            future.set_exception(e)
+        return future
+
+
 # Based on TestLoop from asyncio.test_utils:
 class TimeTravelLoop(base_events.BaseEventLoop):
 
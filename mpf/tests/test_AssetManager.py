@@ -1,5 +1,13 @@
 """Test assets."""
+import os
+import shutil
+import tempfile
 import time
+from unittest.mock import patch
+
+from mpf.assets.show import Show
+from mpf.core.config_processor import ConfigProcessor
+from mpf.file_interfaces.yaml_interface import YamlInterface
 from mpf.tests.MpfTestCase import MpfTestCase
 
 
@@ -304,3 +312,81 @@ class TestAssets(MpfTestCase):
             this_set.add(self.machine.shows['group6'].show)
 
             self.assertEqual(len(this_set), 3)
+
+
+class TestAssetsParsedInProcessPool(TestAssets):
+
+    """Boot with machine config, mode configs and shows parsed in a process pool."""
+
+    def setUp(self):
+        self.machine_config_patches['mpf']['config_load_workers'] = 2
+        self.parsed_files = []
+        preload_config_files = ConfigProcessor.preload_config_files
+
+        def _preload_config_files(filenames, workers):
+            parsed = preload_config_files(filenames, workers)
+            self.parsed_files.append(parsed)
+            return parsed
+
+        patcher = patch.object(ConfigProcessor, "preload_config_files", _preload_config_files)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        # files cached by other tests would not be parsed again
+        cache_patcher = patch.dict(YamlInterface.file_cache, clear=True)
+        cache_patcher.start()
+        self.addCleanup(cache_patcher.stop)
+        super().setUp()
+
+    def test_files_parsed_in_pool(self):
+        # shows have been parsed by the pool
+        self.assertGreater(sum(self.parsed_files), 0)
+        # and every parsed file has been consumed
+        self.assertFalse(YamlInterface.preloaded_files)
+
+
+class TestThreadedAssetLoading(MpfTestCase):
+    def getMachinePath(self):
+        return 'tests/machine_files/asset_manager'
+
+    def getConfigFile(self):
+        return 'test_asset_loading.yaml'
+
+    def setUp(self):
+        self.machine_config_patches['mpf']['asset_loader_threads'] = 2
+        self.machine_config_patches['mpf']['asset_load_slice_ms'] = 1
+        super().setUp()
+
+    def test_switches_are_processed_while_show_loads(self):
+        self.assertTrue(self.machine.shows['show1'].loaded)
+
+        steps = 3000
+        show_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, show_dir)
+        show_file = os.path.join(show_dir, "big_show.yaml")
+        with open(show_file, "w") as f:
+            f.write("#show_version=5\n")
+            for step in range(steps):
+                f.write("- duration: 1\n  events: big_show_step_{}\n".format(step))
+
+        show = Show(self.machine, name="big_show", file=show_file, config={})
+
+        hits = []
+        self.machine.switch_controller.add_switch_handler(
+            "s_test", lambda: hits.append((show.loaded, len(show.show_steps or []))))
+
+        def _feed_switch(state=1):
+            # like switch changes from the hardware while the show is loading
+            if show.loaded:
+                return
+            self.machine.switch_controller.process_switch("s_test", state)
+            self.loop.call_soon(_feed_switch, 1 - state)
+
+        show.load()
+        self.loop.call_soon(_feed_switch)
+        self.advance_time_and_run(1)
+
+        self.assertTrue(show.loaded)
+        self.assertEqual(steps, show.total_steps)
+        self.assertEqual("big_show_step_2999", list(show.show_steps[-1]["events"].keys())[0])
+        # the switch was handled while the show was validated on the loop
+        self.assertTrue([loaded_steps for loaded, loaded_steps in hits if not loaded and 0 < loaded_steps < steps])
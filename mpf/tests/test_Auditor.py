@@ -86,3 +86,50 @@ class TestAuditor(MpfTestCase):
         self.advance_time_and_run(1)
 
         self.assertEqual(2, auditor.current_audits['switches']['s_test'])
+
+    def test_counter_export(self):
+        auditor = self.machine.plugins[0]
+        auditor.enable()
+
+        self.machine.switch_controller.process_switch("s_test", 1)
+        self.machine.switch_controller.process_switch("s_test", 0)
+        self.machine.switch_controller.process_switch("s_test", 1)
+
+        # counters change immediately. machine vars are exported in batches
+        self.assertEqual(2, auditor.counters.get_value('switches', 's_test'))
+        self.assertMachineVarEqual(0, "audits_switches_s_test")
+
+        snapshot = auditor.get_snapshot()
+        self.advance_time_and_run(.2)
+        self.assertMachineVarEqual(2, "audits_switches_s_test")
+
+        # snapshots do not change afterwards
+        self.machine.switch_controller.process_switch("s_test", 0)
+        self.machine.switch_controller.process_switch("s_test", 1)
+        self.assertEqual(2, snapshot['switches']['s_test'])
+        self.assertEqual(3, auditor.current_audits['switches']['s_test'])
+
+        # disable exports right away
+        auditor.disable()
+        self.assertMachineVarEqual(3, "audits_switches_s_test")
+
+        # and stops exporting
+        self.assertIsNone(auditor._export_task)
+        auditor.audit('events', 'test_event')
+        self.advance_time_and_run(.2)
+        self.assertFalse(self.machine.is_machine_var("audits_events_test_event"))
+
+        # the export is stopped on shutdown as well
+        auditor.enable()
+        auditor._shutdown()
+        auditor.audit('events', 'test_event')
+        self.advance_time_and_run(.2)
+        self.assertFalse(self.machine.is_machine_var("audits_events_test_event"))
+
+    def test_current_audits_are_read_only(self):
+        auditor = self.machine.plugins[0]
+        with self.assertRaises(TypeError):
+            auditor.current_audits['switches']['s_test'] = 5
+        with self.assertRaises(TypeError):
+            auditor.current_audits['events'] = {}
+        self.assertEqual(0, auditor.current_audits['switches']['s_test'])
@@ -73,6 +73,30 @@ class TestBcpInterface(MpfBcpTestCase):
         self.machine.events.post("test1")
         self.assertFalse(self._bcp_client.send_queue)
 
+    def test_monitor_profiler(self):
+        self.assertIsNone(self.machine.events.profiler)
+        self._bcp_client.send_queue.clear()
+        self._bcp_client.receive_queue.put_nowait(('monitor_start', {'category': 'profiler'}))
+        self.advance_time_and_run()
+        self.assertIsNotNone(self.machine.events.profiler)
+
+        self.machine.events.add_handler("test1", self._cb)
+        self.post_event("test1")
+        self.advance_time_and_run(1)
+
+        stats = [kwargs for command, kwargs in self._bcp_client.send_queue if command == "profiler_stats"]
+        self.assertTrue(stats)
+        self.assertIn("test1", [event["name"] for event in stats[-1]["events"]])
+        self.assertIn("loop_lag", stats[-1])
+
+        # stopping the monitor also disables the profiler again
+        self._bcp_client.receive_queue.put_nowait(('monitor_stop', {'category': 'profiler'}))
+        self.advance_time_and_run()
+        self.assertIsNone(self.machine.events.profiler)
+        self._bcp_client.send_queue.clear()
+        self.advance_time_and_run(2)
+        self.assertFalse(self._bcp_client.send_queue)
+
     def test_device_monitor(self):
         self.hit_switch_and_run("s_test", .1)
         self.release_switch_and_run("s_test2", .1)
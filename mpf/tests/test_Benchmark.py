@@ -0,0 +1,87 @@
+import logging
+import os
+from unittest import TestCase
+
+import mpf.core
+from mpf.benchmarks.benchmark import BenchmarkRunner, compare_results
+from mpf.benchmarks.micro import MICRO_BENCHMARKS
+from mpf.benchmarks.scenarios import SCENARIOS
+from mpf.benchmarks.simulate import GameSimulator, SwitchModel, merge_simulations
+
+
+class TestBenchmark(TestCase):
+
+    def setUp(self):
+        logging.basicConfig(level=99)
+
+    def test_scenarios(self):
+        runner = BenchmarkRunner(allocation_iterations=2)
+        for name, scenario in SCENARIOS.items():
+            for platform in scenario.platforms:
+                result = runner.run(scenario, platform, 3)
+                self.assertEqual(3, result["iterations"], name)
+                if name == "attract_show":
+                    # shows do not post events
+                    self.assertGreater(result["show_steps"], 0, name)
+                else:
+                    self.assertGreater(result["events"], 0, name)
+                self.assertIn("p99", result["handler_latency_ms"])
+                self.assertEqual(2, result["allocations"]["iterations"])
+
+        # every mode is started once and stopped once
+        result = runner.run(SCENARIOS["mode_churn"], "virtual", 2 * SCENARIOS["mode_churn"].mode_count)
+        self.assertGreater(result["mode_start_ms"]["max"], 0)
+        self.assertGreater(result["mode_stop_ms"]["max"], 0)
+
+        result = runner.run(SCENARIOS["switch_storm"], "virtual", 1)
+        self.assertGreater(result["switch_latency_ms"]["max"], 0)
+
+        # 40 iterations of 50ms run 20 steps of 100ms
+        result = runner.run(SCENARIOS["attract_show"], "virtual", 40)
+        self.assertEqual(20, result["show_steps"])
+        self.assertGreater(result["show_step_ms"]["max"], 0)
+
+    def test_micro_benchmarks(self):
+        for name, benchmark in MICRO_BENCHMARKS.items():
+            result = benchmark(repeat=1)
+            self.assertGreater(result["ns_per_op"]["current"], 0, name)
+            self.assertIn("legacy", result["ns_per_op"], name)
+
+        # reads of monitored attributes do not call into python. a __get__ in python would make them ~3x slower
+        result = MICRO_BENCHMARKS["monitored_attribute_read"](repeat=5)
+        self.assertGreater(result["speedup"], 0.5)
+
+    def test_simulate(self):
+        machine_path = os.path.abspath(os.path.join(mpf.core.__path__[0], os.pardir,
+                                                    'tests/machine_files/simulate/'))
+        results = []
+        for seed in range(2):
+            simulator = GameSimulator(["config.yaml"], SwitchModel({"s_ramp": 3, "s_target": 1}, drain_rate=0.5),
+                                      seed, max_game_time=60)
+            result = simulator.simulate(machine_path, 2)
+            self.assertEqual(2, result["games"])
+            # every game ends after its three balls drained
+            self.assertEqual(0, result["timeouts"])
+            self.assertGreaterEqual(min(result["drains"]), 3)
+            results.append(result)
+
+        report = merge_simulations(results)
+        self.assertEqual(4, report["games"])
+        self.assertEqual(2, report["workers"])
+        self.assertGreater(report["game_length_s"]["mean"], 0)
+        self.assertGreater(report["events_per_game"]["max"], 0)
+        self.assertGreater(report["game_events_per_sec"], 0)
+        self.assertGreater(report["switch_latency_ms"]["max"], 0)
+
+    def test_compare_results(self):
+        old = {"results": {"switch_storm": {"virtual": {
+            "events_per_sec": 1000, "handler_latency_ms": {"mean": 0.1, "p99": 0.2}}}}}
+        new = {"results": {"switch_storm": {"virtual": {
+            "events_per_sec": 500, "handler_latency_ms": {"mean": 0.1, "p99": 0.1}}}}}
+
+        rows = {row["metric"]: row["change"] for row in compare_results(old, new)}
+        # half the throughput is worse
+        self.assertEqual(0.5, rows["events_per_sec"])
+        self.assertEqual(0, rows["handler_latency_mean_ms"])
+        self.assertEqual(-0.5, rows["handler_latency_p99_ms"])
+        self.assertNotIn("peak_rss_kb", rows)
@@ -451,6 +451,33 @@ class TestConfig(MpfTestCase):
             validation_string, validation_failure_info, False)
         self.assertEqual('no', results)
 
+    def test_compiled_config_specs(self):
+        validator = self.machine.config_validator
+        config = {"initial_value": "7"}
+        self.assertEqual({"initial_value": "7", "value_type": "int"}, validator.validate_config("player_vars", config))
+        # the source is validated in place
+        self.assertEqual("int", config["value_type"])
+
+        # specs and spec strings are compiled once
+        compiled_spec = validator._get_compiled_spec("player_vars", None)
+        self.assertIs(compiled_spec, validator._get_compiled_spec("player_vars", None))
+        self.assertEqual(["initial_value", "value_type"], [k for k, _ in compiled_spec.entries])
+        self.assertIs(validator._compile_item("single|int|5", None), validator._compile_item("single|int|5", None))
+
+        # defaults are validated for every config so mutable defaults are not shared
+        first = validator.validate_config_item("list|str|a, b", None)
+        second = validator.validate_config_item("list|str|a, b", None)
+        self.assertEqual(["a", "b"], first)
+        self.assertIsNot(first, second)
+
+        # changing the spec invalidates compiled specs
+        validator.load_device_config_spec("test_compiled_spec", "value: single|int|3")
+        self.assertEqual({"value": 3}, validator.validate_config("test_compiled_spec", {}))
+        validator.load_device_config_spec("test_compiled_spec", "value: single|int|3\nother: single|str|test")
+        self.assertEqual({"value": 3, "other": "test"}, validator.validate_config("test_compiled_spec", {}))
+        del validator.config_spec["test_compiled_spec"]
+        validator.config_spec_changed()
+
     def test_config_merge(self):
         a = {"test": {"a": [1], "b": [2, 3]}, "test2": 2}
         b = {"test": {"a": [3], "c": 7}}
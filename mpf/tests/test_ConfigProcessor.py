@@ -0,0 +1,40 @@
+import os
+import unittest
+from unittest.mock import patch
+
+from mpf.core.config_processor import ConfigProcessor
+from mpf.core.file_manager import FileManager
+from mpf.file_interfaces.yaml_interface import YamlInterface
+
+
+class TestConfigProcessor(unittest.TestCase):
+
+    def setUp(self):
+        machine_files = os.path.join(os.path.dirname(os.path.abspath(__file__)), "machine_files")
+        self.shows = os.path.join(machine_files, "shows", "shows")
+        self.openpixel = os.path.join(machine_files, "openpixel", "config")
+
+    def tearDown(self):
+        YamlInterface.preloaded_files.clear()
+
+    def test_worker_count(self):
+        self.assertEqual(3, ConfigProcessor.get_worker_count(3))
+        self.assertEqual(os.cpu_count() or 1, ConfigProcessor.get_worker_count(0))
+
+    @patch.object(YamlInterface, "cache", False)
+    def test_preload_config_files(self):
+        files = [os.path.join(self.shows, "test_show1.yaml"), os.path.join(self.shows, "test_show2.yaml"),
+                 os.path.join(self.openpixel, "fadecandy.yaml"), os.path.join(self.shows, "missing.yaml")]
+        serial = [FileManager.load(filename) for filename in files[:3]]
+
+        # serial loading with one worker
+        self.assertEqual(0, ConfigProcessor.preload_config_files(files, 1))
+        self.assertFalse(YamlInterface.preloaded_files)
+
+        # included files are parsed as well
+        self.assertEqual(4, ConfigProcessor.preload_config_files(files, 2))
+        self.assertIn(os.path.join(self.openpixel, "config.yaml"), YamlInterface.preloaded_files)
+
+        # loading consumes the parsed files
+        self.assertEqual(serial, [FileManager.load(filename) for filename in files[:3]])
+        self.assertNotIn(files[0], YamlInterface.preloaded_files)
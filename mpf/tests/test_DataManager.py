@@ -1,10 +1,12 @@
 """Test the bonus mode."""
 import os
+import shutil
+import tempfile
 import time
 from unittest.mock import mock_open, patch
 
 from mpf.file_interfaces.yaml_interface import YamlInterface
-from mpf.core.data_manager import DataManager
+from mpf.core.data_manager import DataManager, JournaledDataManager
 from mpf.tests.MpfTestCase import MpfTestCase
 
 
@@ -103,3 +105,88 @@ class TestDataManager(MpfTestCase):
 
         self.assertEqual({}, manager.get_data("hallo"))
         self.assertEqual({}, manager.get_data("invalid"))
+
+    def _wait_for(self, condition):
+        deadline = time.time() + 5
+        while not condition():
+            self.assertLess(time.time(), deadline)
+            time.sleep(.001)
+
+    @staticmethod
+    def _read(filename):
+        if not os.path.isfile(filename):
+            return b""
+        with open(filename, "rb") as f:
+            return f.read()
+
+    def test_journal(self):
+        data_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, data_dir)
+        data_file = os.path.join(data_dir, "machine_vars.yaml")
+        journal_file = data_file + ".journal"
+        self.machine.config['mpf']['paths']['journal_test'] = data_file
+        self.machine.config['mpf']['data_manager_write_window_ms'] = 20
+
+        manager = JournaledDataManager(self.machine, "journal_test", min_wait_secs=0)
+        manager.save_key("credits", {"value": 1})
+        manager.save_key("credits", {"value": 2})
+        manager.save_key("bonus", {"value": 3, "expire": 100})
+        manager.save_key("removed", {"value": 4})
+        manager.remove_key("removed")
+
+        # changes within the write window are coalesced to one record per key
+        self._wait_for(lambda: self._read(journal_file).count(b"\n") == 3)
+        self.assertFalse(os.path.isfile(data_file))
+
+        # simulate a power cut during the next write
+        with open(journal_file, "ab") as f:
+            f.write(b'0badc0de ["credits",{"val')
+
+        manager = JournaledDataManager(self.machine, "journal_test", min_wait_secs=0)
+        self.assertEqual({"credits": {"value": 2}, "bonus": {"value": 3, "expire": 100}}, manager.get_data())
+        # the torn record has been cut off
+        self.assertEqual(3, self._read(journal_file).count(b"\n"))
+        self.assertTrue(self._read(journal_file).endswith(b"\n"))
+        self.assertEqual([], manager.get_expired_keys(50))
+        self.assertEqual(["bonus"], manager.get_expired_keys(200))
+
+        manager.save_all({"credits": {"value": 5}})
+        self._wait_for(lambda: self._read(journal_file).count(b"\n") == 5)
+        manager = JournaledDataManager(self.machine, "journal_test", min_wait_secs=0)
+        self.assertEqual({"credits": {"value": 5}}, manager.get_data())
+
+        # a snapshot replaces the data file and truncates the journal
+        self.machine.config['mpf']['data_manager_snapshot_records'] = 6
+        manager = JournaledDataManager(self.machine, "journal_test", min_wait_secs=0)
+        manager.save_key("credits", {"value": 6})
+        self._wait_for(lambda: os.path.isfile(data_file) and not self._read(journal_file))
+        self.assertFalse(os.path.isfile(os.path.join(data_dir, "_machine_vars.yaml")))
+
+        manager = JournaledDataManager(self.machine, "journal_test", min_wait_secs=0)
+        self.assertEqual({"credits": {"value": 6}}, manager.get_data())
+
+        # dict keys are strings and tuples are lists after the journal is replayed
+        manager.save_key("scores", {"value": {1: "first"}, "position": (1, 2)})
+        self._wait_for(lambda: b"first" in self._read(journal_file))
+        manager = JournaledDataManager(self.machine, "journal_test", min_wait_secs=0)
+        self.assertEqual({"value": {"1": "first"}, "position": [1, 2]}, manager.get_data()["scores"])
+
+        # same as for keys in the data file
+        self.machine.config['mpf']['data_manager_snapshot_records'] = 1
+        manager = JournaledDataManager(self.machine, "journal_test", min_wait_secs=0)
+        manager.save_all({"scores": {"value": {1: "first"}}})
+        self._wait_for(lambda: self._read(data_file).count(b"first") == 1 and not self._read(journal_file))
+        manager = JournaledDataManager(self.machine, "journal_test", min_wait_secs=0)
+        self.assertEqual({"scores": {"value": {"1": "first"}}}, manager.get_data())
+
+    def test_expire_index(self):
+        manager = DataManager(self.machine, "disabled_test", min_wait_secs=0)
+        manager.save_key("other", {"value": 1, "expire": 3000})
+        for expire in range(1000):
+            manager.save_key("bonus", {"value": 1, "expire": 1000 + expire})
+
+        # stale entries of keys which were saved again are dropped
+        self.assertLess(len(manager._expire_index), 20)
+        self.assertEqual([], manager.get_expired_keys(1500))
+        self.assertEqual(["bonus"], manager.get_expired_keys(2500))
+        self.assertEqual(["other"], manager.get_expired_keys(3500))
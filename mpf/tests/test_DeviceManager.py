@@ -1,5 +1,10 @@
 import inspect
+from unittest import TestCase
+from unittest.mock import MagicMock
 
+from mpf.core import device_monitor
+from mpf.core.device_manager import DeviceCollection
+from mpf.core.device_monitor import DeviceMonitor, MonitoredAttribute
 from mpf.core.utility_functions import Util
 from mpf.tests.MpfTestCase import MpfTestCase
 
@@ -33,3 +38,173 @@ class TestDeviceManager(MpfTestCase):
                 self.assertEqual(sig.parameters['kwargs'].kind, inspect._VAR_KEYWORD,
                     "Method {}.{} kwargs param is missing '**'".format(
                     device_type, method_name))
+
+
+class TestDeviceCollection(MpfTestCase):
+
+    def getConfigFile(self):
+        return 'light.yaml'
+
+    def getMachinePath(self):
+        return 'tests/machine_files/light/'
+
+    def test_attribute_access(self):
+        led1 = self.machine.lights["led1"]
+        self.assertIs(led1, self.machine.lights.led1)
+        self.assertIs(led1, self.machine.lights.LED1)
+        self.assertIs(led1, self.machine.lights["Led1"])
+        # attribute is cached after the first access
+        self.assertIs(led1, self.machine.lights.__dict__["led1"])
+
+        with self.assertRaises(KeyError):
+            self.machine.lights.led99
+
+        # cache is invalidated when the collection changes
+        self.machine.lights["led_alias"] = self.machine.lights["led2"]
+        self.assertNotIn("led1", self.machine.lights.__dict__)
+        self.assertIs(self.machine.lights["led2"], self.machine.lights.led_alias)
+        del self.machine.lights["led_alias"]
+        self.assertNotIn("led_alias", self.machine.lights.__dict__)
+
+        # all other changes invalidate the cache as well
+        led1 = self.machine.lights["led1"]
+        lights = DeviceCollection(self.machine, "lights", "lights")
+        changes = (
+            lambda: lights.update({"Led_Alias": led1}),
+            lambda: lights.setdefault("led_alias2", led1),
+            lambda: lights.pop("led_alias2"),
+            lambda: lights.popitem(),
+            lambda: lights.clear(),
+        )
+        for change in changes:
+            lights["led1"] = led1
+            self.assertIs(led1, lights.led1)
+            change()
+            self.assertNotIn("led1", lights.__dict__)
+
+        lights.update({"Led_Alias": led1})
+        self.assertIs(led1, lights.led_alias)
+
+
+class TestDeviceControlEvents(MpfTestCase):
+
+    def __init__(self, test_map):
+        super().__init__(test_map)
+        self.machine_config_patches['mpf']['device_events'] = {'lights': ['on', 'off']}
+
+    def getConfigFile(self):
+        return 'light.yaml'
+
+    def getMachinePath(self):
+        return 'tests/machine_files/light/'
+
+    def test_lazy_control_events(self):
+        # handlers are only added when an event is posted
+        self.assertNotIn("light_led1_on", self.machine.events.registered_handlers)
+        self.assertNotIn("lights_on", self.machine.events.registered_handlers)
+        self.assertNotIn("lights_off", self.machine.events.registered_handlers)
+
+        self.post_event("light_led1_on")
+        self.assertLightColor("led1", "on")
+        self.assertLightColor("led2", "off")
+        self.assertIn("light_led1_on", self.machine.events.registered_handlers)
+
+        self.post_event("lights_on")
+        self.assertLightColor("led1", "on")
+        self.assertLightColor("led2", "on")
+
+        # collection control event and default collection event
+        self.post_event("lights_off")
+        self.assertLightColor("led1", "off")
+        self.assertLightColor("led2", "off")
+        self.assertEqual(len(self.machine.lights) + 1, len(self.machine.events.registered_handlers["lights_off"]))
+
+        self.post_event("light_led99_on")
+        self.assertNotIn("light_led99_on", self.machine.events.registered_handlers)
+        self.assertTrue(self.machine.events.does_event_exist("light_led2_off"))
+
+
+@DeviceMonitor("state", _enabled="enabled")
+class MonitoredDevice(object):
+
+    def __init__(self, machine):
+        self.machine = machine
+        self.state = 0
+        self._enabled_value = False
+        self.unmonitored = 0
+
+    @property
+    def _enabled(self):
+        return self._enabled_value
+
+    @_enabled.setter
+    def _enabled(self, value):
+        self._enabled_value = value
+
+
+@DeviceMonitor(_enabled="enabled")
+class MonitoredSubDevice(MonitoredDevice):
+
+    pass
+
+
+@DeviceMonitor("value")
+class UnsetMonitoredDevice(object):
+
+    def __init__(self, machine):
+        self.machine = machine
+
+
+class TestDeviceMonitor(TestCase):
+
+    def test_descriptors(self):
+        machine = MagicMock()
+        notify = machine.device_manager.notify_device_changes
+        device = MonitoredDevice(machine)
+        machine.device_manager.register_monitorable_device.assert_called_once_with(device)
+
+        # writes do not go through __setattr__ and values are stored in the instance dict
+        self.assertIs(object.__setattr__, MonitoredDevice.__setattr__)
+        self.assertEqual(0, device.__dict__["state"])
+        self.assertEqual({"state": 0, "enabled": False}, device.get_monitorable_state())
+
+        # nobody is listening
+        device.state = 1
+        device._enabled = True
+        self.assertEqual(1, device.state)
+        self.assertTrue(device._enabled)
+        notify.assert_not_called()
+
+        device_monitor.add_subscriber()
+        self.addCleanup(device_monitor.remove_subscriber)
+
+        device.state = 2
+        notify.assert_called_once_with(device, "state", 1, 2)
+        notify.reset_mock()
+
+        # value did not change
+        device.state = 2
+        device.unmonitored = 5
+        notify.assert_not_called()
+
+        device._enabled = False
+        notify.assert_called_once_with(device, "enabled", True, False)
+        notify.reset_mock()
+
+        # attributes monitored in the base class are only reported once
+        sub_device = MonitoredSubDevice(machine)
+        sub_device._enabled = True
+        notify.assert_called_once_with(sub_device, "enabled", False, True)
+        self.assertEqual({"enabled": True}, sub_device.get_monitorable_state())
+
+    def test_unset_attribute(self):
+        device = UnsetMonitoredDevice(MagicMock())
+        self.assertIsInstance(UnsetMonitoredDevice.value, MonitoredAttribute)
+        # reads do not call into the descriptor so the attribute is initialised
+        self.assertFalse(hasattr(MonitoredAttribute, "__get__"))
+        self.assertIsNone(device.value)
+        self.assertEqual({"value": None}, device.get_monitorable_state())
+
+        device.value = 3
+        self.assertEqual(3, device.value)
+        self.assertEqual({"value": 3}, device.get_monitorable_state())
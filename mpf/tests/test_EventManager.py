@@ -1,9 +1,13 @@
 """Test event manager."""
+import os
+import tempfile
+from functools import partial
+
 from mpf.core.delays import DelayManager
 from mpf.core.settings_controller import SettingEntry
 from mpf.tests.MpfFakeGameTestCase import MpfFakeGameTestCase
 from mpf.tests.MpfTestCase import MpfTestCase
-from unittest.mock import patch
+from unittest.mock import patch, MagicMock
 
 
 class TestEventManager(MpfFakeGameTestCase, MpfTestCase):
@@ -819,6 +823,51 @@ class TestEventManager(MpfFakeGameTestCase, MpfTestCase):
         self.post_event_with_params("test", param=3, a=True)
         self.assertEqual(1, self._called)
 
+    def test_handler_with_bound_kwargs_and_condition(self):
+        self.machine.events.add_handler("test{param > 1 and bound == 2}", self.event_handler1, bound=2)
+
+        self.post_event_with_params("test", param=1)
+        self.assertEqual(0, self._handler1_called)
+
+        # bound kwargs win over kwargs of the post
+        self.post_event_with_params("test", param=3, bound=7)
+        self.assertEqual(1, self._handler1_called)
+        self.assertEqual({'param': 3, 'bound': 2}, self._handler1_kwargs)
+
+        self.machine.events.post("test", param=3)
+        self.advance_time_and_run()
+        self.assertEqual(2, self._handler1_called)
+        self.assertEqual({'param': 3, 'bound': 2}, self._handler1_kwargs)
+
+    def test_handler_batch(self):
+        events = self.machine.events
+        events.start_handler_batch()
+        key1 = events.add_handler("test_batch", self.event_handler1, priority=1)
+        key2 = events.add_handler("test_batch", self.event_handler2, priority=3)
+        key3 = events.add_handler("test_batch2", self.event_handler1, priority=2)
+
+        # missing **kwargs is still detected in a batch
+        with self.assertRaises(AssertionError):
+            events.add_handler("test_batch", lambda: None)
+        events.finish_handler_batch()
+
+        # handlers are sorted when the batch finishes
+        self.assertEqual([self.event_handler2, self.event_handler1],
+                         [handler.callback for handler in events.registered_handlers["test_batch"]])
+
+        # removals are collected and applied when the batch finishes
+        events.start_handler_batch()
+        events.remove_handlers_by_keys([key1, key3])
+        self.assertEqual(2, len(events.registered_handlers["test_batch"]))
+        events.finish_handler_batch()
+
+        self.assertEqual([self.event_handler2],
+                         [handler.callback for handler in events.registered_handlers["test_batch"]])
+        self.assertNotIn("test_batch2", events.registered_handlers)
+
+        events.remove_handlers_by_keys([key2])
+        self.assertNotIn("test_batch", events.registered_handlers)
+
     def test_handler_with_settings_condition_invalid_setting(self):
         self._called = 0
         self.machine.events.add_handler("test{settings.test == True}", self._handler)
@@ -886,3 +935,126 @@ class TestEventManager(MpfFakeGameTestCase, MpfTestCase):
 
         self.assertEventNotCalled("out3")
         self.assertEventCalled("out4")
+
+
+class TestEventTrace(MpfTestCase):
+
+    def __init__(self, test_map):
+        super().__init__(test_map)
+        self.machine_config_patches['mpf']['event_trace_size'] = 4
+
+    def getConfigFile(self):
+        return 'test_event_manager.yaml'
+
+    def getMachinePath(self):
+        return 'tests/machine_files/event_manager/'
+
+    def test_event_trace(self):
+        self.mock_event("test_trace1")
+        self.mock_event("test_trace2")
+        self.mock_event("test_trace3")
+        trace = self.machine.events.event_trace
+        trace.clear()
+
+        self.machine.events.post("test_trace1")
+        self.machine.events.post_boolean("test_trace2")
+        self.machine_run()
+
+        records = trace.get_records()
+        self.assertEqual([("post", "test_trace1", None), ("post", "test_trace2", "boolean"),
+                          ("process", "test_trace1", None), ("process", "test_trace2", "boolean")],
+                         [record[1:] for record in records])
+
+        # the ring only keeps the last four records
+        self.machine.events.post("test_trace3")
+        self.machine_run()
+        records = trace.get_records()
+        self.assertEqual(4, len(records))
+        self.assertEqual(("process", "test_trace1", None), records[0][1:])
+        self.assertEqual(("process", "test_trace3", None), records[-1][1:])
+
+        with tempfile.TemporaryDirectory() as path:
+            file_name = self.machine.events.dump_event_trace(os.path.join(path, "trace.txt"))
+            with open(file_name) as f:
+                self.assertEqual(4, len(f.readlines()))
+
+
+class TestEventProfiler(MpfTestCase):
+
+    def __init__(self, test_map):
+        super().__init__(test_map)
+        self.machine_config_patches['mpf']['profiler'] = True
+
+    def getConfigFile(self):
+        return 'test_event_manager.yaml'
+
+    def getMachinePath(self):
+        return 'tests/machine_files/event_manager/'
+
+    def _handler(self, **kwargs):
+        del kwargs
+
+    def test_profiler(self):
+        profiler = self.machine.events.profiler
+        self.assertIsNotNone(profiler)
+        profiler.reset()
+
+        self.machine.events.add_handler("test_profile", self._handler)
+        self.machine.events.add_handler("test_profile", self._handler, priority=2)
+        for _ in range(5):
+            self.post_event("test_profile")
+
+        self.machine.events.post_queue("test_profile_queue", callback=self._handler)
+        self.machine.events.add_handler("test_profile_queue", self._handler)
+        self.advance_time_and_run(1)
+
+        stats = profiler.get_stats()
+        events = {event["name"]: event for event in stats["events"]}
+        self.assertEqual(5, events["test_profile"]["count"])
+        handlers = {handler["name"]: handler for handler in stats["handlers"]}
+        self.assertEqual(11, handlers["TestEventProfiler._handler"]["count"])
+        self.assertGreater(stats["loop_lag"]["count"], 0)
+        self.assertGreaterEqual(stats["queue_depth"]["max"], 1)
+
+        self.machine.events.disable_profiler()
+        self.assertIsNone(self.machine.events.profiler)
+        self.assertIsNone(self.machine.clock.profiler)
+
+    def test_disable_with_scheduled_callbacks(self):
+        profiler = self.machine.clock.profiler
+        callback = MagicMock()
+        interval_callback = MagicMock()
+        self.machine.clock.schedule_once(callback, 1)
+        self.machine.clock.schedule_interval(interval_callback, 1)
+
+        # callbacks which were wrapped before are not recorded anymore
+        self.machine.events.disable_profiler()
+        with patch.object(profiler, "record_callback") as record_callback, \
+                patch.object(profiler, "record_loop_lag") as record_loop_lag:
+            self.advance_time_and_run(2)
+
+        callback.assert_called_once_with()
+        self.assertEqual(2, interval_callback.call_count)
+        record_callback.assert_not_called()
+        record_loop_lag.assert_not_called()
+
+    def test_callback_names(self):
+        profiler = self.machine.events.profiler
+        profiler.reset()
+
+        self.assertEqual("TestEventProfiler._handler", profiler.get_callback_name(self._handler))
+        self.assertEqual("TestEventProfiler._handler", profiler.get_callback_name(partial(self._handler, a=1)))
+        self.assertEqual("Mode.start[test_mode]", profiler.get_callback_name(self.machine.modes["test_mode"].start))
+
+        # partials and bound methods share the entry of their function
+        for _ in range(10):
+            profiler.get_callback_name(partial(self._handler, a=1))
+        self.assertEqual(2, len(profiler._names))
+
+        # closures are new functions every time
+        for number in range(2 * profiler.MAX_CACHED_NAMES):
+            profiler.get_callback_name(lambda number=number: number)
+        self.assertLessEqual(len(profiler._names), profiler.MAX_CACHED_NAMES)
+
+        profiler.reset()
+        self.assertFalse(profiler._names)
@@ -1,4 +1,6 @@
 """Test led player."""
+from unittest.mock import MagicMock
+
 from mpf.core.rgb_color import RGBColor
 from mpf.tests.MpfFakeGameTestCase import MpfFakeGameTestCase
 
@@ -147,6 +149,28 @@ class TestLedPlayer(MpfFakeGameTestCase):
         self.advance_time_and_run()
         self.assertLightColor("led5", 'red')
 
+    def test_light_sync_once_per_entry(self):
+        platform = next(iter(self.machine.lights.led1.platforms))
+        platform.light_sync = MagicMock()
+
+        # three lights in one entry only sync the platform once
+        self.post_event("event1")
+        self.advance_time_and_run()
+        self.assertLightColor("led1", 'red')
+        self.assertLightColor("led3", 'red')
+        self.assertEqual(1, platform.light_sync.call_count)
+
+        # same for lights from a tag
+        platform.light_sync = MagicMock()
+        self.post_event("event4")
+        self.advance_time_and_run()
+        self.assertEqual(1, platform.light_sync.call_count)
+
+        # direct calls outside of a batch sync immediately
+        platform.light_sync = MagicMock()
+        self.machine.lights.led4.color("blue")
+        self.assertEqual(1, platform.light_sync.call_count)
+
     def test_single_step_show(self):
         # with single step shows, loops are automatically set to 0, hold is
         # automatically set to true
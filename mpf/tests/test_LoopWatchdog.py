@@ -0,0 +1,45 @@
+"""Test the loop watchdog."""
+from mpf.tests.MpfBcpTestCase import MpfBcpTestCase
+
+
+class TestLoopWatchdog(MpfBcpTestCase):
+
+    def __init__(self, methodName='runTest'):
+        super().__init__(methodName)
+        # large threshold so the watchdog thread never fires on its own during the test
+        self.machine_config_patches['mpf']['loop_watchdog_ms'] = 10000
+        self.machine_config_patches['mpf']['loop_watchdog_probe_ms'] = 100
+
+    def getConfigFile(self):
+        return 'config.yaml'
+
+    def getMachinePath(self):
+        return 'tests/machine_files/bcp/'
+
+    def test_probe(self):
+        watchdog = self.machine.loop_watchdog
+        probes = watchdog.probes
+        self.advance_time_and_run(1)
+        self.assertAlmostEqual(probes + 10, watchdog.probes, delta=1)
+        self.assertEqual(0, watchdog.overruns)
+
+    def test_stall(self):
+        watchdog = self.machine.loop_watchdog
+        self._bcp_client.receive_queue.put_nowait(('monitor_start', {'category': 'loop_watchdog'}))
+        self.advance_time_and_run()
+        self._bcp_client.send_queue.clear()
+
+        # pretend the loop has been blocked for 20s
+        watchdog._heartbeat -= 20
+        watchdog._check_stall()
+        watchdog._check_stall()
+
+        stats = watchdog.get_stats()
+        self.assertEqual(1, len(stats["stalls"]))
+        self.assertGreaterEqual(stats["stalls"][0]["blocked_ms"], 20000)
+        # the stack of the blocked loop thread is this test
+        self.assertIn("test_stall", stats["stalls"][0]["stack"])
+
+        # report is sent once the loop runs the probe again
+        self.advance_time_and_run(.2)
+        self.assertEqual(1, len([command for command, _ in self._bcp_client.send_queue if command == "loop_stall"]))
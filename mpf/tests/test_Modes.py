@@ -237,3 +237,75 @@ class TestModesInGame(MpfFakeGameTestCase):
         self.drain_ball()
         self.assertModeRunning("mode_restart_on_next_ball")
         self.assertEventCalled("mode_mode_restart_on_next_ball_will_start", 1)
+
+
+class TestLazyModes(MpfFakeGameTestCase):
+
+    def getConfigFile(self):
+        return 'test_lazy_modes.yaml'
+
+    def getMachinePath(self):
+        return 'tests/machine_files/mode_tests/'
+
+    def setUp(self):
+        self.machine_config_patches['mpf']['lazy_mode_preload'] = False
+        self.machine_config_patches['mpf']['lazy_mode_unload_games'] = 1
+        super().setUp()
+
+    def test_lazy_load(self):
+        mode = self.machine.modes.mode_lazy
+        self.assertFalse(mode.loaded)
+        self.assertTrue(self.machine.modes.mode1.loaded)
+        self.assertNotIn("lazy_timer", self.machine.timers)
+        self.assertNotIn("lazy_show", self.machine.shows)
+
+        # mode loads on first start
+        self.mock_event("lazy_mode_running")
+        self.post_event("start_mode_lazy")
+        self.assertModeRunning("mode_lazy")
+        self.assertTrue(mode.loaded)
+        self.assertIn("lazy_timer", self.machine.timers)
+        self.assertIn("lazy_show", self.machine.shows)
+        self.assertEventCalled("lazy_mode_running")
+
+        self.post_event("stop_mode_lazy")
+        self.assertModeNotRunning("mode_lazy")
+
+        # mode ran in the first game
+        self.start_game()
+        self.post_event("start_mode_lazy")
+        self.post_event("stop_mode_lazy")
+        self.stop_game()
+        self.assertTrue(mode.loaded)
+
+        # it did not run in the second game
+        self.start_game()
+        self.stop_game()
+        self.assertFalse(mode.loaded)
+        self.assertNotIn("lazy_show", self.machine.shows)
+        # devices are kept
+        self.assertIn("lazy_timer", self.machine.timers)
+
+        # mode loads again on start
+        self.mock_event("lazy_mode_running")
+        self.post_event("start_mode_lazy")
+        self.assertModeRunning("mode_lazy")
+        self.assertTrue(mode.loaded)
+        self.assertIn("lazy_show", self.machine.shows)
+        self.assertEventCalled("lazy_mode_running")
+
+
+class TestLazyModePreload(MpfFakeGameTestCase):
+
+    def getConfigFile(self):
+        return 'test_lazy_modes.yaml'
+
+    def getMachinePath(self):
+        return 'tests/machine_files/mode_tests/'
+
+    def test_preload_in_attract(self):
+        # lazy modes load when the machine is idle in attract
+        self.assertModeRunning("attract")
+        self.assertTrue(self.machine.modes.mode_lazy.loaded)
+        self.assertIn("lazy_timer", self.machine.timers)
+        self.assertModeNotRunning("mode_lazy")
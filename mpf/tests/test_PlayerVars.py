@@ -1,3 +1,6 @@
+from unittest.mock import MagicMock, call, patch
+
+from mpf.core.player import Player
 from mpf.tests.MpfGameTestCase import MpfGameTestCase
 
 
@@ -34,3 +37,45 @@ class TestPlayerVars(MpfGameTestCase):
 
         self.assertEqual(4, self.machine.get_machine_var("test1"))
         self.assertEqual('5', self.machine.get_machine_var("test2"))
+
+    def test_set_vars(self):
+        self.fill_troughs()
+        self.start_game()
+        self.mock_event("player_vars_changed")
+        self.mock_event("player_ramps")
+
+        self.machine.game.player.set_vars(score=100, ramps=2, Loops=1)
+        self.advance_time_and_run()
+
+        self.assertEventCalledWith("player_vars_changed", changes={"score": 100, "ramps": 2, "Loops": 1},
+                                   player_num=1)
+        self.assertEventCalledWith("player_ramps", value=2, prev_value=0, change=2, player_num=1)
+        self.assertEqual(100, self.machine.game.player.score)
+        self.assertEqual(1, self.machine.game.player.loops)
+
+        # nothing changed
+        self.mock_event("player_vars_changed")
+        self.machine.game.player.set_vars(score=100)
+        self.advance_time_and_run()
+        self.assertEventNotCalled("player_vars_changed")
+
+    def test_unobserved_events(self):
+        self.fill_troughs()
+        self.start_game()
+        monitor = MagicMock()
+        self.machine.register_monitor("player", monitor)
+        Player.monitor_enabled = True
+        self.addCleanup(setattr, Player, "monitor_enabled", False)
+
+        # the event is neither built nor posted when nobody observes it
+        with patch.object(self.machine.events, "is_event_observed", return_value=False) as is_event_observed, \
+                patch.object(self.machine.events, "post") as post:
+            self.machine.game.player.loops = 3
+            self.machine.game.player.loops += 2
+        is_event_observed.assert_called_with("player_loops")
+        post.assert_not_called()
+
+        # monitors are still called for every change
+        monitor.assert_has_calls([
+            call(name="loops", value=3, prev_value=0, change=3, player_num=1),
+            call(name="loops", value=5, prev_value=3, change=2, player_num=1)])
@@ -0,0 +1,181 @@
+import os
+import shutil
+import tempfile
+import threading
+from unittest.mock import patch
+
+from mpf.plugins.playfield_statistics import PlayfieldStatistics, StatisticsStore
+from mpf.tests.MpfBcpTestCase import MpfBcpTestCase
+from mpf.tests.MpfTestCase import MpfTestCase
+
+
+class TestPlayfieldStatistics(MpfTestCase):
+
+    def getConfigFile(self):
+        return 'config.yaml'
+
+    def getMachinePath(self):
+        return 'tests/machine_files/playfield_statistics/'
+
+    def setUp(self):
+        self.machine_config_patches['mpf']['plugins'] = ['mpf.plugins.playfield_statistics.PlayfieldStatistics']
+        self.machine_config_patches['mpf']['paths'] = {'playfield_statistics': False}
+        super().setUp()
+
+    def _count(self, series, resolution="minute"):
+        return sum(bucket["count"] for bucket in self.machine.playfield_statistics.query(series, resolution))
+
+    def test_switches_and_events(self):
+        stats = self.machine.plugins[0]
+        self.assertIsInstance(stats, PlayfieldStatistics)
+
+        self.hit_switch_and_run("s_test", 2)
+        self.release_switch_and_run("s_test", 1)
+        self.hit_and_release_switch("s_test")
+        self.hit_switch_and_run("s_test2", 1)
+        self.post_event("test_event")
+        self.advance_time_and_run()
+
+        self.assertEqual(2, self._count("switch:s_test"))
+        self.assertEqual(2, self._count("switch:s_test", "hour"))
+        self.assertEqual(1, self._count("switch:s_test2"))
+        self.assertEqual(1, self._count("event:test_event"))
+
+        # s_test was active for 2s once
+        buckets = self.machine.playfield_statistics.query("switch_active_secs:s_test")
+        self.assertAlmostEqual(2.0, max(bucket["max"] for bucket in buckets), delta=.1)
+
+        # per-game stats
+        self.post_event("game_ended")
+        self.advance_time_and_run()
+        self.assertEqual([{"count": 2, "total": 2.0, "max": 1.0}],
+                         self.machine.playfield_statistics.query("switch:s_test", "game"))
+
+        # minute buckets expire after minutes_to_keep. hour buckets stay
+        self.advance_time_and_run(15 * 60)
+        self.assertEqual(0, self._count("switch:s_test"))
+        self.assertEqual(2, self._count("switch:s_test", "hour"))
+
+        # service mode can query all series
+        self.machine.service.start_service()
+        self.assertIn("switch:s_test", self.machine.service.get_playfield_statistics())
+
+
+class TestPlayfieldStatisticsDisabled(MpfTestCase):
+
+    def getConfigFile(self):
+        return 'config.yaml'
+
+    def getMachinePath(self):
+        return 'tests/machine_files/playfield_statistics/'
+
+    def test_service_without_plugin(self):
+        self.assertIsNone(self.machine.playfield_statistics)
+        self.machine.service.start_service()
+        self.assertEqual([], self.machine.service.get_playfield_statistics())
+        self.assertEqual([], self.machine.service.get_playfield_statistics("switch:s_test"))
+
+
+class TestPlayfieldStatisticsPersistence(MpfTestCase):
+
+    def getConfigFile(self):
+        return 'config.yaml'
+
+    def getMachinePath(self):
+        return 'tests/machine_files/playfield_statistics/'
+
+    def setUp(self):
+        self.stats_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.stats_dir)
+        self.filename = os.path.join(self.stats_dir, "playfield_statistics.sqlite")
+        self.machine_config_patches['mpf']['plugins'] = ['mpf.plugins.playfield_statistics.PlayfieldStatistics']
+        self.machine_config_patches['mpf']['paths'] = {'playfield_statistics': self.filename}
+        super().setUp()
+
+    def test_save_and_load(self):
+        stats = self.machine.playfield_statistics
+        self.hit_and_release_switch("s_test")
+        self.post_event("test_event")
+        self.advance_time_and_run()
+
+        # starts a background save
+        self.post_event("game_ended")
+        self.advance_time_and_run()
+        self.hit_and_release_switch("s_test")
+        self.advance_time_and_run()
+
+        # the final save waits for the background save
+        self.machine.events.post("shutdown")
+        self.machine.events.process_event_queue()
+        self.assertTrue(stats._save_future.done())
+        self.assertFalse(os.path.isfile(self.filename + ".tmp"))
+
+        store = StatisticsStore(10, 2, 3)
+        store.load(self.filename)
+        now = stats._get_time()
+        for series in ("switch:s_test", "event:test_event"):
+            for resolution in ("minute", "hour"):
+                self.assertEqual(stats.store.query(series, resolution, now), store.query(series, resolution, now))
+            self.assertEqual(stats.store.query_games(series), store.query_games(series))
+        self.assertEqual(2, sum(bucket["count"] for bucket in store.query("switch:s_test", "minute", now)))
+        self.assertEqual([{"count": 1, "total": 1.0, "max": 1.0}], store.query_games("switch:s_test"))
+
+    def test_save_while_saving(self):
+        stats = self.machine.playfield_statistics
+        started = threading.Event()
+        release = threading.Event()
+        written = []
+
+        def _write_rows(filename, rows, game_rows):
+            del filename
+            del game_rows
+            started.set()
+            release.wait(5)
+            written.append(len(rows))
+
+        with patch.object(StatisticsStore, "write_rows", staticmethod(_write_rows)):
+            stats.save()
+            self.assertTrue(started.wait(5))
+
+            # saves while a save is running are queued. only the last one is kept
+            self.hit_and_release_switch("s_test")
+            stats.save()
+            self.hit_and_release_switch("s_test2")
+            stats.save()
+            release.set()
+            stats._save_future.result(5)
+
+        self.assertEqual(2, len(written))
+        self.assertLess(written[0], written[1])
+
+
+class TestPlayfieldStatisticsBcp(MpfBcpTestCase):
+
+    def getConfigFile(self):
+        return 'config.yaml'
+
+    def getMachinePath(self):
+        return 'tests/machine_files/playfield_statistics/'
+
+    def setUp(self):
+        self.machine_config_patches['mpf']['plugins'] = ['mpf.plugins.playfield_statistics.PlayfieldStatistics']
+        self.machine_config_patches['mpf']['paths'] = {'playfield_statistics': False}
+        super().setUp()
+
+    def test_bcp_query(self):
+        self.hit_and_release_switch("s_test")
+        self._bcp_client.send_queue.clear()
+        self._bcp_client.receive_queue.put_nowait(('playfield_statistics', {'series': 'switch:s_test',
+                                                                             'resolution': 'hour'}))
+        self.advance_time_and_run()
+        command, kwargs = self._bcp_client.send_queue.pop()
+        self.assertEqual("playfield_statistics", command)
+        self.assertEqual(1, sum(bucket["count"] for bucket in kwargs["data"]))
+
+        # invalid input from clients is answered with an error
+        with patch.object(self.machine.bcp.transport, "send_to_client") as send:
+            self._bcp_client.receive_queue.put_nowait(('playfield_statistics', {'series': 'switch:s_test',
+                                                                                 'resolution': 'year'}))
+            self.advance_time_and_run()
+        send.assert_called_once_with(self._bcp_client, "error", cmd="playfield_statistics?resolution=year",
+                                     error="Invalid resolution value")
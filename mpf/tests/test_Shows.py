@@ -627,6 +627,59 @@ class TestShows(MpfTestCase):
         self.advance_time_and_run(2)
         self.assertEqual(1, self.machine.show_controller.running_shows[0].next_step_index)
 
+    def test_looping_show_does_not_touch_handlers(self):
+        show = self.machine.shows['flash'].play(show_tokens=dict(leds='led_01', lights='light_01'))
+        self.advance_time_and_run(.1)
+        self.assertIn("show_{}light_player".format(show.id),
+                      self.machine.show_controller.show_players["lights"]._show_keys)
+
+        handlers = {event: list(handler_list) for event, handler_list in
+                    self.machine.events.registered_handlers.items()}
+        self.machine.events.add_handler = MagicMock(wraps=self.machine.events.add_handler)
+
+        # many loops of the show
+        self.advance_time_and_run(10)
+        self.assertFalse(self.machine.events.add_handler.called)
+        self.assertEqual(handlers, self.machine.events.registered_handlers)
+
+        del self.machine.events.add_handler
+        show.stop()
+        self.advance_time_and_run(.1)
+        self.assertNotIn("show_{}light_player".format(show.id),
+                         self.machine.show_controller.show_players["lights"]._show_keys)
+
+    def test_show_scheduler(self):
+        show1 = self.machine.shows['flash'].play(show_tokens=dict(leds='led_01', lights='light_01'), sync_ms=1000)
+        show2 = self.machine.shows['flash'].play(show_tokens=dict(leds='led_02', lights='light_02'), sync_ms=1000)
+        self.assertEqual([show1, show2], self.machine.show_controller.get_running_shows('flash'))
+        self.assertEqual(2, self.machine.show_controller.get_scheduler_stats()["scheduled_shows"])
+
+        # both shows step at the same time so they run in one batch
+        self.advance_time_and_run(1)
+        stats = self.machine.show_controller.get_scheduler_stats()
+        self.assertEqual(2, stats["last_tick_steps"])
+        self.assertAlmostEqual(0.0, stats["last_tick_lateness"], delta=(1 / 30))
+        self.assertLightColor("led_01", [255, 255, 255])
+        self.assertLightColor("led_02", [255, 255, 255])
+
+        self.advance_time_and_run(1)
+        stats = self.machine.show_controller.get_scheduler_stats()
+        self.assertEqual(2, stats["last_tick_steps"])
+        self.assertLightColor("led_01", [0, 0, 0])
+        self.assertLightColor("led_02", [0, 0, 0])
+
+        show1.stop()
+        self.assertEqual([show2], self.machine.show_controller.get_running_shows('flash'))
+        self.assertEqual(1, self.machine.show_controller.get_scheduler_stats()["scheduled_shows"])
+        self.advance_time_and_run(1)
+        self.assertEqual(1, self.machine.show_controller.get_scheduler_stats()["last_tick_steps"])
+        self.assertLightColor("led_01", [0, 0, 0])
+        self.assertLightColor("led_02", [255, 255, 255])
+
+        show2.stop()
+        self.assertEqual([], self.machine.show_controller.get_running_shows('flash'))
+        self.assertEqual(0, self.machine.show_controller.get_scheduler_stats()["scheduled_shows"])
+
     def test_show_from_mode_config(self):
         self.assertIn('show_from_mode', self.machine.shows)
 
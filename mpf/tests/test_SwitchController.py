@@ -246,6 +246,37 @@ class TestSwitchController(MpfTestCase):
         self.assertEqual(1, self.called1)
         self.assertEqual(0, self.called2)
 
+    def _cb1c(self, **kwargs):
+        del kwargs
+        self.called1 = 1
+        self.machine.switch_controller.add_switch_handler("s_test", self._cb2)
+
+    def test_add_in_handler(self):
+        self.called1 = 0
+        self.called2 = 0
+        self.machine.switch_controller.add_switch_handler("s_test", self._cb1c)
+
+        self.machine.switch_controller.process_switch("s_test", 1)
+        self.advance_time_and_run()
+        self.assertEqual(1, self.called1)
+        # handlers added during dispatch only run on the next change
+        self.assertEqual(0, self.called2)
+        callbacks = [handler.callback for handler in self.machine.switches.s_test.handlers[1]]
+        self.assertIn(self._cb1c, callbacks)
+        self.assertIn(self._cb2, callbacks)
+
+        self.machine.switch_controller.process_switch("s_test", 0)
+        self.machine.switch_controller.remove_switch_handler("s_test", self._cb1c)
+        self.machine.switch_controller.process_switch("s_test", 1)
+        self.advance_time_and_run()
+        self.assertEqual(1, self.called2)
+        callbacks = [handler.callback for handler in self.machine.switches.s_test.handlers[1]]
+        self.assertNotIn(self._cb1c, callbacks)
+        self.assertIn(self._cb2, callbacks)
+
+        # removing handlers of unknown switches does nothing
+        self.machine.switch_controller.remove_switch_handler("s_unknown", self._cb2)
+
     def _cb3(self, **kwargs):
         del kwargs
         self.called3 = 1
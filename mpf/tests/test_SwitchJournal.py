@@ -0,0 +1,150 @@
+import json
+import os
+import shutil
+import tempfile
+import threading
+from unittest import TestCase
+
+import mpf.core
+from mpf.benchmarks.replay import SwitchJournalReplayer
+from mpf.commands.replay import Command
+from mpf.plugins.switch_journal import SwitchJournal, SwitchJournalWriter, read_switch_journal, get_journal_files, \
+    RECORD
+from mpf.tests.MpfTestCase import MpfTestCase
+
+
+class TestSwitchJournal(MpfTestCase):
+
+    def getConfigFile(self):
+        return 'config.yaml'
+
+    def getMachinePath(self):
+        return 'tests/machine_files/switch_journal/'
+
+    def setUp(self):
+        self.journal_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.journal_dir)
+        self.journal_file = os.path.join(self.journal_dir, "switch_journal.bin")
+        self.machine_config_patches['mpf']['plugins'] = ['mpf.plugins.switch_journal.SwitchJournal']
+        self.machine_config_patches['mpf']['paths'] = {'switch_journal': self.journal_file}
+        super().setUp()
+
+    def test_record(self):
+        journal = self.machine.plugins[0]
+        self.assertIsInstance(journal, SwitchJournal)
+
+        # the file is only written in the writing thread
+        writing_threads = set()
+        add = journal.writer.add
+
+        def _add(*args):
+            writing_threads.add(threading.current_thread())
+            add(*args)
+        journal.writer.add = _add
+
+        self.hit_switch_and_run("s_test", 1)
+        self.release_switch_and_run("s_test", 2)
+        self.hit_switch_and_run("s_test2", 1)
+        journal.wait_for_writes()
+        self.assertEqual({journal._thread}, writing_threads)
+
+        header, records = read_switch_journal(self.journal_file)
+        self.assertEqual(["s_test", "s_test2"], header["switches"])
+        self.assertEqual([0, 0], header["states"])
+        self.assertEqual([(0, 1), (0, 0), (1, 1)], [(index, state) for _, index, state in records])
+        self.assertAlmostEqual(1.0, records[1][0] - records[0][0], delta=.01)
+        self.assertAlmostEqual(2.0, records[2][0] - records[1][0], delta=.01)
+
+    def test_rotation(self):
+        for _ in range(200):
+            self.hit_and_release_switch("s_test")
+            self.advance_time_and_run(.01)
+        self.hit_switch_and_run("s_test2", 1)
+        self.machine.plugins[0].wait_for_writes()
+
+        files = get_journal_files(self.journal_file)
+        self.assertEqual([self.journal_file + ".2", self.journal_file + ".1", self.journal_file], files)
+
+        # disk usage is bounded
+        for filename in files:
+            self.assertLess(os.path.getsize(filename), 1024 + RECORD.size)
+
+        # every file starts with the states at the end of the previous file
+        states = None
+        for filename in files:
+            header, records = read_switch_journal(filename)
+            if states is not None:
+                self.assertEqual(states, header["states"])
+            states = header["states"]
+            for _, index, state in records:
+                states[index] = state
+
+        self.assertEqual([0, 1], states)
+
+
+class TestSwitchJournalReplay(TestCase):
+
+    def setUp(self):
+        self.journal_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.journal_dir)
+        self.machine_path = os.path.abspath(os.path.join(
+            mpf.core.__path__[0], os.pardir, 'tests/machine_files/switch_journal/'))
+
+    def _write_journal(self, filename, changes):
+        writer = SwitchJournalWriter(filename, ["s_test", "s_test2", "s_removed"], 1024 * 1024, 1)
+        writer.open(100.0, [0, 1, 0])
+        for clock, index, state in changes:
+            writer.add(100.0 + clock, index, state)
+        writer.close()
+
+    def test_read_torn_record(self):
+        filename = os.path.join(self.journal_dir, "journal.bin")
+        self._write_journal(filename, [(1, 0, 1), (2, 0, 0)])
+        with open(filename, "ab") as f:
+            f.write(RECORD.pack(3000000, 0, 1)[:5])
+
+        header, records = read_switch_journal(filename)
+        self.assertEqual(100.0, header["clock"])
+        self.assertEqual([(1.0, 0, 1), (2.0, 0, 0)], records)
+
+    def test_replay(self):
+        filename = os.path.join(self.journal_dir, "journal.bin")
+        self._write_journal(filename, [
+            (.5, 0, 1),
+            (1.5, 0, 0),
+            (2, 2, 1),      # switch is not in the config
+            (3, 1, 1),      # s_test2 is already active
+            (4.25, 1, 0),
+        ])
+
+        replayer = SwitchJournalReplayer(["config.yaml"])
+        report = replayer.replay(self.machine_path, [filename])
+
+        self.assertEqual(5, report["records"])
+        self.assertEqual(1, report["unknown_switches"])
+        self.assertEqual(1, report["state_divergences"])
+        self.assertEqual(4.25, report["journal_s"])
+        # records are applied exactly in time on the time travel loop
+        self.assertEqual(0, report["timing_divergences"])
+        self.assertEqual(0, report["lag_ms"]["max"])
+        self.assertGreater(report["switch_latency_ms"]["max"], 0)
+        self.assertGreater(report["speedup"], 0)
+
+    def test_replay_real_time(self):
+        filename = os.path.join(self.journal_dir, "journal.bin")
+        output = os.path.join(self.journal_dir, "report.json")
+        self._write_journal(filename, [(.5, 0, 1), (1.5, 0, 0), (4, 1, 0)])
+
+        mpf_path = os.path.abspath(os.path.join(mpf.core.__path__[0], os.pardir))
+        Command(mpf_path, self.machine_path, ["-j", filename, "--real-time", "--speed", "10", "-o", output])
+        with open(output) as f:
+            report = json.load(f)["replay"]
+
+        self.assertEqual(3, report["records"])
+        self.assertEqual(0, report["state_divergences"])
+        self.assertEqual(4, report["journal_s"])
+        # records are fed at ten times their recorded speed
+        self.assertGreaterEqual(report["wall_s"], .4)
+        self.assertLessEqual(report["speedup"], 10)
+        # the second to run the triggered handlers after the last record is not part of the replay
+        self.assertLess(report["wall_s"], 1)
@@ -112,6 +112,23 @@ class TestUtil(unittest.TestCase):
         self.assertEqual(result['key4'], 'val4')
         self.assertEqual(result['list1'], [4, 5, 6])
 
+    def test_dict_merge_nested(self):
+        dict_a = dict(section1=dict(key1='val1', list1=[1]), section2=dict(key2='val2'), section3=dict(key3='val3'))
+        dict_b = dict(section1=dict(key1='new', list1=[2]), section2=dict(_delete=True),
+                      section3=dict(_overwrite=True, key4='val4'))
+
+        result = Util.dict_merge(dict_a, dict_b)
+        self.assertEqual(dict(section1=dict(key1='new', list1=[1, 2]), section3=dict(key4='val4')), result)
+
+        # a is not modified
+        self.assertEqual(dict(section1=dict(key1='val1', list1=[1]), section2=dict(key2='val2'),
+                              section3=dict(key3='val3')), dict_a)
+
+        # sections which are not in b are not copied
+        result = Util.dict_merge(dict_a, dict(section1=dict(key1='new')))
+        self.assertIs(dict_a['section2'], result['section2'])
+        self.assertIsNot(dict_a['section1'], result['section1'])
+
     def test_hex_to_string_list(self):
         result = Util.hex_string_to_list('00ff88')
         self.assertEqual(result, [0, 255, 136])
@@ -1,8 +1,27 @@
+import os
 import unittest
 import ruamel.yaml as yaml
+
+from mpf.core.utility_functions import Util
 from mpf.file_interfaces.yaml_roundtrip import YamlRoundtrip
 
-from mpf.file_interfaces.yaml_interface import MpfLoader
+from mpf.file_interfaces import yaml_interface
+from mpf.file_interfaces.yaml_interface import MpfLoader, MpfConfigLoader, YamlInterface
+
+
+def _load(text, loader):
+    try:
+        return YamlInterface.process(text, loader=loader)
+    except Exception as e:
+        return type(e)
+
+
+def _load_legacy(text):
+    # YamlInterface.process of MPF 0.50
+    try:
+        return Util.keys_to_lower(yaml.load(text, Loader=MpfLoader))
+    except Exception as e:
+        return type(e)
 
 
 class TestYamlInterface(unittest.TestCase):
@@ -118,3 +137,53 @@ float_1: 1.0
             if not type(v) is eval(k.split('_')[0]):
                 raise AssertionError('YAML value "{}" is {}, not {}'.format(v,
                     type(v), eval(k.split('_')[0])))
+
+        for loader in self._get_loaders():
+            parsed_config = YamlInterface.process(config, loader=loader)
+            for k, v in parsed_config.items():
+                self.assertIs(type(v), eval(k.split('_')[0]), (loader, k))
+
+    @staticmethod
+    def _get_loaders():
+        loaders = [MpfConfigLoader]
+        if yaml_interface.CParser:
+            loaders.append(yaml_interface.MpfConfigCLoader)
+        return loaders
+
+    def test_keys_to_lower(self):
+        config = """
+Section:
+    Key: Value
+    1: one
+    Nested:
+        KEY: 2
+    List:
+    - Item: 3
+"""
+        expected = {"section": {"key": "Value", "1": "one", "nested": {"key": 2}, "list": [{"Item": 3}]}}
+        for loader in self._get_loaders():
+            self.assertEqual(expected, YamlInterface.process(config, loader=loader))
+            self.assertEqual([{"step": {"led1": "ff"}}, {}],
+                             YamlInterface.process("- Step:\n    LED1: ff\n- \n", loader=loader))
+            self.assertEqual({}, YamlInterface.process("", loader=loader))
+
+        # the plain loader does not change keys
+        self.assertEqual({"Section": {"Key": "Value", 1: "one"}}, yaml.load("Section:\n    Key: Value\n    1: one\n",
+                                                                          Loader=MpfLoader))
+
+    def test_loader_conformance(self):
+        # all loaders have to return the same as MPF 0.50 for every machine config and show
+        machine_files = os.path.join(os.path.dirname(os.path.abspath(__file__)), "machine_files")
+        files = 0
+        for path, _, filenames in os.walk(machine_files):
+            for filename in filenames:
+                if not filename.endswith((".yaml", ".yml")):
+                    continue
+                with open(os.path.join(path, filename), encoding='utf8') as f:
+                    text = f.read()
+                files += 1
+                expected = _load_legacy(text)
+                for loader in self._get_loaders():
+                    self.assertEqual(expected, _load(text, loader), (filename, loader))
+
+        self.assertGreater(files, 100)